@@ -1,7 +1,12 @@
 import argparse
+import csv
+import datetime
 import errno
+import functools
+import hashlib
 import json
 import logging
+import multiprocessing.util
 import os
 import pathlib
 import random
@@ -13,7 +18,7 @@
 import time
 import traceback
 from multiprocessing import Pool
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union, cast
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple, Union, cast
 
 import docker
 import yaml
@@ -22,6 +27,7 @@
 from docker.errors import APIError, DockerException, ImageNotFound
 from typing_extensions import TypedDict
 
+from .tabulate_cmd import default_timer
 from .version import __version__
 
 # Figure out where everything is
@@ -45,6 +51,9 @@
 DEFAULT_ENV_FILE_YAML = "ENV.yaml"
 DEFAULT_CONFIG_YAML = "config.yaml"
 
+# Where pre-built virtual environments are kept, in the results folder, when reusing environments natively
+VENVS_DIR_NAME = ".agbench_venvs"
+
 # Get a random number generator for subsampling
 subsample_rng = random.Random(425)
 
@@ -66,6 +75,7 @@ def run_scenarios(
     results_dir: str = "Results",
     subsample: Union[None, int, float] = None,
     env_file: Union[None, str] = None,
+    reuse_environments: bool = False,
 ) -> None:
     """
     Run a set agbench scenarios a given number of times.
@@ -76,6 +86,8 @@ def run_scenarios(
         n_repeats (int):    The number of times each scenario instance will be repeated
         is_native (bool):   True if the scenario should be run locally rather than in Docker (proceed with caution!)
         results_dir (path): The folder were results will be saved.
+        reuse_environments (bool): Run in a warm container (or, natively, a pre-built virtual environment) shared
+                            by all instances, instead of a fresh one per instance (see WarmContainer).
     """
 
     files: List[str] = []
@@ -165,12 +177,17 @@ def run_scenarios(
 
                 # Run the scenario
                 if is_native:
-                    run_scenario_natively(results_repetition, env)
+                    run_scenario_natively(
+                        results_repetition,
+                        env,
+                        venvs_dir=os.path.join(results_dir, VENVS_DIR_NAME) if reuse_environments else None,
+                    )
                 else:
                     run_scenario_in_docker(
                         results_repetition,
                         env,
                         docker_image=docker_image,
+                        warm_container=get_warm_container(results_dir, docker_image) if reuse_environments else None,
                     )
 
         # Close regular files
@@ -376,12 +393,122 @@ def replace_in_list(lst: List[Any]) -> None:
         replace_in_list(cast(List[Any], json_data))  # type: ignore
 
 
-def run_scenario_natively(work_dir: str, env: Dict[str, str], timeout: int = TASK_TIMEOUT) -> None:
+def get_requirements_hash(work_dir: str) -> str:
+    """
+    Return a hash of the requirements.txt of an expanded scenario, used to decide if an environment can be reused.
+
+    Requirements that are local paths (such as a checkout of the autogen packages) are installed as a copy, so
+    the hash also covers the last modification time of their sources: editing them results in a new environment.
+    """
+    digest = hashlib.sha256(sys.executable.encode("utf-8"))
+    requirements = os.path.join(work_dir, "requirements.txt")
+    if os.path.isfile(requirements):
+        with open(requirements, "rb") as fh:
+            content = fh.read()
+        digest.update(content)
+        for path in get_local_requirement_paths(work_dir, content.decode("utf-8", errors="replace")):
+            digest.update(f"\n{path}:{get_source_mtime(path)}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def get_local_requirement_paths(work_dir: str, requirements: str) -> List[str]:
+    """
+    Return the absolute paths of the requirements that are local files or folders, relative paths being
+    resolved against work_dir as pip does when run from there.
+    """
+    paths: List[str] = []
+    for line in requirements.splitlines():
+        line = line.split(" #")[0].strip()
+        if line.startswith(("-e ", "--editable ")):
+            line = line.split(None, 1)[1].strip()
+        elif line.startswith(("#", "-")):
+            continue
+        if "file://" in line:
+            line = line.split("file://", 1)[1]
+        # Drop the extras, e.g. path/to/package[extra]
+        line = re.sub(r"\[[^\]]*\]$", "", line)
+        if not line:
+            continue
+        path = os.path.join(work_dir, os.path.expanduser(line))
+        if os.path.exists(path):
+            paths.append(os.path.abspath(path))
+    return paths
+
+
+@functools.lru_cache(maxsize=None)
+def get_source_mtime(path: str) -> int:
+    """
+    Return the last modification time, in nanoseconds, of a file or of the files in a folder, skipping hidden
+    folders, caches and build metadata.
+
+    Walking a large folder (such as a whole autogen checkout) is slow, so the result is computed once per path
+    and reused for every scenario instance of the run.
+    """
+    if os.path.isfile(path):
+        return os.stat(path).st_mtime_ns
+    latest = 0
+    for root, dirs, files in os.walk(path):
+        dirs[:] = [d for d in dirs if not d.startswith(".") and d != "__pycache__" and not d.endswith(".egg-info")]
+        for name in files:
+            try:
+                latest = max(latest, os.stat(os.path.join(root, name)).st_mtime_ns)
+            except OSError:
+                pass
+    return latest
+
+
+def prepare_native_venv(work_dir: str, venvs_dir: str) -> str:
+    """
+    Return a virtual environment with the requirements of the scenario in work_dir installed, building it if needed.
+
+    Environments are shared by all scenario instances with identical requirements (see get_requirements_hash), and
+    built only once, even when several agbench processes ask for the same environment at the same time. Changes
+    to the sources of local requirements result in a new environment.
+    """
+    import fcntl  # Native runs are not supported on Windows
+
+    venv_dir = os.path.abspath(os.path.join(venvs_dir, get_requirements_hash(work_dir)))
+    ready_marker = os.path.join(venv_dir, ".agbench_ready")
+    mkdir_p(venvs_dir)
+
+    with open(venv_dir + ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if not os.path.isfile(ready_marker):
+            # Leftovers of an interrupted build
+            if os.path.isdir(venv_dir):
+                shutil.rmtree(venv_dir)
+            print(f"Building virtual environment {venv_dir}")
+            subprocess.run([sys.executable, "-m", "venv", venv_dir], check=True)
+            requirements = os.path.join(work_dir, "requirements.txt")
+            if os.path.isfile(requirements):
+                subprocess.run(
+                    [
+                        os.path.join(venv_dir, "bin", "python"),
+                        "-m",
+                        "pip",
+                        "install",
+                        "-r",
+                        os.path.abspath(requirements),
+                    ],
+                    # Resolve relative requirement paths as the scenario's own pip install would
+                    cwd=work_dir,
+                    check=True,
+                )
+            with open(ready_marker, "wt") as fh:
+                fh.write(f"agbench version: {__version__}\n")
+    return venv_dir
+
+
+def run_scenario_natively(
+    work_dir: str, env: Dict[str, str], timeout: int = TASK_TIMEOUT, venvs_dir: Optional[str] = None
+) -> None:
     """
     Run a scenario in the native environment.
 
     Args:
         work_dir (path): the path to the working directory previously created to house this sceario instance
+        venvs_dir (Optional, path): if set, run in a pre-built virtual environment kept in this folder (see
+            prepare_native_venv), instead of creating one and installing the requirements for this run only
     """
 
     # Get the current working directory
@@ -391,6 +518,26 @@ def run_scenario_natively(work_dir: str, env: Dict[str, str], timeout: int = TAS
     full_env = os.environ.copy()
     full_env.update(env)
 
+    # Build (or find) the shared virtual environment before moving into the scenario
+    venv_dir = None if venvs_dir is None else prepare_native_venv(work_dir, venvs_dir)
+
+    if venv_dir is None:
+        venv_setup = f"""# Create and activate the virtual environment
+# This is called in a subprocess, and will not impact the parent
+{sys.executable} -m venv .agbench_venv
+. .agbench_venv/bin/activate"""
+        install_requirements = "pip install -r requirements.txt"
+        venv_cleanup = """# We don't need to deactivate the venv because it's
+# contained in the subprocess; but we should clean it up
+if [ -d .agbench_venv ] ; then
+    rm -Rf .agbench_venv
+fi"""
+    else:
+        venv_setup = f"""# Activate the pre-built virtual environment
+. {venv_dir}/bin/activate"""
+        install_requirements = "echo Requirements already installed in the pre-built virtual environment."
+        venv_cleanup = "# The pre-built virtual environment is kept for the next runs"
+
     # Navigate to the scenario
     os.chdir(work_dir)
     print("\n\n" + os.getcwd() + "\n===================================================================")
@@ -403,10 +550,7 @@ def run_scenario_natively(work_dir: str, env: Dict[str, str], timeout: int = TAS
 export AUTOGEN_TESTBED_SETTING="Native"
 echo "agbench version: {__version__}" > timestamp.txt
 
-# Create and activate the virtual environment
-# This is called in a subprocess, and will not impact the parent
-{sys.executable} -m venv .agbench_venv
-. .agbench_venv/bin/activate
+{venv_setup}
 
 # Run the global init script if it exists
 if [ -f global_init.sh ] ; then
@@ -419,7 +563,7 @@ def run_scenario_natively(work_dir: str, env: Dict[str, str], timeout: int = TAS
 fi
 
 # Run the scenario
-pip install -r requirements.txt
+{install_requirements}
 echo SCENARIO.PY STARTING !#!#
 start_time=$(date +%s)
 timeout --preserve-status --kill-after {timeout  + 30}s {timeout}s python scenario.py
@@ -452,11 +596,7 @@ def run_scenario_natively(work_dir: str, env: Dict[str, str], timeout: int = TAS
     . ./global_finalize.sh
 fi
 
-# We don't need to deactivate the venv because it's
-# contained in the subprocess; but we should clean it up
-if [ -d .agbench_venv ] ; then
-    rm -Rf .agbench_venv
-fi
+{venv_cleanup}
 
 echo RUN.SH COMPLETE !#!#
 """
@@ -479,18 +619,12 @@ def run_scenario_natively(work_dir: str, env: Dict[str, str], timeout: int = TAS
     return
 
 
-def run_scenario_in_docker(
-    work_dir: str, env: Dict[str, str], timeout: int = TASK_TIMEOUT, docker_image: Optional[str] = None
-) -> None:
+def get_docker_image(client: docker.DockerClient, docker_image: Optional[str] = None) -> Any:
     """
-    Run a scenario in a Docker environment.
+    Get the Docker image to run scenarios in, pulling or building it if needed.
 
-    Args:
-        work_dir (path): the path to the working directory previously created to house this sceario instance
-        timeout (Optional, int): the number of seconds to allow a Docker container to run before timing out
+    If docker_image is None, the image tagged DEFAULT_DOCKER_IMAGE_TAG is used, and built if missing.
     """
-
-    client = docker.from_env()
     image = None
 
     # If the docker_image is None, then we will fetch DEFAULT_DOCKER_IMAGE_TAG, if present,
@@ -519,7 +653,24 @@ def run_scenario_in_docker(
             except DockerException:
                 print(f"Failed to pull image '{docker_image}'")
 
-    # Prepare the run script
+    return image
+
+
+def write_docker_run_script(work_dir: str, timeout: int = TASK_TIMEOUT, install_requirements: bool = True) -> None:
+    """
+    Write the run.sh script that runs a scenario inside a Docker container.
+
+    Args:
+        work_dir (path): the path to the working directory previously created to house this sceario instance
+        timeout (Optional, int): the number of seconds to allow the scenario to run
+        install_requirements (Optional, bool): False if the requirements are already installed in the container
+    """
+    pip_install = (
+        "pip install -r requirements.txt"
+        if install_requirements
+        else "echo Requirements already installed in the container."
+    )
+
     with open(os.path.join(work_dir, "run.sh"), "wt", newline="\n") as f:
         f.write(
             f"""#
@@ -540,7 +691,7 @@ def run_scenario_in_docker(
 fi
 
 # Run the scenario
-pip install -r requirements.txt
+{pip_install}
 echo SCENARIO.PY STARTING !#!#
 start_time=$(date +%s)
 timeout --preserve-status --kill-after {timeout  + 30}s {timeout}s python scenario.py
@@ -577,8 +728,18 @@ def run_scenario_in_docker(
 """
         )
 
-    # Figure out what folders to mount
-    volumes = {str(pathlib.Path(work_dir).absolute()): {"bind": "/workspace", "mode": "rw"}}
+
+def get_docker_volumes(
+    workspace_dir: str, workspace_bind: str = "/workspace"
+) -> Tuple[Dict[str, Dict[str, str]], bool]:
+    """
+    Return the volumes to mount in a scenario container, and whether the Docker socket is among them.
+
+    Args:
+        workspace_dir (path): the folder to mount as the workspace
+        workspace_bind (Optional, str): where to mount the workspace in the container
+    """
+    volumes = {str(pathlib.Path(workspace_dir).absolute()): {"bind": workspace_bind, "mode": "rw"}}
 
     # Add the autogen repo if we can find it
     autogen_repo_base = os.environ.get("AUTOGEN_REPO_BASE")
@@ -600,6 +761,7 @@ def run_scenario_in_docker(
     # This maintains good isolation for experiment purposes (e.g., ensuring consistent initial conditions),
     # but deminishes the security benefits of using Docker (e.g., when facing a deliberately malicious agent).
     # since it would allow clients to mount privalaged images, volumes, etc.
+    mounts_docker_socket = False
     docker_host = os.environ.get("DOCKER_HOST", "unix:///var/run/docker.sock")
     if docker_host.startswith("unix://"):
         docker_socket = os.path.abspath(docker_host[7:])
@@ -607,21 +769,109 @@ def run_scenario_in_docker(
             st_mode = os.stat(docker_socket).st_mode
             if stat.S_ISSOCK(st_mode):
                 volumes[docker_socket] = {"bind": "/var/run/docker.sock", "mode": "rw"}
-
-                # Update the environment variables so that the inner docker client can
-                # mount the workspace
-                env = {k: v for k, v in env.items()}
-                env["HOST_WORKSPACE"] = str(pathlib.Path(work_dir).absolute())
+                mounts_docker_socket = True
 
     print("Mounting:")
     for k in volumes.keys():
         bind = volumes[k]["bind"]
         mode = volumes[k]["mode"].upper()
-        if bind == "/workspace":
+        if bind == workspace_bind:
             k = os.path.relpath(k)
         print(f"[{mode}]\t'{k}' => '{bind}'")
     print("===================================================================")
 
+    return volumes, mounts_docker_socket
+
+
+def stream_container_logs(
+    logs: Iterator[bytes], work_dir: str, timeout: int, stop: Callable[[], None]
+) -> Tuple[bool, bool]:
+    """
+    Write the logs of a running scenario to console_log.txt and the console, stopping it if it runs too long.
+
+    Returns: whether the scenario timed out, and whether the user interrupted it (Ctrl-C)
+    """
+    # Keep an eye on the time to make sure we don't need to stop.
+    docker_timeout: float = timeout + 60  # One full minute after the bash timeout command should have already triggered
+    start_time = time.time()
+    stopping = False
+    exiting = False
+
+    with open(os.path.join(work_dir, "console_log.txt"), "wt", encoding="utf-8") as log_file:
+        while True:
+            try:
+                chunk = next(logs)  # Manually step the iterator so it is captures with the try-catch
+
+                # Stream the data to the log file and the console
+                chunk_str = chunk.decode("utf-8")
+                log_file.write(chunk_str)
+                log_file.flush()
+                sys.stdout.reconfigure(encoding="utf-8")  # type: ignore
+                sys.stdout.write(chunk_str)
+                sys.stdout.flush()
+
+                # Check if we need to terminate
+                if not stopping and time.time() - start_time >= docker_timeout:
+                    stop()
+
+                    # Don't exit the loop right away, as there are things we may still want to read from the logs
+                    # but remember how we got here.
+                    stopping = True
+            except KeyboardInterrupt:
+                log_file.write("\nKeyboard interrupt (Ctrl-C). Attempting to exit gracefully.\n")
+                log_file.flush()
+                sys.stdout.write("\nKeyboard interrupt (Ctrl-C). Attempting to exit gracefully.\n")
+                sys.stdout.flush()
+
+                # Start the exit process, and give it a minute, but keep iterating
+                stop()
+                exiting = True
+                docker_timeout = time.time() - start_time + 60
+            except StopIteration:
+                break
+
+        if stopping:  # By this line we've exited the loop, and the container has actually stopped.
+            log_file.write("\nDocker timed out.\n")
+            log_file.flush()
+            sys.stdout.write("\nDocker timed out.\n")
+            sys.stdout.flush()
+
+    return stopping, exiting
+
+
+def run_scenario_in_docker(
+    work_dir: str,
+    env: Dict[str, str],
+    timeout: int = TASK_TIMEOUT,
+    docker_image: Optional[str] = None,
+    warm_container: Optional["WarmContainer"] = None,
+) -> None:
+    """
+    Run a scenario in a Docker environment.
+
+    Args:
+        work_dir (path): the path to the working directory previously created to house this sceario instance
+        timeout (Optional, int): the number of seconds to allow a Docker container to run before timing out
+        warm_container (Optional, WarmContainer): run in this long-lived container instead of a fresh one
+    """
+    if warm_container is not None:
+        warm_container.run(work_dir, env, timeout=timeout)
+        return
+
+    client = docker.from_env()
+    image = get_docker_image(client, docker_image)
+
+    # Prepare the run script
+    write_docker_run_script(work_dir, timeout=timeout)
+
+    # Figure out what folders to mount
+    volumes, mounts_docker_socket = get_docker_volumes(work_dir)
+    if mounts_docker_socket:
+        # Update the environment variables so that the inner docker client can
+        # mount the workspace
+        env = {k: v for k, v in env.items()}
+        env["HOST_WORKSPACE"] = str(pathlib.Path(work_dir).absolute())
+
     assert image is not None
     # Create and run the container
     container = client.containers.run(
@@ -637,45 +887,8 @@ def run_scenario_in_docker(
         network="host",  # Use the host network to avoid issues with localhost.
     )
 
-    # Read the logs in a streaming fashion. Keep an eye on the time to make sure we don't need to stop.
-    docker_timeout: float = timeout + 60  # One full minute after the bash timeout command should have already triggered
-    start_time = time.time()
-    logs = container.logs(stream=True)
-    log_file = open(os.path.join(work_dir, "console_log.txt"), "wt", encoding="utf-8")
-    stopping = False
-    exiting = False
-
-    while True:
-        try:
-            chunk = next(logs)  # Manually step the iterator so it is captures with the try-catch
-
-            # Stream the data to the log file and the console
-            chunk_str = chunk.decode("utf-8")
-            log_file.write(chunk_str)
-            log_file.flush()
-            sys.stdout.reconfigure(encoding="utf-8")  # type: ignore
-            sys.stdout.write(chunk_str)
-            sys.stdout.flush()
-
-            # Check if we need to terminate
-            if not stopping and time.time() - start_time >= docker_timeout:
-                container.stop()
-
-                # Don't exit the loop right away, as there are things we may still want to read from the logs
-                # but remember how we got here.
-                stopping = True
-        except KeyboardInterrupt:
-            log_file.write("\nKeyboard interrupt (Ctrl-C). Attempting to exit gracefully.\n")
-            log_file.flush()
-            sys.stdout.write("\nKeyboard interrupt (Ctrl-C). Attempting to exit gracefully.\n")
-            sys.stdout.flush()
-
-            # Start the exit process, and give it a minute, but keep iterating
-            container.stop()
-            exiting = True
-            docker_timeout = time.time() - start_time + 60
-        except StopIteration:
-            break
+    # Read the logs in a streaming fashion.
+    _, exiting = stream_container_logs(container.logs(stream=True), work_dir, timeout, stop=container.stop)
 
     # Clean up the container
     try:
@@ -683,16 +896,139 @@ def run_scenario_in_docker(
     except APIError:
         pass
 
-    if stopping:  # By this line we've exited the loop, and the container has actually stopped.
-        log_file.write("\nDocker timed out.\n")
-        log_file.flush()
-        sys.stdout.write("\nDocker timed out.\n")
-        sys.stdout.flush()
-
     if exiting:  # User hit ctrl-C
         sys.exit(1)
 
 
+# The warm container of this process, see get_warm_container
+_warm_container: Optional["WarmContainer"] = None
+
+
+def get_warm_container(results_dir: str, docker_image: Optional[str] = None) -> "WarmContainer":
+    """
+    Return the warm container of this process, which is stopped when the process exits.
+
+    Each worker of a parallel run gets its own, so the workers form a pool of warm containers.
+    """
+    global _warm_container
+    if _warm_container is None:
+        _warm_container = WarmContainer(results_dir, docker_image)
+        # Pool workers exit without running atexit handlers, but they do run multiprocessing finalizers.
+        multiprocessing.util.Finalize(_warm_container, _warm_container.close, exitpriority=10)
+    return _warm_container
+
+
+class WarmContainer:
+    """
+    A long-lived Docker container that runs scenario instances one after another.
+
+    Starting a container and installing the scenario requirements for every instance dominates the
+    runtime of benchmarks with many short instances. A warm container is started once, with the whole
+    results folder mounted at /agbench_results, and each instance is run with `docker exec` in its own
+    results folder, linked at /workspace. The requirements are installed by the first instance that
+    needs them, later instances with an identical requirements.txt skip the installation.
+
+    Earlier instances can influence later ones (e.g., packages installed by the agents), so this trades
+    some isolation for speed. The container is replaced if an instance times out.
+
+    Args:
+        results_dir (path): the folder containing the results folders of all instances that will be run
+        docker_image (Optional, str): the Docker image to use (default: DEFAULT_DOCKER_IMAGE_TAG)
+    """
+
+    RESULTS_BIND = "/agbench_results"
+
+    def __init__(self, results_dir: str, docker_image: Optional[str] = None) -> None:
+        self._results_dir = os.path.abspath(results_dir)
+        self._docker_image = docker_image
+        self._client: Optional[docker.DockerClient] = None
+        self._container: Any = None
+        self._mounts_docker_socket = False
+        self._installed_requirements: Set[str] = set()
+
+    def _get_container(self) -> Any:
+        if self._container is not None:
+            return self._container
+
+        if self._client is None:
+            self._client = docker.from_env()
+        image = get_docker_image(self._client, self._docker_image)
+        assert image is not None
+
+        volumes, self._mounts_docker_socket = get_docker_volumes(self._results_dir, self.RESULTS_BIND)
+        self._container = self._client.containers.run(
+            image,
+            command=["sleep", "infinity"],
+            detach=True,
+            auto_remove=True,
+            labels={"agbench": "warm"},
+            # Type hint of docker is wrong here
+            volumes=volumes,  # type: ignore
+            network="host",  # Use the host network to avoid issues with localhost.
+        )
+        self._installed_requirements = set()
+        return self._container
+
+    def run(self, work_dir: str, env: Dict[str, str], timeout: int = TASK_TIMEOUT) -> None:
+        """
+        Run the scenario instance expanded in work_dir, which must be inside the results folder.
+        """
+        work_dir_path = pathlib.Path(work_dir).absolute()
+        try:
+            relative_path = work_dir_path.relative_to(self._results_dir)
+        except ValueError as e:
+            raise ValueError(f"'{work_dir}' is not in the results folder '{self._results_dir}'") from e
+
+        requirements_hash = get_requirements_hash(work_dir)
+        install_requirements = requirements_hash not in self._installed_requirements
+        write_docker_run_script(work_dir, timeout=timeout, install_requirements=install_requirements)
+
+        container = self._get_container()
+        assert self._client is not None
+        api = self._client.api
+
+        env = {k: v for k, v in env.items()}
+        if self._mounts_docker_socket:
+            # So that the inner docker client can mount the workspace
+            env["HOST_WORKSPACE"] = str(work_dir_path)
+
+        workspace = f"{self.RESULTS_BIND}/{relative_path.as_posix()}"
+        exec_id = api.exec_create(
+            container.id,
+            ["sh", "-c", f'rm -rf /workspace && ln -s "{workspace}" /workspace && cd /workspace && sh run.sh'],
+            environment=env,
+        )["Id"]
+        print(f"Running {work_dir} in warm container {container.short_id}")
+
+        # The exec can not be stopped on its own, stopping means discarding the container.
+        _, exiting = stream_container_logs(api.exec_start(exec_id, stream=True), work_dir, timeout, stop=self.close)
+
+        if self._container is not None:
+            if api.exec_inspect(exec_id).get("ExitCode") == 0:
+                self._installed_requirements.add(requirements_hash)
+            # Leave nothing behind for the next instance
+            container.exec_run(["sh", "-c", "rm -rf /workspace /tmp/* 2>/dev/null; true"])
+
+        if exiting:  # User hit ctrl-C
+            self.close()
+            sys.exit(1)
+
+    def close(self) -> None:
+        """
+        Stop the container. A new one is started if the warm container is used again.
+        """
+        container, self._container = self._container, None
+        if container is not None:
+            try:
+                container.stop(timeout=5)
+            except APIError:
+                pass
+            try:
+                container.remove(force=True)
+            except APIError:
+                pass
+
+
 def build_default_docker_image(docker_client: docker.DockerClient, image_tag: str) -> None:
     for segment in docker_client.api.build(
         path=RESOURCES_PATH,
@@ -733,18 +1069,6 @@ def find_autogen_repo(path: str) -> Optional[str]:
     return None
 
 
-def split_jsonl(file_path: str, num_parts: int) -> List[List[Dict[str, Any]]]:
-    """
-    Split a JSONL file into num_parts approximately equal parts.
-    """
-    with open(file_path, "r") as f:
-        data = [json.loads(line) for line in f]
-
-    random.shuffle(data)  # Shuffle the data for better distribution
-    chunk_size = len(data) // num_parts
-    return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
-
-
 def mkdir_p(path: str) -> None:
     """
     Create a directory if it doesn't exist, handling race conditions.
@@ -756,92 +1080,217 @@ def mkdir_p(path: str) -> None:
             raise
 
 
-def run_scenarios_subset(
-    scenario_name: str,
-    scenarios: List[Dict[str, Any]],
+class WorkUnit(TypedDict):
+    task_id: str
+    scenario_dir: str
+    instance: ScenarioInstance
+    results_repetition: str
+    expected_duration: Optional[float]
+
+
+def is_run_complete(results_repetition: str) -> bool:
+    """
+    Return True if the run in results_repetition got to the end of its run.sh script.
+    """
+    console_log = os.path.join(results_repetition, "console_log.txt")
+    if not os.path.isfile(console_log):
+        return False
+    with open(console_log, "rb") as fh:
+        # The marker is the last line written, so reading the tail is enough.
+        fh.seek(0, os.SEEK_END)
+        fh.seek(max(0, fh.tell() - 4096))
+        return b"RUN.SH COMPLETE !#!#" in fh.read()
+
+
+def load_task_durations(results_scenario: str, durations_file: Optional[str] = None) -> Dict[str, float]:
+    """
+    Return the average runtime, in seconds, of each task id in a previous run.
+
+    Args:
+        results_scenario (path): The results folder of the scenario. Runtimes of the runs already in it are used.
+        durations_file (Optional, path): The CSV output of a previous `agbench tabulate --csv`, used in addition.
+    """
+    times: Dict[str, List[float]] = {}
+
+    if durations_file is not None:
+        with open(durations_file, "rt", newline="") as fh:
+            for row in csv.DictReader(fh):
+                task_id = row.get("Task Id")
+                if not task_id:
+                    continue
+                for column, value in row.items():
+                    if column is None or not re.fullmatch(r"Trial \d+ Time", column) or not value:
+                        continue
+                    try:
+                        times.setdefault(task_id, []).append(float(value))
+                    except ValueError:
+                        pass
+
+    if os.path.isdir(results_scenario):
+        for task_id in os.listdir(results_scenario):
+            task_path = os.path.join(results_scenario, task_id)
+            if not os.path.isdir(task_path):
+                continue
+            for repetition in os.listdir(task_path):
+                if not repetition.isdigit():
+                    continue
+                duration = default_timer(os.path.join(task_path, repetition))
+                if duration is not None:
+                    times.setdefault(task_id, []).append(duration)
+
+    return {task_id: sum(values) / len(values) for task_id, values in times.items() if values}
+
+
+def get_work_units(
+    scenario_file: str,
     n_repeats: int,
-    is_native: bool,
-    config_file: Union[None, str],
-    docker_image: Optional[str] = None,
     results_dir: str = "Results",
-    subsample: Union[None, int, float] = None,
-    env_file: Union[None, str] = None,
-) -> None:
+    durations_file: Optional[str] = None,
+    rerun_incomplete: bool = False,
+) -> List[WorkUnit]:
     """
-    Run a subset of agbench scenarios a given number of times.
+    List the (scenario instance, repetition) pairs of a scenario file that still need to run, longest first.
+
+    Repetitions with an existing results folder are skipped. If rerun_incomplete is True, folders of
+    runs that did not complete (e.g., because agbench was interrupted) are removed and run again.
+    Tasks are ordered by their historical runtime (see load_task_durations), so the slowest tasks
+    start first and do not end up as stragglers. Tasks without history get the average runtime.
     """
-    for instance in scenarios:
-        # Create a folder to store the results
-        # Results base
+    scenario_name_parts = os.path.basename(scenario_file).split(".")
+    scenario_name_parts.pop()
+    scenario_name = ".".join(scenario_name_parts)
+    scenario_dir = os.path.dirname(os.path.realpath(scenario_file))
+    results_scenario = os.path.join(results_dir, scenario_name)
 
-        mkdir_p(results_dir)
+    durations = load_task_durations(results_scenario, durations_file)
+    default_duration = sum(durations.values()) / len(durations) if durations else None
 
-        # Results for the scenario
+    units: List[WorkUnit] = []
+    with open(scenario_file, "rt") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            instance = json.loads(line)
+            for i in range(0, n_repeats):
+                results_repetition = os.path.join(results_scenario, instance["id"], str(i))
+                if os.path.isdir(results_repetition):
+                    if rerun_incomplete and not is_run_complete(results_repetition):
+                        print(f"Found incomplete folder {results_repetition} ... Removing.")
+                        shutil.rmtree(results_repetition)
+                    else:
+                        continue
+                units.append(
+                    {
+                        "task_id": instance["id"],
+                        "scenario_dir": scenario_dir,
+                        "instance": instance,
+                        "results_repetition": results_repetition,
+                        "expected_duration": durations.get(instance["id"], default_duration),
+                    }
+                )
+
+    # Longest first. The sort is stable, so the file order is kept when there is no history.
+    units.sort(key=lambda unit: unit["expected_duration"] or 0.0, reverse=True)
+    return units
 
-        results_scenario = os.path.join(results_dir, scenario_name)
-        mkdir_p(results_scenario)
 
-        # Results for the instance
-        results_instance = os.path.join(results_scenario, instance["id"])
-        mkdir_p(results_instance)
+def run_work_unit(
+    unit: WorkUnit,
+    is_native: bool,
+    config_file: Union[None, str],
+    docker_image: Optional[str] = None,
+    env_file: Union[None, str] = None,
+    results_dir: str = "Results",
+    reuse_environments: bool = False,
+) -> Tuple[str, float, Optional[str]]:
+    """
+    Run one scenario repetition. Returns the results folder, the elapsed time, and an error message if it failed.
+    """
+    start_time = time.time()
+    results_repetition = unit["results_repetition"]
+    try:
+        mkdir_p(os.path.dirname(results_repetition))
+        print(f"Running scenario {results_repetition}")
 
-        # Results for the repeats
-        for i in range(0, n_repeats):
-            results_repetition = os.path.join(results_instance, str(i))
+        # Expand the scenario
+        expand_scenario(unit["scenario_dir"], unit["instance"], results_repetition, config_file)
 
-            # Skip it if it already exists
-            if os.path.isdir(results_repetition):
-                print(f"Found folder {results_repetition} ... Skipping.")
-                continue
-            print(f"Running scenario {results_repetition}")
+        # Prepare the environment (keys/values that need to be added)
+        env = get_scenario_env(env_file=env_file)
 
-            # Expand the scenario
-            expand_scenario(".", instance, results_repetition, config_file)  # type: ignore
+        # Run the scenario
+        if is_native:
+            run_scenario_natively(
+                results_repetition,
+                env,
+                venvs_dir=os.path.join(results_dir, VENVS_DIR_NAME) if reuse_environments else None,
+            )
+        else:
+            run_scenario_in_docker(
+                results_repetition,
+                env,
+                docker_image=docker_image,
+                warm_container=get_warm_container(results_dir, docker_image) if reuse_environments else None,
+            )
+    except Exception as e:
+        return results_repetition, time.time() - start_time, f"{type(e).__name__}: {e}"
+    return results_repetition, time.time() - start_time, None
 
-            # Prepare the environment (keys/values that need to be added)
-            env = get_scenario_env(env_file=env_file)
 
-            # Run the scenario
-            if is_native:
-                run_scenario_natively(results_repetition, env)
-            else:
-                run_scenario_in_docker(
-                    results_repetition,
-                    env,
-                    docker_image=docker_image,
-                )
+def _format_duration(seconds: float) -> str:
+    return str(datetime.timedelta(seconds=int(seconds)))
 
 
 def run_parallel(args: argparse.Namespace) -> None:
     """
     Run scenarios in parallel.
+
+    Workers pull (scenario instance, repetition) pairs from a shared queue one at a time, so a worker that
+    finishes early picks up more work instead of idling while others work through a larger share.
     """
-    # Read and split the JSONL file
-    scenarios = split_jsonl(args.scenario, args.parallel)
-    scenario_name_parts = os.path.basename(args.scenario).split(".")
-    scenario_name_parts.pop()
-    scenario_name = ".".join(scenario_name_parts)
+    units = get_work_units(
+        args.scenario,
+        args.repeat,
+        durations_file=args.durations,
+        rerun_incomplete=args.rerun_incomplete,
+    )
+    total = len(units)
+    if total == 0:
+        print("Nothing to run, all scenario repetitions already have results.")
+        return
+
+    sys.stderr.write(f"Running {total} scenario repetitions with {args.parallel} workers.\n")
+    worker = functools.partial(
+        run_work_unit,
+        is_native=args.native,
+        config_file=args.config,
+        docker_image=args.docker_image,
+        env_file=args.env,
+        reuse_environments=args.reuse_environments,
+    )
 
-    # Create a pool of worker processes
+    start_time = time.time()
+    done = 0
+    failed = 0
+    # chunksize=1 hands out one unit at a time, in the (longest first) order of the list.
     with Pool(processes=args.parallel) as pool:
-        # Prepare arguments for each worker
-        worker_args = [
-            (
-                scenario_name,
-                scenario_subset,
-                args.repeat,
-                args.native,
-                args.config,
-                args.docker_image,
-                "Results",
-                args.subsample,
-                args.env,
+        for results_repetition, elapsed, error in pool.imap_unordered(worker, units, chunksize=1):
+            done += 1
+            if error is not None:
+                failed += 1
+                sys.stderr.write(f"Scenario {results_repetition} failed: {error}\n")
+
+            wall_time = time.time() - start_time
+            eta = wall_time / done * (total - done)
+            sys.stderr.write(
+                f"[{done}/{total}] {failed} failed | elapsed {_format_duration(wall_time)} | "
+                f"ETA {_format_duration(eta)} | {results_repetition} took {_format_duration(elapsed)}\n"
             )
-            for scenario_subset in scenarios
-        ]
+            sys.stderr.flush()
 
-        # Run scenarios in parallel
-        pool.starmap(run_scenarios_subset, worker_args)
+        # Let the workers exit normally (rather than terminating them), so they stop their warm containers.
+        pool.close()
+        pool.join()
 
 
 def get_azure_token_provider() -> Optional[Callable[[], str]]:
@@ -932,6 +1381,22 @@ def run_cli(args: Sequence[str]) -> None:
         + "', which will be created if not present)",
         default=None,
     )
+    parser.add_argument(
+        "--durations",
+        type=str,
+        help="With --parallel, the CSV output of a previous 'agbench tabulate --csv', used to start the slowest tasks first. Runtimes of results already in the results folder are always used. (default: None)",
+        default=None,
+    )
+    parser.add_argument(
+        "--rerun-incomplete",
+        action="store_true",
+        help="With --parallel, remove and run again the results folders of runs that did not complete (e.g., because a previous run was interrupted).",
+    )
+    parser.add_argument(
+        "--reuse-environments",
+        action="store_true",
+        help="Run all scenario instances in long-lived Docker containers (one per parallel worker), or with --native in pre-built virtual environments, installing the requirements once instead of once per instance. Much faster for many short instances, but earlier runs can influence later runs.",
+    )
     parser.add_argument(
         "--native",
         action="store_true",
@@ -1008,4 +1473,5 @@ def run_cli(args: Sequence[str]) -> None:
             docker_image=parsed_args.docker_image,
             subsample=subsample,
             env_file=parsed_args.env,
+            reuse_environments=parsed_args.reuse_environments,
         )
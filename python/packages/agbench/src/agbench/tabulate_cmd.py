@@ -1,8 +1,12 @@
 import argparse
+import hashlib
+import json
 import os
 import re
 import sys
-from typing import Any, Callable, Dict, List, Optional, Sequence
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import pandas as pd
 import tabulate as tb
@@ -28,6 +32,12 @@
 
 TIMER_REGEX = r"RUNTIME:\s*([\d.]+) !#!#"
 
+# The scores and times of instances, cached in the runlogs folder between runs of tabulate
+INDEX_FILE = ".agbench_tabulate_index.json"
+
+# The markers scorers and timers look for are printed at the end of the logs, so only this much is read first
+LOG_TAIL_BYTES = 64 * 1024
+
 
 def find_tabulate_module(search_dir: str, stop_dir: Optional[str] = None) -> Optional[str]:
     """Hunt for the tabulate script."""
@@ -65,117 +75,212 @@ def find_tabulate_module(search_dir: str, stop_dir: Optional[str] = None) -> Opt
     return None
 
 
+def read_log_tail(path: str, n_bytes: int = LOG_TAIL_BYTES) -> Tuple[str, bool]:
+    """Return the last n_bytes of a log file, and whether that is the whole file."""
+    with open(path, "rb") as fh:
+        fh.seek(0, os.SEEK_END)
+        size = fh.tell()
+        fh.seek(max(0, size - n_bytes))
+        data = fh.read()
+    return data.decode("utf-8", errors="replace"), size <= n_bytes
+
+
 def default_scorer(instance_dir: str, success_strings: List[str] = SUCCESS_STRINGS) -> Optional[bool]:
     console_log = os.path.join(instance_dir, "console_log.txt")
-    if os.path.isfile(console_log):
-        with open(console_log, "rt") as fh:
-            content = fh.read()
+    if not os.path.isfile(console_log):
+        return None
 
-            # It succeeded
-            for s in success_strings:
-                if s in content:
+    # Usually the tail of the log is enough to decide
+    tail, is_whole_log = read_log_tail(console_log)
+    if any(s in tail for s in success_strings):
+        return True
+    completed = any(s in tail for s in COMPLETED_STRINGS)
+
+    if not is_whole_log:
+        # Otherwise scan the rest of the log, one line at a time
+        with open(console_log, "rt", encoding="utf-8", errors="replace") as fh:
+            for line in fh:
+                # It succeeded
+                if any(s in line for s in success_strings):
                     return True
+                if not completed and any(s in line for s in COMPLETED_STRINGS):
+                    completed = True
 
-            # It completed without succeeding
-            for s in COMPLETED_STRINGS:
-                if s in content:
-                    return False
+    # It completed without succeeding
+    if completed:
+        return False
 
-            # Has not, or did not, complete
-            return None
-    else:
-        return None
+    # Has not, or did not, complete
+    return None
 
 
 def default_timer(instance_dir: str, timer_regex: str = TIMER_REGEX) -> Optional[float]:
     console_log = os.path.join(instance_dir, "console_log.txt")
-    if os.path.isfile(console_log):
-        with open(console_log, "rt") as fh:
-            content = fh.read()
-
-            # It succeeded
-            m = re.search(timer_regex, content)
-            if m:
-                return float(m.group(1))
-            else:
-                return None
-    else:
+    if not os.path.isfile(console_log):
         return None
 
+    # Usually the tail of the log is enough to decide
+    tail, is_whole_log = read_log_tail(console_log)
+    m = re.search(timer_regex, tail)
+    if m:
+        return float(m.group(1))
+
+    if not is_whole_log:
+        # Otherwise scan the rest of the log, one line at a time
+        pattern = re.compile(timer_regex)
+        with open(console_log, "rt", encoding="utf-8", errors="replace") as fh:
+            for line in fh:
+                m = pattern.search(line)
+                if m:
+                    return float(m.group(1))
+
+    return None
+
 
 ScorerFunc = Callable[[str], Optional[bool]]
 TimerFunc = Callable[[str], Optional[float]]
 
 
-def default_tabulate(
-    args: List[str],
+def _function_key(func: Callable[..., Any]) -> str:
+    """Identify a scorer or timer, including when its source file last changed."""
+    key = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', repr(func))}"
+    code = getattr(func, "__code__", None)
+    if code is not None and os.path.isfile(code.co_filename):
+        key += f"@{os.path.getmtime(code.co_filename)}"
+    return key
+
+
+class ResultsIndex:
+    """
+    Scores and times of instances already tabulated, saved in the runlogs folder.
+
+    An entry is reused as long as the instance's console_log.txt has the same size and modification time,
+    so only new, or still running, instances are scored again. Custom scorers and timers may read other
+    files (e.g., expected_answer.txt), so with those every file of the instance is checked instead. The
+    whole index is discarded when the scorer or timer changes.
+    """
+
+    def __init__(self, runlogs: str, scorer: ScorerFunc, timer: TimerFunc) -> None:
+        self._runlogs = runlogs
+        self.path = os.path.join(runlogs, INDEX_FILE)
+        self._key = f"{_function_key(scorer)}|{_function_key(timer)}"
+        self._stamp_all_files = scorer is not default_scorer or timer is not default_timer
+        self._entries: Dict[str, List[Any]] = {}
+        self._dirty = False
+
+        if os.path.isfile(self.path):
+            try:
+                with open(self.path, "rt") as fh:
+                    contents = json.load(fh)
+                if contents.get("key") == self._key:
+                    self._entries = contents.get("instances", {})
+            except (OSError, ValueError):
+                # A corrupt or unreadable index is rebuilt
+                self._entries = {}
+
+    def _stamp(self, instance_dir: str) -> Optional[List[Any]]:
+        try:
+            st = os.stat(os.path.join(instance_dir, "console_log.txt"))
+        except OSError:
+            return None
+        if not self._stamp_all_files:
+            return [st.st_mtime_ns, st.st_size]
+
+        # The path, size and modification time of every file in the instance
+        digest = hashlib.sha256()
+        for root, dirs, files in os.walk(instance_dir):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                digest.update(f"{os.path.relpath(path, instance_dir)}\0{st.st_mtime_ns}\0{st.st_size}\n".encode())
+        return [digest.hexdigest()]
+
+    def evaluate(
+        self, instance_dir: str, scorer: ScorerFunc, timer: TimerFunc
+    ) -> Tuple[Optional[bool], Optional[float]]:
+        """Return the score and time of an instance, from the index if its log did not change."""
+        stamp = self._stamp(instance_dir)
+        key = os.path.relpath(instance_dir, self._runlogs)
+        entry = self._entries.get(key)
+        if stamp is not None and entry is not None and entry[0] == stamp:
+            return entry[1], entry[2]
+
+        success, duration = scorer(instance_dir), timer(instance_dir)
+        if stamp is not None:
+            self._entries[key] = [stamp, success, duration]
+            self._dirty = True
+        return success, duration
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "wt") as fh:
+                json.dump({"key": self._key, "instances": self._entries}, fh)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            sys.stderr.write(f"Could not save the results index '{self.path}': {e}\n")
+
+
+def collect_results(
+    runlogs: str,
     scorer: ScorerFunc = default_scorer,
     timer: TimerFunc = default_timer,
     exclude_dir_names: List[str] = EXCLUDE_DIR_NAMES,
-) -> None:
-    invocation_cmd = args[0]
-    args = args[1:]
-
-    warning = f"CAUTION: '{invocation_cmd}' is in early preview and is not thoroughly tested.\nPlease do not cite values from these calculations in academic work without first inspecting and verifying the results in the run logs yourself."
-
-    # Prepare the argument parser
-    parser = argparse.ArgumentParser(
-        prog=invocation_cmd,
-        description=f"{invocation_cmd} will tabulate the results of a previous run.",
-    )
-
-    parser.add_argument(
-        "runlogs",
-        help="The path where the run's logs are stored.",
-    )
-    parser.add_argument(
-        "-c",
-        "--csv",
-        action="store_true",
-        help="Output the results in CSV format.",
-    )
-
-    parser.add_argument(
-        "-e", "--excel", help="Output the results in Excel format. Please specify a path for the Excel file.", type=str
-    )
-
-    parsed_args = parser.parse_args(args)
-    runlogs: str = parsed_args.runlogs
-
-    all_results: List[Dict[str, Any]] = list()
-    max_instances = 0
-
-    for task_id in sorted(
-        os.listdir(runlogs),
-        key=lambda s: os.path.getmtime(os.path.join(runlogs, s)),
-    ):
-        if task_id in exclude_dir_names:
-            continue
-
-        task_path = os.path.join(runlogs, task_id)
-
-        if not os.path.isdir(task_path):
-            continue
-
-        # Collect the results vector
-        results: Dict[str, Any] = {"Task Id": task_id}
-
-        # Collect the results for each instance.
-        instance_dirs = sorted(
-            os.listdir(task_path),
-            key=lambda s: os.path.getmtime(os.path.join(task_path, s)),
-        )
-        instances = [int(d) for d in instance_dirs if d.isdigit()]
-
-        for instance in instances:
-            instance_dir = os.path.join(task_path, str(instance))
-            results[f"Trial {instance} Success"] = scorer(instance_dir)
-            results[f"Trial {instance} Time"] = timer(instance_dir)
-
-        max_instances = max(instances)
-
-        # Buffer the results
-        all_results.append(results)
+    index: Optional[ResultsIndex] = None,
+    jobs: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Score and time every instance in runlogs, in parallel.
+
+    Returns: one row of results per task, and the number of instances (trials) per task.
+    """
+    tasks: List[Tuple[str, List[int]]] = []
+    with os.scandir(runlogs) as entries:
+        task_entries = [e for e in entries if e.name not in exclude_dir_names and e.is_dir()]
+    for task_entry in sorted(task_entries, key=lambda e: e.stat().st_mtime):
+        with os.scandir(task_entry.path) as entries:
+            instance_entries = sorted(
+                (e for e in entries if e.name.isdigit()),
+                key=lambda e: e.stat().st_mtime,
+            )
+        tasks.append((task_entry.name, [int(e.name) for e in instance_entries]))
+
+    def evaluate(instance_dir: str) -> Tuple[Optional[bool], Optional[float]]:
+        if index is not None:
+            return index.evaluate(instance_dir, scorer, timer)
+        return scorer(instance_dir), timer(instance_dir)
+
+    instance_dirs = [os.path.join(runlogs, task_id, str(i)) for task_id, instances in tasks for i in instances]
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        evaluations = iter(executor.map(evaluate, instance_dirs))
+
+        all_results: List[Dict[str, Any]] = list()
+        max_instances = 0
+        for task_id, instances in tasks:
+            # Collect the results vector
+            results: Dict[str, Any] = {"Task Id": task_id}
+
+            # Collect the results for each instance.
+            for instance in instances:
+                success, duration = next(evaluations)
+                results[f"Trial {instance} Success"] = success
+                results[f"Trial {instance} Time"] = duration
+
+            if instances:
+                max_instances = max(max_instances, max(instances))
+
+            # Buffer the results
+            all_results.append(results)
+
+    if index is not None:
+        index.save()
 
     num_instances = max_instances + 1
 
@@ -187,10 +292,15 @@ def default_tabulate(
             if f"Trial {i} Time" not in result:
                 result[f"Trial {i} Time"] = None
 
+    return all_results, num_instances
+
+
+def print_results(all_results: List[Dict[str, Any]], num_instances: int, csv: bool, warning: str) -> None:
+    """Print the results of every task, followed by summary statistics (unless printing CSV)."""
     # Create dataframe from results.
     df = pd.DataFrame(all_results)
 
-    if parsed_args.csv:
+    if csv:
         # Print out the dataframe in CSV format
         print(df.to_csv(index=False))
         # Print out alpha-version warning
@@ -275,6 +385,87 @@ def _list(series: Any) -> List[Any]:
         sys.stderr.write("\n" + warning + "\n\n")
 
 
+def default_tabulate(
+    args: List[str],
+    scorer: ScorerFunc = default_scorer,
+    timer: TimerFunc = default_timer,
+    exclude_dir_names: List[str] = EXCLUDE_DIR_NAMES,
+) -> None:
+    invocation_cmd = args[0]
+    args = args[1:]
+
+    warning = f"CAUTION: '{invocation_cmd}' is in early preview and is not thoroughly tested.\nPlease do not cite values from these calculations in academic work without first inspecting and verifying the results in the run logs yourself."
+
+    # Prepare the argument parser
+    parser = argparse.ArgumentParser(
+        prog=invocation_cmd,
+        description=f"{invocation_cmd} will tabulate the results of a previous run.",
+    )
+
+    parser.add_argument(
+        "runlogs",
+        help="The path where the run's logs are stored.",
+    )
+    parser.add_argument(
+        "-c",
+        "--csv",
+        action="store_true",
+        help="Output the results in CSV format.",
+    )
+
+    parser.add_argument(
+        "-e", "--excel", help="Output the results in Excel format. Please specify a path for the Excel file.", type=str
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="The number of instances to score in parallel (default: a few more than the number of CPUs).",
+        default=None,
+    )
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help=f"Score every instance again, ignoring the results index ('{INDEX_FILE}' in the runlogs folder).",
+    )
+    parser.add_argument(
+        "-w",
+        "--watch",
+        type=float,
+        nargs="?",
+        const=30.0,
+        default=None,
+        metavar="SECONDS",
+        help="Keep running, refreshing the tables every SECONDS (default: 30) while a run is in progress. Only new or changed instances are scored again.",
+    )
+
+    parsed_args = parser.parse_args(args)
+    runlogs: str = parsed_args.runlogs
+
+    index = None if parsed_args.no_index else ResultsIndex(runlogs, scorer, timer)
+
+    while True:
+        all_results, num_instances = collect_results(
+            runlogs, scorer=scorer, timer=timer, exclude_dir_names=exclude_dir_names, index=index, jobs=parsed_args.jobs
+        )
+
+        if parsed_args.watch is not None and sys.stdout.isatty():
+            # Clear the screen, so the tables refresh in place
+            sys.stdout.write("\033[2J\033[H")
+        print_results(all_results, num_instances, csv=parsed_args.csv, warning=warning)
+
+        if parsed_args.watch is None:
+            break
+        print(
+            f"\nLast updated {time.strftime('%H:%M:%S')}. Refreshing every {parsed_args.watch:g}s, press Ctrl-C to stop."
+        )
+        sys.stdout.flush()
+        try:
+            time.sleep(parsed_args.watch)
+        except KeyboardInterrupt:
+            break
+
+
 def tabulate_cli(args: Sequence[str]) -> None:
     invocation_cmd = args[0]
     args = args[1:]
@@ -286,7 +477,8 @@ def tabulate_cli(args: Sequence[str]) -> None:
     for arg in reversed(args):
         if module_path is not None:
             break
-        if arg.startswith("-"):
+        # Skip options, and option values such as the --watch interval
+        if arg.startswith("-") or not os.path.isdir(arg):
             continue
         module_path = find_tabulate_module(arg)
 
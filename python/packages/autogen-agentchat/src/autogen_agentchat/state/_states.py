@@ -69,6 +69,8 @@ class MagenticOneOrchestratorState(BaseGroupChatManagerState):
     plan: str = Field(default="")
     n_rounds: int = Field(default=0)
     n_stalls: int = Field(default=0)
+    summary: str = Field(default="")
+    n_summarized: int = Field(default=0)
     type: str = Field(default="MagenticOneOrchestratorState")
 
 
@@ -29,6 +29,7 @@ class MagenticOneGroupChatConfig(BaseModel):
     max_stalls: int
     final_answer_prompt: str
     emit_team_events: bool = False
+    compaction_window: int | None = None
 
 
 class MagenticOneGroupChat(BaseGroupChat, Component[MagenticOneGroupChatConfig]):
@@ -51,6 +52,10 @@ class MagenticOneGroupChat(BaseGroupChat, Component[MagenticOneGroupChatConfig])
             If you are using custom message types or your agents produces custom message types, you need to specify them here.
             Make sure your custom message types are subclasses of :class:`~autogen_agentchat.messages.BaseAgentEvent` or :class:`~autogen_agentchat.messages.BaseChatMessage`.
         emit_team_events (bool, optional): Whether to emit team events through :meth:`BaseGroupChat.run_stream`. Defaults to False.
+        compaction_window (int, optional): Enables the compacting orchestrator mode. When set, the orchestrator sends the task ledger,
+            a rolling summary of older messages and only the most recent messages to the model, instead of the whole transcript.
+            Older messages are summarized once this many new messages have accumulated beyond the window,
+            so the prompt prefix stays stable and can be cached by the model provider. Defaults to None, which sends the whole transcript.
 
     Raises:
         ValueError: In orchestration logic if progress ledger does not have required keys or if next speaker is not valid.
@@ -110,6 +115,7 @@ def __init__(
         final_answer_prompt: str = ORCHESTRATOR_FINAL_ANSWER_PROMPT,
         custom_message_types: List[type[BaseAgentEvent | BaseChatMessage]] | None = None,
         emit_team_events: bool = False,
+        compaction_window: int | None = None,
     ):
         super().__init__(
             participants,
@@ -128,6 +134,9 @@ def __init__(
         self._model_client = model_client
         self._max_stalls = max_stalls
         self._final_answer_prompt = final_answer_prompt
+        if compaction_window is not None and compaction_window < 1:
+            raise ValueError("compaction_window must be at least 1.")
+        self._compaction_window = compaction_window
 
     def _create_group_chat_manager_factory(
         self,
@@ -157,6 +166,7 @@ def _create_group_chat_manager_factory(
             output_message_queue,
             termination_condition,
             self._emit_team_events,
+            self._compaction_window,
         )
 
     def _to_config(self) -> MagenticOneGroupChatConfig:
@@ -170,6 +180,7 @@ def _to_config(self) -> MagenticOneGroupChatConfig:
             max_stalls=self._max_stalls,
             final_answer_prompt=self._final_answer_prompt,
             emit_team_events=self._emit_team_events,
+            compaction_window=self._compaction_window,
         )
 
     @classmethod
@@ -187,4 +198,5 @@ def _from_config(cls, config: MagenticOneGroupChatConfig) -> Self:
             max_stalls=config.max_stalls,
             final_answer_prompt=config.final_answer_prompt,
             emit_team_events=config.emit_team_events,
+            compaction_window=config.compaction_window,
         )
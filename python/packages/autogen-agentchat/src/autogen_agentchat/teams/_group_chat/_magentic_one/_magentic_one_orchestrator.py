@@ -2,6 +2,7 @@
 import json
 import logging
 import re
+import time
 from typing import Any, Dict, List, Mapping, Sequence
 
 from autogen_core import AgentId, CancellationToken, DefaultTopicId, MessageContext, event, rpc
@@ -42,6 +43,8 @@
 from ._prompts import (
     ORCHESTRATOR_FINAL_ANSWER_PROMPT,
     ORCHESTRATOR_PROGRESS_LEDGER_PROMPT,
+    ORCHESTRATOR_PROGRESS_SUMMARY_CONTEXT,
+    ORCHESTRATOR_PROGRESS_SUMMARY_PROMPT,
     ORCHESTRATOR_TASK_LEDGER_FACTS_PROMPT,
     ORCHESTRATOR_TASK_LEDGER_FACTS_UPDATE_PROMPT,
     ORCHESTRATOR_TASK_LEDGER_FULL_PROMPT,
@@ -53,7 +56,13 @@
 
 
 class MagenticOneOrchestrator(BaseGroupChatManager):
-    """The MagenticOneOrchestrator manages a group chat with ledger based orchestration."""
+    """The MagenticOneOrchestrator manages a group chat with ledger based orchestration.
+
+    When ``compaction_window`` is set, the orchestrator does not send the whole message thread
+    to the model on every step. The task ledger stays at the start of the context as a stable
+    prefix, older messages are folded into a rolling summary, and only the messages since the
+    last summary are sent verbatim.
+    """
 
     def __init__(
         self,
@@ -71,7 +80,10 @@ def __init__(
         output_message_queue: asyncio.Queue[BaseAgentEvent | BaseChatMessage | GroupChatTermination],
         termination_condition: TerminationCondition | None,
         emit_team_events: bool,
+        compaction_window: int | None = None,
     ):
+        if compaction_window is not None and compaction_window < 1:
+            raise ValueError("compaction_window must be at least 1.")
         super().__init__(
             name,
             group_topic_type,
@@ -94,6 +106,10 @@ def __init__(
         self._plan = ""
         self._n_rounds = 0
         self._n_stalls = 0
+        self._compaction_window = compaction_window
+        # Rolling summary of the first `_n_summarized` messages of the thread after the task ledger.
+        self._summary = ""
+        self._n_summarized = 0
 
         # Produce a team description. Each agent sould appear on a single line.
         self._team_description = ""
@@ -119,6 +135,9 @@ def _get_task_ledger_facts_update_prompt(self, task: str, facts: str) -> str:
     def _get_task_ledger_plan_update_prompt(self, team: str) -> str:
         return ORCHESTRATOR_TASK_LEDGER_PLAN_UPDATE_PROMPT.format(team=team)
 
+    def _get_progress_summary_prompt(self, task: str, summary: str) -> str:
+        return ORCHESTRATOR_PROGRESS_SUMMARY_PROMPT.format(task=task, summary=summary or "(nothing yet)")
+
     def _get_final_answer_prompt(self, task: str) -> str:
         if self._final_answer_prompt == ORCHESTRATOR_FINAL_ANSWER_PROMPT:
             return ORCHESTRATOR_FINAL_ANSWER_PROMPT.format(task=task)
@@ -224,6 +243,8 @@ async def save_state(self) -> Mapping[str, Any]:
             plan=self._plan,
             n_rounds=self._n_rounds,
             n_stalls=self._n_stalls,
+            summary=self._summary,
+            n_summarized=self._n_summarized,
         )
         return state.model_dump()
 
@@ -236,6 +257,8 @@ async def load_state(self, state: Mapping[str, Any]) -> None:
         self._plan = orchestrator_state.plan
         self._n_rounds = orchestrator_state.n_rounds
         self._n_stalls = orchestrator_state.n_stalls
+        self._summary = orchestrator_state.summary
+        self._n_summarized = orchestrator_state.n_summarized
 
     async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage]) -> List[str] | str:
         """Not used in this orchestrator, we select next speaker in _orchestrate_step."""
@@ -251,6 +274,8 @@ async def reset(self) -> None:
         self._task = ""
         self._facts = ""
         self._plan = ""
+        self._summary = ""
+        self._n_summarized = 0
 
     async def _reenter_outer_loop(self, cancellation_token: CancellationToken) -> None:
         """Re-enter Outer loop of the orchestrator after creating task ledger."""
@@ -263,6 +288,8 @@ async def _reenter_outer_loop(self, cancellation_token: CancellationToken) -> No
             )
         # Reset partially the group chat manager
         self._message_thread.clear()
+        self._summary = ""
+        self._n_summarized = 0
 
         # Prepare the ledger
         ledger_message = TextMessage(
@@ -299,7 +326,7 @@ async def _orchestrate_step(self, cancellation_token: CancellationToken) -> None
         self._n_rounds += 1
 
         # Update the progress ledger
-        context = self._thread_to_context()
+        context = await self._get_context(cancellation_token)
 
         progress_ledger_prompt = self._get_progress_ledger_prompt(
             self._task, self._team_description, self._participant_names
@@ -309,7 +336,13 @@ async def _orchestrate_step(self, cancellation_token: CancellationToken) -> None
         assert self._max_json_retries > 0
         key_error: bool = False
         for _ in range(self._max_json_retries):
+            start_time = time.perf_counter()
             response = await self._model_client.create(self._get_compatible_context(context), json_output=True)
+            await self._log_message(
+                f"Progress ledger step {self._n_rounds}: {len(context)} messages, "
+                f"prompt_tokens={response.usage.prompt_tokens}, completion_tokens={response.usage.completion_tokens}, "
+                f"latency={time.perf_counter() - start_time:.3f}s"
+            )
             ledger_str = response.content
             try:
                 assert isinstance(ledger_str, str)
@@ -427,7 +460,8 @@ async def _orchestrate_step(self, cancellation_token: CancellationToken) -> None
 
     async def _update_task_ledger(self, cancellation_token: CancellationToken) -> None:
         """Update the task ledger (outer loop) with the latest facts and plan."""
-        context = self._thread_to_context()
+        # The outer loop is re-entered right after, which drops the summary, so do not summarize now.
+        context = await self._get_context(cancellation_token, compact=False)
 
         # Update the facts
         update_facts_prompt = self._get_task_ledger_facts_update_prompt(self._task, self._facts)
@@ -454,7 +488,7 @@ async def _update_task_ledger(self, cancellation_token: CancellationToken) -> No
 
     async def _prepare_final_answer(self, reason: str, cancellation_token: CancellationToken) -> None:
         """Prepare the final answer for the task."""
-        context = self._thread_to_context()
+        context = await self._get_context(cancellation_token)
 
         # Get the final answer
         final_answer_prompt = self._get_final_answer_prompt(self._task)
@@ -488,10 +522,59 @@ async def _prepare_final_answer(self, reason: str, cancellation_token: Cancellat
         # Signal termination
         await self._signal_termination(StopMessage(content=reason, source=self._name))
 
-    def _thread_to_context(self) -> List[LLMMessage]:
-        """Convert the message thread to a context for the model."""
+    async def _get_context(self, cancellation_token: CancellationToken, compact: bool = True) -> List[LLMMessage]:
+        """Get the context for the next model call, compacting the message thread if enabled.
+        With `compact=False`, the current summary is used as is and later messages are sent verbatim."""
+        if self._compaction_window is None or len(self._message_thread) == 0:
+            return self._thread_to_context()
+
+        # The first message is the task ledger, it only changes when re-entering the outer loop
+        # and is kept first so that providers can cache the prompt prefix.
+        prefix = self._message_thread[:1]
+        pending = self._message_thread[1 + self._n_summarized :]
+        # Summarize in whole windows so that the summary, and therefore the prefix of the prompt, stays
+        # unchanged for `compaction_window` steps at a time.
+        if compact and len(pending) >= 2 * self._compaction_window:
+            segment = pending[: len(pending) - self._compaction_window]
+            await self._update_summary(segment, cancellation_token)
+            pending = pending[len(segment) :]
+
+        context = self._thread_to_context(prefix)
+        if self._summary:
+            context.append(
+                UserMessage(
+                    content=ORCHESTRATOR_PROGRESS_SUMMARY_CONTEXT.format(summary=self._summary), source=self._name
+                )
+            )
+        context.extend(self._thread_to_context(pending))
+        return context
+
+    async def _update_summary(
+        self, segment: Sequence[BaseAgentEvent | BaseChatMessage], cancellation_token: CancellationToken
+    ) -> None:
+        """Fold a segment of the message thread into the rolling summary."""
+        context = self._thread_to_context(segment)
+        context.append(
+            UserMessage(content=self._get_progress_summary_prompt(self._task, self._summary), source=self._name)
+        )
+        start_time = time.perf_counter()
+        response = await self._model_client.create(
+            self._get_compatible_context(context), cancellation_token=cancellation_token
+        )
+        assert isinstance(response.content, str)
+        self._summary = response.content
+        self._n_summarized += len(segment)
+        await self._log_message(
+            f"Summarized {len(segment)} messages: prompt_tokens={response.usage.prompt_tokens}, "
+            f"completion_tokens={response.usage.completion_tokens}, latency={time.perf_counter() - start_time:.3f}s"
+        )
+
+    def _thread_to_context(
+        self, messages: Sequence[BaseAgentEvent | BaseChatMessage] | None = None
+    ) -> List[LLMMessage]:
+        """Convert the message thread, or the given messages, to a context for the model."""
         context: List[LLMMessage] = []
-        for m in self._message_thread:
+        for m in self._message_thread if messages is None else messages:
             if isinstance(m, ToolCallRequestEvent | ToolCallExecutionEvent):
                 # Ignore tool call messages.
                 continue
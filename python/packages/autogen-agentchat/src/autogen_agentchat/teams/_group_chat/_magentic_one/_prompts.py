@@ -127,3 +127,21 @@
 Based on the information gathered, provide the final answer to the original request.
 The answer should be phrased as if you were speaking to the user.
 """
+
+
+ORCHESTRATOR_PROGRESS_SUMMARY_PROMPT = """We are working to address the following user request:
+
+{task}
+
+Here is the summary of the work done so far, before the messages above:
+
+{summary}
+
+Please rewrite the summary so that it also covers the messages above. Keep every fact, result, file name, URL, error and decision that may matter for the rest of the task, note which team member did what, and drop the rest. Be concise, and output only the new summary.
+"""
+
+
+ORCHESTRATOR_PROGRESS_SUMMARY_CONTEXT = """Here is a summary of the earlier part of the conversation:
+
+{summary}
+"""
@@ -1,10 +1,11 @@
 import asyncio
 import logging
 import re
+from dataclasses import dataclass, field
 from inspect import iscoroutinefunction
-from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Union, cast
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union, cast
 
-from autogen_core import AgentRuntime, CancellationToken, Component, ComponentModel
+from autogen_core import AgentRuntime, CancellationToken, Component, ComponentModel, MessageContext, event, rpc
 from autogen_core.model_context import (
     ChatCompletionContext,
     UnboundedChatCompletionContext,
@@ -31,11 +32,18 @@
     MessageFactory,
     ModelClientStreamingChunkEvent,
     SelectorEvent,
+    TextMessage,
 )
 from ...state import SelectorManagerState
 from ._base_group_chat import BaseGroupChat
 from ._base_group_chat_manager import BaseGroupChatManager
-from ._events import GroupChatTermination
+from ._events import (
+    GroupChatMessage,
+    GroupChatPause,
+    GroupChatResume,
+    GroupChatTermination,
+    SerializableException,
+)
 
 trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
 
@@ -48,6 +56,24 @@
 CandidateFuncType = Union[SyncCandidateFunc | AsyncCandidateFunc]
 
 
+@dataclass
+class _RenderedMessage:
+    message: LLMMessage
+    text: str
+    num_tokens: int | None = None
+
+
+@dataclass(eq=False)
+class _Speculation:
+    """A speaker selection started from the partial output of the current speaker."""
+
+    task: "asyncio.Task[str]" = field(init=False)
+    # The rendered history, the candidates and the previous speaker the selection is based on, set once known.
+    key: Tuple[str, Tuple[str, ...], str | None] | None = None
+    # The team events emitted by the selection, held back until the selection is used.
+    events: List[BaseAgentEvent | BaseChatMessage] = field(default_factory=list)
+
+
 class SelectorGroupChatManager(BaseGroupChatManager):
     """A group chat manager that selects the next speaker using a ChatCompletion
     model and a custom selector function."""
@@ -73,6 +99,9 @@ def __init__(
         emit_team_events: bool,
         model_context: ChatCompletionContext | None,
         model_client_streaming: bool = False,
+        max_selector_history_messages: int | None = None,
+        max_selector_history_tokens: int | None = None,
+        speculative_selection_delay: float | None = None,
     ) -> None:
         super().__init__(
             name,
@@ -97,11 +126,28 @@ def __init__(
         self._candidate_func = candidate_func
         self._is_candidate_func_async = iscoroutinefunction(self._candidate_func)
         self._model_client_streaming = model_client_streaming
+        self._max_selector_history_messages = max_selector_history_messages
+        self._max_selector_history_tokens = max_selector_history_tokens
         if model_context is not None:
             self._model_context = model_context
         else:
             self._model_context = UnboundedChatCompletionContext()
         self._cancellation_token = CancellationToken()
+        # The participants do not change, so the roles section of the prompt is built once.
+        self._roles = self._construct_roles()
+        # The messages rendered by construct_message_history in its last call, kept to only render new messages.
+        self._rendered_context: List[LLMMessage] = []
+        self._rendered_messages: List[_RenderedMessage] = []
+        self._rendered_history = ""
+        # Speculative selection state: the streamed output of the current speaker, and the selection started from it.
+        self._speculative_selection_delay = speculative_selection_delay
+        self._streamed_source: str | None = None
+        self._streamed_chunks: List[str] = []
+        self._speculation_timer: asyncio.TimerHandle | None = None
+        self._speculation: _Speculation | None = None
+        self._paused = False
+        self._num_speculations = 0
+        self._num_speculation_hits = 0
 
     async def validate_group_state(self, messages: List[BaseChatMessage] | None) -> None:
         pass
@@ -113,6 +159,10 @@ async def reset(self) -> None:
         if self._termination_condition is not None:
             await self._termination_condition.reset()
         self._previous_speaker = None
+        self._rendered_context = []
+        self._rendered_messages = []
+        self._rendered_history = ""
+        self._discard_speculation()
 
     async def save_state(self) -> Mapping[str, Any]:
         state = SelectorManagerState(
@@ -150,6 +200,32 @@ async def update_message_thread(self, messages: Sequence[BaseAgentEvent | BaseCh
         base_chat_messages = [m for m in messages if isinstance(m, BaseChatMessage)]
         await self._add_messages_to_context(self._model_context, base_chat_messages)
 
+    async def _apply_termination_condition(
+        self, delta: Sequence[BaseAgentEvent | BaseChatMessage], increment_turn_count: bool = False
+    ) -> bool:
+        terminated = await super()._apply_termination_condition(delta, increment_turn_count)
+        if terminated:
+            # No speaker is selected, so a speculative selection is not needed.
+            self._discard_speculation()
+        return terminated
+
+    async def _signal_termination_with_error(self, error: SerializableException) -> None:
+        # Stop any speculative selection, so that no selector call outlives the run.
+        self._discard_speculation()
+        await super()._signal_termination_with_error(error)
+
+    @rpc
+    async def handle_pause(self, message: GroupChatPause, ctx: MessageContext) -> None:  # type: ignore
+        """Pause the group chat manager, discarding any speculative selection until it is resumed."""
+        self._paused = True
+        self._discard_speculation()
+
+    @rpc
+    async def handle_resume(self, message: GroupChatResume, ctx: MessageContext) -> None:  # type: ignore
+        """Resume the group chat manager."""
+        self._paused = False
+        self._discard_speculation()
+
     async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage]) -> List[str] | str:
         """Selects the next speaker in a group chat using a ChatCompletion client,
         with the selector function as override if it returns a speaker name.
@@ -177,6 +253,26 @@ async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage
                 # Skip the model based selection.
                 return [speaker]
 
+        # A speculative selection, if any, is used by _select_speaker if it was made from the same prompt.
+        speculation = self._take_speculation()
+        try:
+            participants = await self._get_candidates(thread)
+
+            # Select the next speaker.
+            if len(participants) > 1:
+                agent_name = await self._select_speaker(
+                    self._roles, participants, self._max_selector_attempts, speculation
+                )
+            else:
+                agent_name = participants[0]
+        finally:
+            if speculation is not None:
+                speculation.task.cancel()
+        self._previous_speaker = agent_name
+        trace_logger.debug(f"Selected speaker: {agent_name}")
+        return [agent_name]
+
+    async def _get_candidates(self, thread: Sequence[BaseAgentEvent | BaseChatMessage]) -> List[str]:
         # Use the candidate function to filter participants if provided
         if self._candidate_func is not None:
             if self._is_candidate_func_async:
@@ -200,40 +296,115 @@ async def select_speaker(self, thread: Sequence[BaseAgentEvent | BaseChatMessage
                 participants = list(self._participant_names)
 
         assert len(participants) > 0
+        return participants
 
+    def _construct_roles(self) -> str:
         # Construct agent roles.
         # Each agent sould appear on a single line.
         roles = ""
         for topic_type, description in zip(self._participant_names, self._participant_descriptions, strict=True):
             roles += re.sub(r"\s+", " ", f"{topic_type}: {description}").strip() + "\n"
-        roles = roles.strip()
+        return roles.strip()
+
+    def construct_message_history(self, message_history: List[LLMMessage]) -> str:
+        """Construct the history of the conversation for the selector prompt, limited to the most recent
+        messages by `max_selector_history_messages` and `max_selector_history_tokens`.
+
+        Messages are rendered once: when `message_history` extends the history of the previous call,
+        only the new messages are rendered, and the rendered text of messages seen before is reused otherwise.
+        """
+        self._render_messages(message_history)
+        return self._limit_history(self._rendered_messages, self._rendered_history)
 
-        # Select the next speaker.
-        if len(participants) > 1:
-            agent_name = await self._select_speaker(roles, participants, self._max_selector_attempts)
+    def _render_messages(self, message_history: List[LLMMessage]) -> None:
+        # Updates the rendered messages and history to match message_history.
+        is_extension = len(message_history) >= len(self._rendered_context) and all(
+            a is b for a, b in zip(self._rendered_context, message_history, strict=False)
+        )
+        if is_extension:
+            new_messages = message_history[len(self._rendered_context) :]
+            previous: Dict[int, _RenderedMessage] = {}
         else:
-            agent_name = participants[0]
-        self._previous_speaker = agent_name
-        trace_logger.debug(f"Selected speaker: {agent_name}")
-        return [agent_name]
+            # Messages were dropped or replaced, e.g., by a buffered model context.
+            new_messages = message_history
+            previous = {id(rendered.message): rendered for rendered in self._rendered_messages}
+            self._rendered_messages = []
+            self._rendered_history = ""
 
-    def construct_message_history(self, message_history: List[LLMMessage]) -> str:
-        # Construct the history of the conversation.
-        history_messages: List[str] = []
-        for msg in message_history:
+        for msg in new_messages:
             if isinstance(msg, UserMessage) or isinstance(msg, AssistantMessage):
-                message = f"{msg.source}: {msg.content}"
-                history_messages.append(
-                    message.rstrip() + "\n\n"
-                )  # Create some consistency for how messages are separated in the transcript
+                rendered = previous.get(id(msg))
+                if rendered is None or rendered.message is not msg:
+                    rendered = self._render_message(msg)
+                if self._rendered_messages:
+                    self._rendered_history += "\n"
+                self._rendered_history += rendered.text
+                self._rendered_messages.append(rendered)
+        self._rendered_context = list(message_history)
 
-        history: str = "\n".join(history_messages)
-        return history
-
-    async def _select_speaker(self, roles: str, participants: List[str], max_attempts: int) -> str:
+    @staticmethod
+    def _render_message(msg: UserMessage | AssistantMessage) -> _RenderedMessage:
+        # Create some consistency for how messages are separated in the transcript
+        return _RenderedMessage(msg, f"{msg.source}: {msg.content}".rstrip() + "\n\n")
+
+    def _limit_history(self, rendered_messages: List[_RenderedMessage], history: str) -> str:
+        # Returns the part of history, the joined text of rendered_messages, within the history limits.
+        selected = rendered_messages
+        if self._max_selector_history_messages is not None:
+            selected = selected[max(0, len(selected) - self._max_selector_history_messages) :]
+        if self._max_selector_history_tokens is not None:
+            # Keep the most recent messages that fit in the token budget.
+            num_tokens = 0
+            start = len(selected)
+            while start > 0:
+                rendered = selected[start - 1]
+                if rendered.num_tokens is None:
+                    rendered.num_tokens = self._model_client.count_tokens(
+                        [UserMessage(content=rendered.text, source="user")]
+                    )
+                if num_tokens + rendered.num_tokens > self._max_selector_history_tokens:
+                    break
+                num_tokens += rendered.num_tokens
+                start -= 1
+            selected = selected[start:]
+
+        if len(selected) == len(rendered_messages):
+            return history
+        return "\n".join(rendered.text for rendered in selected)
+
+    async def _select_speaker(
+        self, roles: str, participants: List[str], max_attempts: int, speculation: _Speculation | None = None
+    ) -> str:
         model_context_messages = await self._model_context.get_messages()
         model_context_history = self.construct_message_history(model_context_messages)
 
+        if speculation is not None:
+            if speculation.key == (model_context_history, tuple(participants), self._previous_speaker):
+                try:
+                    agent_name = await speculation.task
+                except Exception as e:
+                    trace_logger.debug(f"Speculative speaker selection failed, selecting again: {e}")
+                else:
+                    self._num_speculation_hits += 1
+                    trace_logger.debug(f"Using the speculative speaker selection: {agent_name}")
+                    for speculative_event in speculation.events:
+                        await self._output_message_queue.put(speculative_event)
+                    return agent_name
+            else:
+                trace_logger.debug("Discarded the speculative speaker selection, the final message changed the prompt.")
+
+        return await self._select_speaker_with_model(
+            roles, participants, model_context_history, max_attempts, self._output_message_queue.put
+        )
+
+    async def _select_speaker_with_model(
+        self,
+        roles: str,
+        participants: List[str],
+        model_context_history: str,
+        max_attempts: int,
+        emit: Callable[[BaseAgentEvent | BaseChatMessage], Awaitable[None]],
+    ) -> str:
         select_speaker_prompt = self._selector_prompt.format(
             roles=roles, participants=str(participants), history=model_context_history
         )
@@ -254,15 +425,11 @@ async def _select_speaker(self, roles: str, participants: List[str], max_attempt
                     chunk = _chunk
                     if self._emit_team_events:
                         if isinstance(chunk, str):
-                            await self._output_message_queue.put(
-                                ModelClientStreamingChunkEvent(content=cast(str, _chunk), source=self._name)
-                            )
+                            await emit(ModelClientStreamingChunkEvent(content=cast(str, _chunk), source=self._name))
                         else:
                             assert isinstance(chunk, CreateResult)
                             assert isinstance(chunk.content, str)
-                            await self._output_message_queue.put(
-                                SelectorEvent(content=chunk.content, source=self._name)
-                            )
+                            await emit(SelectorEvent(content=chunk.content, source=self._name))
                 # The last chunk must be CreateResult.
                 assert isinstance(chunk, CreateResult)
                 response = chunk
@@ -308,6 +475,81 @@ async def _select_speaker(self, roles: str, participants: List[str], max_attempt
         )
         return participants[0]
 
+    @event
+    async def handle_group_chat_message(self, message: GroupChatMessage, ctx: MessageContext) -> None:  # type: ignore
+        """Handle a group chat message by appending the content to its output message queue, and start
+        a speculative selection from the streamed output of the current speaker if enabled."""
+        await self._output_message_queue.put(message.message)
+        if self._speculative_selection_delay is not None and isinstance(
+            message.message, ModelClientStreamingChunkEvent
+        ):
+            self._on_streamed_chunk(message.message)
+
+    def _on_streamed_chunk(self, chunk: ModelClientStreamingChunkEvent) -> None:
+        # Only the streamed output of the current speaker is used, and only when the model selects the speaker.
+        if self._selector_func is not None or self._paused or self._active_speakers != [chunk.source]:
+            return
+        if chunk.source != self._streamed_source:
+            self._streamed_source = chunk.source
+            self._streamed_chunks = []
+        self._streamed_chunks.append(chunk.content)
+        # The output changed, so a selection started from it is out of date. Start a new one once the output pauses.
+        self._discard_speculation(keep_streamed_output=True)
+        assert self._speculative_selection_delay is not None
+        self._speculation_timer = asyncio.get_running_loop().call_later(
+            self._speculative_selection_delay, self._start_speculation
+        )
+
+    def _start_speculation(self) -> None:
+        self._speculation_timer = None
+        if self._streamed_source is None or self._active_speakers != [self._streamed_source]:
+            return
+        # Assume the streamed output is the final message of the speaker.
+        provisional_message = TextMessage(content="".join(self._streamed_chunks), source=self._streamed_source)
+        speculation = _Speculation()
+        speculation.task = asyncio.create_task(self._speculate(speculation, provisional_message))
+        # Retrieve the exception of a discarded selection, so that it is not reported as never retrieved.
+        speculation.task.add_done_callback(lambda task: task.cancelled() or task.exception())
+        self._speculation = speculation
+        self._num_speculations += 1
+
+    async def _speculate(self, speculation: _Speculation, provisional_message: TextMessage) -> str:
+        participants = await self._get_candidates([*self._message_thread, provisional_message])
+        # Render the provisional message on top of the current history, without recording it as rendered,
+        # so that the history of the real selection is still rendered incrementally.
+        model_context_messages = await self._model_context.get_messages()
+        self._render_messages(model_context_messages)
+        provisional = self._render_message(provisional_message.to_model_message())
+        history = self._rendered_history + ("\n" if self._rendered_messages else "") + provisional.text
+        model_context_history = self._limit_history([*self._rendered_messages, provisional], history)
+        speculation.key = (model_context_history, tuple(participants), self._previous_speaker)
+        if len(participants) == 1:
+            return participants[0]
+
+        async def emit(speculative_event: BaseAgentEvent | BaseChatMessage) -> None:
+            speculation.events.append(speculative_event)
+
+        return await self._select_speaker_with_model(
+            self._roles, participants, model_context_history, self._max_selector_attempts, emit
+        )
+
+    def _take_speculation(self) -> _Speculation | None:
+        speculation = self._speculation
+        self._speculation = None
+        self._discard_speculation()
+        return speculation
+
+    def _discard_speculation(self, keep_streamed_output: bool = False) -> None:
+        if self._speculation_timer is not None:
+            self._speculation_timer.cancel()
+            self._speculation_timer = None
+        if self._speculation is not None:
+            self._speculation.task.cancel()
+            self._speculation = None
+        if not keep_streamed_output:
+            self._streamed_source = None
+            self._streamed_chunks = []
+
     def _mentioned_agents(self, message_content: str, agent_names: List[str]) -> Dict[str, int]:
         """Counts the number of times each agent is mentioned in the provided message content.
         Agent names will match under any of the following conditions (all case-sensitive):
@@ -356,6 +598,9 @@ class SelectorGroupChatConfig(BaseModel):
     emit_team_events: bool = False
     model_client_streaming: bool = False
     model_context: ComponentModel | None = None
+    max_selector_history_messages: int | None = None
+    max_selector_history_tokens: int | None = None
+    speculative_selection_delay: float | None = None
 
 
 class SelectorGroupChat(BaseGroupChat, Component[SelectorGroupChatConfig]):
@@ -395,9 +640,24 @@ class SelectorGroupChat(BaseGroupChat, Component[SelectorGroupChatConfig]):
         model_client_streaming (bool, optional): Whether to use streaming for the model client. (This is useful for reasoning models like QwQ). Defaults to False.
         model_context (ChatCompletionContext | None, optional): The model context for storing and retrieving
             :class:`~autogen_core.models.LLMMessage`. It can be preloaded with initial messages. Messages stored in model context will be used for speaker selection. The initial messages will be cleared when the team is reset.
+        max_selector_history_messages (int | None, optional): The maximum number of the most recent messages from the model context
+            to include in the `{history}` of the selector prompt. Defaults to None, meaning no limit.
+        max_selector_history_tokens (int | None, optional): The maximum number of tokens, as counted by `model_client`, of the messages
+            included in the `{history}` of the selector prompt. The most recent messages that fit are included. Defaults to None, meaning no limit.
+            Unlike a buffered `model_context`, these limits only apply to the selector prompt, the model context keeps all its messages.
+        speculative_selection_delay (float | None, optional): (Experimental) If set, enables speculative speaker selection: when the
+            current speaker streams its output (e.g., an :class:`~autogen_agentchat.agents.AssistantAgent` with `model_client_stream=True`)
+            and the output pauses for this many seconds (which must be greater than 0), the next speaker is selected in the background, assuming the streamed output is
+            the final message. When the final message arrives, the speculative selection is used if the selector prompt
+            is the same, and discarded otherwise, so the selected speaker is the same as without speculation.
+            Note that `candidate_func`, if set, is then also called with a thread that ends with a provisional
+            :class:`~autogen_agentchat.messages.TextMessage` holding the streamed output, which is not part of the conversation.
+            This hides the selector latency behind the end of the speaker's turn, at the cost of extra selector calls
+            when speculation is discarded. Not used with `selector_func`. Defaults to None, meaning disabled.
 
     Raises:
-        ValueError: If the number of participants is less than two or if the selector prompt is invalid.
+        ValueError: If the number of participants is less than two, if the selector prompt is invalid, or if
+            `speculative_selection_delay` is not greater than 0.
 
     Examples:
 
@@ -597,6 +857,9 @@ def __init__(
         emit_team_events: bool = False,
         model_client_streaming: bool = False,
         model_context: ChatCompletionContext | None = None,
+        max_selector_history_messages: int | None = None,
+        max_selector_history_tokens: int | None = None,
+        speculative_selection_delay: float | None = None,
     ):
         super().__init__(
             participants,
@@ -611,6 +874,12 @@ def __init__(
         # Validate the participants.
         if len(participants) < 2:
             raise ValueError("At least two participants are required for SelectorGroupChat.")
+        if max_selector_history_messages is not None and max_selector_history_messages < 1:
+            raise ValueError("max_selector_history_messages must be at least 1.")
+        if max_selector_history_tokens is not None and max_selector_history_tokens < 1:
+            raise ValueError("max_selector_history_tokens must be at least 1.")
+        if speculative_selection_delay is not None and speculative_selection_delay <= 0:
+            raise ValueError("speculative_selection_delay must be greater than 0.")
         self._selector_prompt = selector_prompt
         self._model_client = model_client
         self._allow_repeated_speaker = allow_repeated_speaker
@@ -619,6 +888,9 @@ def __init__(
         self._candidate_func = candidate_func
         self._model_client_streaming = model_client_streaming
         self._model_context = model_context
+        self._max_selector_history_messages = max_selector_history_messages
+        self._max_selector_history_tokens = max_selector_history_tokens
+        self._speculative_selection_delay = speculative_selection_delay
 
     def _create_group_chat_manager_factory(
         self,
@@ -653,6 +925,9 @@ def _create_group_chat_manager_factory(
             self._emit_team_events,
             self._model_context,
             self._model_client_streaming,
+            self._max_selector_history_messages,
+            self._max_selector_history_tokens,
+            self._speculative_selection_delay,
         )
 
     def _to_config(self) -> SelectorGroupChatConfig:
@@ -668,6 +943,9 @@ def _to_config(self) -> SelectorGroupChatConfig:
             emit_team_events=self._emit_team_events,
             model_client_streaming=self._model_client_streaming,
             model_context=self._model_context.dump_component() if self._model_context else None,
+            max_selector_history_messages=self._max_selector_history_messages,
+            max_selector_history_tokens=self._max_selector_history_tokens,
+            speculative_selection_delay=self._speculative_selection_delay,
         )
 
     @classmethod
@@ -688,4 +966,7 @@ def _from_config(cls, config: SelectorGroupChatConfig) -> Self:
             emit_team_events=config.emit_team_events,
             model_client_streaming=config.model_client_streaming,
             model_context=ChatCompletionContext.load_component(config.model_context) if config.model_context else None,
+            max_selector_history_messages=config.max_selector_history_messages,
+            max_selector_history_tokens=config.max_selector_history_tokens,
+            speculative_selection_delay=config.speculative_selection_delay,
         )
@@ -0,0 +1,76 @@
+from typing import AsyncGenerator, List
+
+import pytest
+from autogen_agentchat.base import TaskResult
+from autogen_agentchat.messages import (
+    BaseAgentEvent,
+    BaseChatMessage,
+    ModelClientStreamingChunkEvent,
+    TextMessage,
+    UserInputRequestedEvent,
+)
+from autogen_agentchat.ui import Console
+
+
+def _make_messages() -> List[BaseAgentEvent | BaseChatMessage]:
+    chunks = ["Hello", ", ", "world", "!\nSecond", " line"]
+    messages: List[BaseAgentEvent | BaseChatMessage] = [TextMessage(content="Say hello", source="user")]
+    messages.extend(ModelClientStreamingChunkEvent(content=chunk, source="assistant") for chunk in chunks)
+    messages.append(TextMessage(content="".join(chunks), source="assistant"))
+    return messages
+
+
+async def _stream(
+    messages: List[BaseAgentEvent | BaseChatMessage],
+) -> AsyncGenerator[BaseAgentEvent | BaseChatMessage | TaskResult, None]:
+    for message in messages:
+        yield message
+    yield TaskResult(messages=[m for m in messages if isinstance(m, BaseChatMessage)])
+
+
+@pytest.mark.asyncio
+async def test_console_buffered_output_matches_unbuffered(capsys: pytest.CaptureFixture[str]) -> None:
+    messages = _make_messages()
+
+    result = await Console(_stream(messages), buffered=False)
+    unbuffered = capsys.readouterr().out
+    assert isinstance(result, TaskResult)
+    assert len(result.messages) == 2
+
+    result = await Console(_stream(messages), buffered=True)
+    buffered = capsys.readouterr().out
+    assert isinstance(result, TaskResult)
+
+    assert buffered == unbuffered
+    assert "Hello, world!\nSecond line\n" in buffered
+
+
+@pytest.mark.asyncio
+async def test_console_prints_everything_before_user_input(capsys: pytest.CaptureFixture[str]) -> None:
+    printed: List[str] = []
+
+    async def stream() -> AsyncGenerator[BaseAgentEvent | BaseChatMessage | TaskResult, None]:
+        yield ModelClientStreamingChunkEvent(content="Enter a number", source="assistant")
+        yield UserInputRequestedEvent(request_id="1", source="user_proxy")
+        # The user is prompted now, the output so far must already be on screen.
+        printed.append(capsys.readouterr().out)
+        yield TaskResult(messages=[])
+
+    await Console(stream())
+    assert printed[0].endswith("Enter a number")
+
+
+@pytest.mark.asyncio
+async def test_console_keeps_stream_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    def failing_print(*args: object, **kwargs: object) -> None:
+        raise OSError("Broken pipe")
+
+    monkeypatch.setattr("autogen_agentchat.ui._console.print", failing_print, raising=False)
+
+    async def stream() -> AsyncGenerator[BaseAgentEvent | BaseChatMessage | TaskResult, None]:
+        yield TextMessage(content="Hello", source="assistant")
+        raise ValueError("Stream failed")
+
+    # The error of the stream is raised, not the error of the write.
+    with pytest.raises(ValueError, match="Stream failed"):
+        await Console(stream())
@@ -101,6 +101,42 @@ async def load_state(self, state: Mapping[str, Any]) -> None:
         self._total_messages = state.get("total_messages", 0)
 
 
+class _StreamingAgent(BaseChatAgent):
+    """Streams its output, then pauses before returning its final message."""
+
+    def __init__(self, name: str, description: str, final_suffix: str = "", fail: bool = False) -> None:
+        super().__init__(name, description)
+        self._final_suffix = final_suffix
+        self._fail = fail
+
+    @property
+    def produced_message_types(self) -> Sequence[type[BaseChatMessage]]:
+        return (TextMessage,)
+
+    async def on_messages(self, messages: Sequence[BaseChatMessage], cancellation_token: CancellationToken) -> Response:
+        response: Response | None = None
+        async for message in self.on_messages_stream(messages, cancellation_token):
+            if isinstance(message, Response):
+                response = message
+        assert response is not None
+        return response
+
+    async def on_messages_stream(
+        self, messages: Sequence[BaseChatMessage], cancellation_token: CancellationToken
+    ) -> AsyncGenerator[BaseAgentEvent | BaseChatMessage | Response, None]:
+        yield ModelClientStreamingChunkEvent(content="Hello from ", source=self.name)
+        yield ModelClientStreamingChunkEvent(content=self.name, source=self.name)
+        await asyncio.sleep(0.5)
+        if self._fail:
+            raise ValueError(f"{self.name} failed.")
+        yield Response(
+            chat_message=TextMessage(content=f"Hello from {self.name}{self._final_suffix}", source=self.name)
+        )
+
+    async def on_reset(self, cancellation_token: CancellationToken) -> None:
+        pass
+
+
 class _FlakyAgent(BaseChatAgent):
     def __init__(self, name: str, description: str) -> None:
         super().__init__(name, description)
@@ -755,6 +791,123 @@ async def test_selector_group_chat_with_model_context(runtime: AgentRuntime | No
         ), f"Expected all lines {chat_history} to be in prompt, but got {prompt_lines}"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", ["messages", "tokens"])
+async def test_selector_group_chat_with_history_limit(runtime: AgentRuntime | None, limit: str) -> None:
+    selector_group_chat_model_client = ReplayChatCompletionClient(["agent2", "agent1", "agent2", "agent1"])
+    agent_one_model_client = ReplayChatCompletionClient(["[Agent One] First generation", "TERMINATE"])
+    agent_two_model_client = ReplayChatCompletionClient(
+        ["[Agent Two] First generation", "[Agent Two] Second generation"]
+    )
+
+    agent1 = AssistantAgent("agent1", model_client=agent_one_model_client, description="Assistant agent 1")
+    agent2 = AssistantAgent("agent2", model_client=agent_two_model_client, description="Assistant agent 2")
+
+    team = SelectorGroupChat(
+        participants=[agent1, agent2],
+        model_client=selector_group_chat_model_client,
+        termination_condition=TextMentionTermination("TERMINATE"),
+        runtime=runtime,
+        allow_repeated_speaker=True,
+        # The task is 3 tokens and the other messages 5 tokens each for the replay client.
+        max_selector_history_messages=2 if limit == "messages" else None,
+        max_selector_history_tokens=12 if limit == "tokens" else None,
+    )
+    await team.run(task="[GroupChat] Task")
+
+    messages = [
+        "user: [GroupChat] Task",
+        "agent2: [Agent Two] First generation",
+        "agent1: [Agent One] First generation",
+        "agent2: [Agent Two] Second generation",
+    ]
+    create_calls: List[Dict[str, Any]] = selector_group_chat_model_client.create_calls
+    assert len(create_calls) == 4
+    for idx, call in enumerate(create_calls):
+        prompt_lines = call["messages"][0].content.split("\n")
+        # Only the two most recent messages are in the prompt.
+        for message_idx, line in enumerate(messages):
+            assert (line in prompt_lines) == (idx - 1 <= message_idx <= idx), (idx, line, prompt_lines)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("final_message_changes", [False, True])
+async def test_selector_group_chat_speculative_selection(
+    runtime: AgentRuntime | None, final_message_changes: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Record whether each rendering of the selector history only had to render new messages.
+    extensions: List[bool] = []
+    render_messages = SelectorGroupChatManager._render_messages  # pyright: ignore[reportPrivateUsage]
+
+    def record_render_messages(self: SelectorGroupChatManager, message_history: List[LLMMessage]) -> None:
+        rendered_context = self._rendered_context  # pyright: ignore[reportPrivateUsage]
+        extensions.append(all(a is b for a, b in zip(rendered_context, message_history, strict=False)))
+        render_messages(self, message_history)
+
+    monkeypatch.setattr(SelectorGroupChatManager, "_render_messages", record_render_messages)
+
+    if final_message_changes:
+        # The speculative selections, made from the streamed output, are discarded.
+        selections = ["agent1", "agent3", "agent2", "agent1", "agent3", "agent2"]
+    else:
+        selections = ["agent1", "agent2", "agent3", "agent1"]
+    model_client = ReplayChatCompletionClient(selections)
+    suffix = "!" if final_message_changes else ""
+    agents = [_StreamingAgent(f"agent{i}", description=f"Agent {i}", final_suffix=suffix) for i in range(1, 4)]
+    team = SelectorGroupChat(
+        participants=list(agents),
+        model_client=model_client,
+        max_turns=3,
+        runtime=runtime,
+        speculative_selection_delay=0.05,
+    )
+    result = await team.run(task="Say hello")
+
+    assert [message.source for message in result.messages] == ["user", "agent1", "agent2", "agent3"]
+    create_calls = model_client.create_calls
+    assert len(create_calls) == len(selections)
+    # Speculative selections are made with the streamed output as the last message.
+    assert "agent1: Hello from agent1" in create_calls[1]["messages"][0].content.split("\n")
+    # Speculation does not disturb the incremental rendering of the history.
+    assert extensions and all(extensions)
+
+
+@pytest.mark.parametrize("delay", [0, -1.0])
+def test_selector_group_chat_speculative_selection_delay_must_be_positive(delay: float) -> None:
+    agents = [_StreamingAgent(f"agent{i}", description=f"Agent {i}") for i in range(1, 3)]
+    with pytest.raises(ValueError, match="speculative_selection_delay must be greater than 0"):
+        SelectorGroupChat(
+            participants=list(agents),
+            model_client=ReplayChatCompletionClient(["agent1"]),
+            speculative_selection_delay=delay,
+        )
+
+
+@pytest.mark.asyncio
+async def test_selector_group_chat_speculative_selection_discarded_on_error(runtime: AgentRuntime | None) -> None:
+    model_client = ReplayChatCompletionClient(["agent1", "agent2"])
+    agents = [
+        _StreamingAgent("agent1", description="Agent 1", fail=True),
+        _StreamingAgent("agent2", description="Agent 2"),
+    ]
+    team = SelectorGroupChat(
+        participants=list(agents),
+        model_client=model_client,
+        runtime=runtime,
+        speculative_selection_delay=0.05,
+    )
+    with pytest.raises(RuntimeError, match="agent1 failed."):
+        await team.run(task="Say hello")
+
+    manager = await team._runtime.try_get_underlying_agent_instance(  # pyright: ignore
+        AgentId(f"{team._group_chat_manager_name}_{team._team_id}", team._team_id),  # pyright: ignore
+        SelectorGroupChatManager,
+    )
+    # A speculative selection was started from the streamed output, and discarded when the run failed.
+    assert manager._num_speculations == 1  # pyright: ignore
+    assert manager._speculation is None  # pyright: ignore
+
+
 @pytest.mark.asyncio
 async def test_selector_group_chat_with_team_event(runtime: AgentRuntime | None) -> None:
     model_client = ReplayChatCompletionClient(
@@ -162,6 +162,60 @@ async def test_magentic_one_group_chat_basic(runtime: AgentRuntime | None) -> No
     assert manager_1._n_stalls == manager_2._n_stalls  # pyright: ignore
 
 
+@pytest.mark.asyncio
+async def test_magentic_one_group_chat_compaction(runtime: AgentRuntime | None) -> None:
+    agent_1 = _EchoAgent("agent_1", description="echo agent 1")
+    agent_2 = _EchoAgent("agent_2", description="echo agent 2")
+
+    model_client = ReplayChatCompletionClient(
+        chat_completions=[
+            "No facts",
+            "No plan",
+            json.dumps(
+                {
+                    "is_request_satisfied": {"answer": False, "reason": "test"},
+                    "is_progress_being_made": {"answer": True, "reason": "test"},
+                    "is_in_loop": {"answer": False, "reason": "test"},
+                    "instruction_or_question": {"answer": "Continue task", "reason": "test"},
+                    "next_speaker": {"answer": "agent_1", "reason": "test"},
+                }
+            ),
+            "Summary of the instruction",
+            json.dumps(
+                {
+                    "is_request_satisfied": {"answer": True, "reason": "Because"},
+                    "is_progress_being_made": {"answer": True, "reason": "test"},
+                    "is_in_loop": {"answer": False, "reason": "test"},
+                    "instruction_or_question": {"answer": "Task completed", "reason": "Because"},
+                    "next_speaker": {"answer": "agent_1", "reason": "test"},
+                }
+            ),
+            "print('Hello, world!')",
+        ],
+    )
+
+    team = MagenticOneGroupChat(
+        participants=[agent_1, agent_2], model_client=model_client, runtime=runtime, compaction_window=1
+    )
+    result = await team.run(task="Write a program that prints 'Hello, world!'")
+    assert result.messages[-1].to_text() == "print('Hello, world!')"
+    assert result.stop_reason == "Because"
+
+    # The instruction was folded into the summary before the second progress ledger.
+    summary_call, ledger_call = model_client.create_calls[3:5]
+    assert [m.content for m in summary_call["messages"][:-1]] == ["Continue task"]
+    ledger_contents = [m.content for m in ledger_call["messages"]]
+    assert ledger_contents[0].startswith("\nWe are working to address the following user request:")
+    assert "Summary of the instruction" in ledger_contents[1]
+    assert ledger_call["messages"][2].source == "agent_1"
+    assert len(ledger_contents) == 4
+
+    state = await team.save_state()
+    manager_state = state["agent_states"]["MagenticOneOrchestrator"]
+    assert manager_state["summary"] == "Summary of the instruction"
+    assert manager_state["n_summarized"] == 1
+
+
 @pytest.mark.asyncio
 async def test_magentic_one_group_chat_with_stalls(runtime: AgentRuntime | None) -> None:
     agent_1 = _EchoAgent("agent_1", description="echo agent 1")
@@ -1,6 +1,7 @@
 import threading
 from asyncio import Future
-from typing import Any, Callable, List
+from itertools import count
+from typing import Any, Callable, Dict
 
 
 class CancellationToken:
@@ -9,15 +10,20 @@ class CancellationToken:
     def __init__(self) -> None:
         self._cancelled: bool = False
         self._lock: threading.Lock = threading.Lock()
-        self._callbacks: List[Callable[[], None]] = []
+        # Callbacks keyed by registration id, dicts keep insertion order and allow O(1) removal.
+        self._callbacks: Dict[int, Callable[[], None]] = {}
+        self._ids = count()
 
     def cancel(self) -> None:
         """Cancel pending async calls linked to this cancellation token."""
         with self._lock:
-            if not self._cancelled:
-                self._cancelled = True
-                for callback in self._callbacks:
-                    callback()
+            if self._cancelled:
+                return
+            self._cancelled = True
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+        for callback in callbacks:
+            callback()
 
     def is_cancelled(self) -> bool:
         """Check if the CancellationToken has been used"""
@@ -26,21 +32,30 @@ def is_cancelled(self) -> bool:
 
     def add_callback(self, callback: Callable[[], None]) -> None:
         """Attach a callback that will be called when cancel is invoked"""
-        with self._lock:
-            if self._cancelled:
-                callback()
-            else:
-                self._callbacks.append(callback)
+        self._register(callback)
 
     def link_future(self, future: Future[Any]) -> Future[Any]:
-        """Link a pending async call to a token to allow its cancellation"""
-        with self._lock:
-            if self._cancelled:
-                future.cancel()
-            else:
-
-                def _cancel() -> None:
-                    future.cancel()
-
-                self._callbacks.append(_cancel)
+        """Link a pending async call to a token to allow its cancellation.
+
+        The link is removed once the future is done, so a long-lived token does not
+        keep references to completed futures."""
+        if future.done():
+            return future
+        callback_id = self._register(future.cancel)
+        if callback_id is not None:
+            future.add_done_callback(lambda _: self._unregister(callback_id))
         return future
+
+    def _register(self, callback: Callable[[], Any]) -> int | None:
+        with self._lock:
+            if not self._cancelled:
+                callback_id = next(self._ids)
+                self._callbacks[callback_id] = callback
+                return callback_id
+        # Already cancelled, call it right away (outside of the lock).
+        callback()
+        return None
+
+    def _unregister(self, callback_id: int) -> None:
+        with self._lock:
+            self._callbacks.pop(callback_id, None)
@@ -15,6 +15,11 @@
 class Image:
     """Represents an image.
 
+    Images created from bytes, base64 or a file keep their original PNG, JPEG, GIF or WEBP encoding,
+    which is sent to models as is, and are only decoded to a PIL image when :attr:`image` is accessed.
+    Images created from a PIL image are encoded as PNG on first use. The encoded image and its base64
+    form are kept, so an image is encoded at most once however many times it is sent or serialized.
+    Treat the image as immutable: changes made in place to :attr:`image` are not reflected in the encoded form.
 
     Example:
 
@@ -23,7 +28,6 @@ class Image:
         .. code-block:: python
 
             from autogen_core import Image
-            from PIL import Image as PILImage
             import aiohttp
             import asyncio
 
@@ -32,7 +36,7 @@ async def from_url(url: str) -> Image:
                 async with aiohttp.ClientSession() as session:
                     async with session.get(url) as response:
                         content = await response.read()
-                        return Image.from_pil(PILImage.open(content))
+                        return Image.from_bytes(content)
 
 
             image = asyncio.run(from_url("https://example.com/image"))
@@ -40,7 +44,42 @@ async def from_url(url: str) -> Image:
     """
 
     def __init__(self, image: PILImage.Image):
-        self.image: PILImage.Image = image.convert("RGB")
+        self._image: PILImage.Image | None = image.convert("RGB")
+        # The encoded image and its base64 form are computed on first use, and kept.
+        self._data: bytes | None = None
+        self._base64: str | None = None
+        self._mime_type: str | None = None
+
+    @classmethod
+    def _from_encoded(cls, data: bytes | None, base64_str: str | None, mime_type: str) -> Image:
+        # Keeps the image as it was given, it is only decoded when the pixels are needed.
+        image = cls.__new__(cls)
+        image._image = None
+        image._data = data
+        image._base64 = base64_str
+        image._mime_type = mime_type
+        return image
+
+    @property
+    def image(self) -> PILImage.Image:
+        """The image as an RGB PIL image, decoded on first access."""
+        if self._image is None:
+            self._image = PILImage.open(BytesIO(self.to_bytes())).convert("RGB")
+        return self._image
+
+    @image.setter
+    def image(self, image: PILImage.Image) -> None:
+        self._image = image.convert("RGB")
+        self._data = None
+        self._base64 = None
+        self._mime_type = None
+
+    @property
+    def mime_type(self) -> str:
+        """The MIME type of the encoded image: image/png, image/jpeg, image/gif or image/webp."""
+        if self._mime_type is None:
+            self._mime_type = "image/png"
+        return self._mime_type
 
     @classmethod
     def from_pil(cls, pil_image: PILImage.Image) -> Image:
@@ -48,26 +87,53 @@ def from_pil(cls, pil_image: PILImage.Image) -> Image:
 
     @classmethod
     def from_uri(cls, uri: str) -> Image:
-        if not re.match(r"data:image/(?:png|jpeg);base64,", uri):
+        if not re.match(r"data:image/(?:png|jpeg|gif|webp);base64,", uri):
             raise ValueError("Invalid URI format. It should be a base64 encoded image URI.")
 
         # A URI. Remove the prefix and decode the base64 string.
-        base64_data = re.sub(r"data:image/(?:png|jpeg);base64,", "", uri)
+        base64_data = re.sub(r"data:image/(?:png|jpeg|gif|webp);base64,", "", uri)
         return cls.from_base64(base64_data)
 
     @classmethod
     def from_base64(cls, base64_str: str) -> Image:
-        return cls(PILImage.open(BytesIO(base64.b64decode(base64_str))))
+        # Only the first bytes are decoded to find the format, the string is kept as is when it is a supported format.
+        if len(base64_str) % 4 == 0 and _BASE64_RE.fullmatch(base64_str):
+            mime_type = _get_mime_type(base64.b64decode(base64_str[:16]))
+            if mime_type is not None:
+                return cls._from_encoded(None, base64_str, mime_type)
+        return cls.from_bytes(base64.b64decode(base64_str))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Image:
+        """Create an image from encoded image bytes.
+
+        PNG, JPEG, GIF and WEBP images are kept encoded as given, and only decoded when :attr:`image` is accessed.
+        Other formats are decoded right away, and encoded as PNG."""
+        mime_type = _get_mime_type(data)
+        if mime_type is not None:
+            return cls._from_encoded(data, None, mime_type)
+        return cls(PILImage.open(BytesIO(data)))
+
+    def to_bytes(self) -> bytes:
+        """Return the encoded image, in the format given by :attr:`mime_type`."""
+        if self._data is None:
+            if self._base64 is not None:
+                self._data = base64.b64decode(self._base64)
+            else:
+                buffered = BytesIO()
+                self.image.save(buffered, format="PNG")
+                self._data = buffered.getvalue()
+                self._mime_type = "image/png"
+        return self._data
 
     def to_base64(self) -> str:
-        buffered = BytesIO()
-        self.image.save(buffered, format="PNG")
-        content = buffered.getvalue()
-        return base64.b64encode(content).decode("utf-8")
+        if self._base64 is None:
+            self._base64 = base64.b64encode(self.to_bytes()).decode("utf-8")
+        return self._base64
 
     @classmethod
     def from_file(cls, file_path: Path) -> Image:
-        return cls(PILImage.open(file_path))
+        return cls.from_bytes(Path(file_path).read_bytes())
 
     def _repr_html_(self) -> str:
         # Show the image in Jupyter notebook
@@ -75,7 +141,7 @@ def _repr_html_(self) -> str:
 
     @property
     def data_uri(self) -> str:
-        return _convert_base64_to_data_uri(self.to_base64())
+        return f"data:{self.mime_type};base64,{self.to_base64()}"
 
     # Returns openai.types.chat.ChatCompletionContentPartImageParam, which is a TypedDict
     # We don't use the explicit type annotation so that we can avoid a dependency on the OpenAI Python SDK in this package.
@@ -107,21 +173,17 @@ def serialize(value: Image) -> dict[str, Any]:
         )
 
 
-def _convert_base64_to_data_uri(base64_image: str) -> str:
-    def _get_mime_type_from_data_uri(base64_image: str) -> str:
-        # Decode the base64 string
-        image_data = base64.b64decode(base64_image)
-        # Check the first few bytes for known signatures
-        if image_data.startswith(b"\xff\xd8\xff"):
-            return "image/jpeg"
-        elif image_data.startswith(b"\x89PNG\r\n\x1a\n"):
-            return "image/png"
-        elif image_data.startswith(b"GIF87a") or image_data.startswith(b"GIF89a"):
-            return "image/gif"
-        elif image_data.startswith(b"RIFF") and image_data[8:12] == b"WEBP":
-            return "image/webp"
-        return "image/jpeg"  # use jpeg for unknown formats, best guess.
-
-    mime_type = _get_mime_type_from_data_uri(base64_image)
-    data_uri = f"data:{mime_type};base64,{base64_image}"
-    return data_uri
+_BASE64_RE = re.compile(r"[A-Za-z0-9+/]{16,}={0,2}")
+
+
+def _get_mime_type(image_data: bytes) -> str | None:
+    # Check the first few bytes for the signatures of the formats supported by model APIs.
+    if image_data.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    elif image_data.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    elif image_data.startswith(b"GIF87a") or image_data.startswith(b"GIF89a"):
+        return "image/gif"
+    elif image_data.startswith(b"RIFF") and image_data[8:12] == b"WEBP":
+        return "image/webp"
+    return None
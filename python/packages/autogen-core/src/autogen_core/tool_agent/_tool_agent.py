@@ -1,6 +1,6 @@
 import json
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List
 
 from .. import FunctionCall, MessageContext, RoutedAgent, message_handler
 from ..models import FunctionExecutionResult
@@ -44,7 +44,8 @@ class ToolAgent(RoutedAgent):
 
     Args:
         description (str): The description of the agent.
-        tools (List[Tool]): The list of tools that the agent can execute.
+        tools (List[Tool]): The list of tools that the agent can execute. The list is copied, so changing it
+            after the agent is created has no effect.
     """
 
     def __init__(
@@ -53,11 +54,16 @@ def __init__(
         tools: List[Tool],
     ) -> None:
         super().__init__(description)
-        self._tools = tools
+        self._tools = list(tools)
+        # Index the tools by name, the first tool wins if names collide.
+        self._tools_by_name: Dict[str, Tool] = {}
+        for tool in self._tools:
+            self._tools_by_name.setdefault(tool.name, tool)
 
     @property
     def tools(self) -> List[Tool]:
-        return self._tools
+        """A copy of the tools that the agent can execute."""
+        return list(self._tools)
 
     @message_handler
     async def handle_function_call(self, message: FunctionCall, ctx: MessageContext) -> FunctionExecutionResult:
@@ -75,7 +81,7 @@ async def handle_function_call(self, message: FunctionCall, ctx: MessageContext)
             InvalidToolArgumentsException: If the tool arguments are invalid.
             ToolExecutionException: If the tool execution fails.
         """
-        tool = next((tool for tool in self._tools if tool.name == message.name), None)
+        tool = self._tools_by_name.get(message.name)
         if tool is None:
             raise ToolNotFoundException(
                 call_id=message.id, content=f"Error: Tool not found: {message.name}", name=message.name
@@ -1,8 +1,9 @@
+import copy
 import json
 import logging
 from abc import ABC, abstractmethod
 from collections.abc import Sequence
-from typing import Any, Dict, Generic, Mapping, Protocol, Type, TypeVar, cast, runtime_checkable
+from typing import Any, Dict, Generic, Mapping, Protocol, Tuple, Type, TypeVar, cast, runtime_checkable
 
 import jsonref
 from opentelemetry.trace import get_tracer
@@ -81,9 +82,19 @@ def __init__(
         self._name = name
         self._description = description
         self._strict = strict
+        self._schema_cache: Tuple[Tuple[Any, ...], ToolSchema] | None = None
 
     @property
     def schema(self) -> ToolSchema:
+        # Building the schema is expensive and it is requested on every model call, so it is cached
+        # until one of the attributes it is derived from changes. A copy is returned because callers
+        # are free to modify it.
+        key = (self._name, self._description, self._strict, self._args_type)
+        if self._schema_cache is None or self._schema_cache[0] != key:
+            self._schema_cache = (key, self._build_schema())
+        return copy.deepcopy(self._schema_cache[1])
+
+    def _build_schema(self) -> ToolSchema:
         model_schema: Dict[str, Any] = self._args_type.model_json_schema()
 
         if "$defs" in model_schema:
@@ -1,13 +1,19 @@
 import asyncio
+import contextlib
 import functools
+import logging
+import time
 import warnings
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from textwrap import dedent
-from typing import Any, Callable, Sequence
+from typing import Any, AsyncContextManager, Callable, Dict, Literal, Sequence, Tuple
 
+from opentelemetry.trace import get_current_span
 from pydantic import BaseModel
 from typing_extensions import Self
 
-from .. import CancellationToken
+from .. import TRACE_LOGGER_NAME, CancellationToken
 from .._component_config import Component
 from .._function_utils import (
     args_base_model_from_signature,
@@ -16,6 +22,10 @@
 from ..code_executor._func_with_reqs import Import, import_to_str, to_code
 from ._base import BaseTool
 
+trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
+
+FunctionToolExecutor = Literal["default", "thread", "process", "inline"]
+
 
 class FunctionToolConfig(BaseModel):
     """Configuration for a function tool."""
@@ -25,6 +35,14 @@ class FunctionToolConfig(BaseModel):
     description: str
     global_imports: Sequence[Import]
     has_cancellation_support: bool
+    executor: FunctionToolExecutor = "default"
+    max_concurrency: int | None = None
+
+
+def _timed_call(func: Callable[..., Any], kwargs: Dict[str, Any]) -> Tuple[float, Any]:
+    # Runs in the executor, and returns the wall clock time at which the call started to measure the queue time.
+    started = time.time()
+    return started, func(**kwargs)
 
 
 class FunctionTool(BaseTool[BaseModel, BaseModel], Component[FunctionToolConfig]):
@@ -50,6 +68,19 @@ class FunctionTool(BaseTool[BaseModel, BaseModel], Component[FunctionToolConfig]
         strict (bool, optional): If set to True, the tool schema will only contain arguments that are explicitly
             defined in the function signature, and no default values will be allowed. Defaults to False.
             This is required to be set to True when used with models in structured output mode.
+        executor (Literal["default", "thread", "process", "inline"], optional): Where a synchronous function runs.
+            ``"default"`` uses the event loop's default executor, shared with everything else in the process.
+            ``"thread"`` uses a thread pool dedicated to this tool. ``"process"`` uses a process pool dedicated
+            to this tool, for CPU-bound functions: the function, its arguments and its result must be picklable,
+            so the function must be defined at module level and cannot take a cancellation token. A tool loaded
+            from config runs in a dedicated thread pool instead, since the loaded function cannot be pickled.
+            ``"inline"`` calls the function directly on the event loop, for trivial functions. Must be ``"default"``
+            for async functions. Defaults to ``"default"``.
+        max_concurrency (int, optional): The maximum number of concurrent calls of this tool, further calls wait
+            in a queue. Also the size of the dedicated pool. Defaults to None, no limit.
+
+    The time each call spent waiting for a slot or a worker is recorded as the ``tool_queue_time`` attribute
+    of the tool call span, and logged to the trace logger.
 
     Example:
 
@@ -92,6 +123,8 @@ def __init__(
         name: str | None = None,
         global_imports: Sequence[Import] = [],
         strict: bool = False,
+        executor: FunctionToolExecutor = "default",
+        max_concurrency: int | None = None,
     ) -> None:
         self._func = func
         self._global_imports = global_imports
@@ -99,38 +132,70 @@ def __init__(
         func_name = name or func.func.__name__ if isinstance(func, functools.partial) else name or func.__name__
         args_model = args_base_model_from_signature(func_name + "args", self._signature)
         self._has_cancellation_support = "cancellation_token" in self._signature.parameters
+        self._arg_names = [name for name in self._signature.parameters.keys() if name != "cancellation_token"]
+        self._is_async = asyncio.iscoroutinefunction(func)
+        if self._is_async and executor != "default":
+            raise ValueError("The executor can only be set for synchronous functions.")
+        if executor == "process" and self._has_cancellation_support:
+            raise ValueError("Functions running in a process pool cannot take a cancellation token.")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        self._executor_type: FunctionToolExecutor = executor
+        self._max_concurrency = max_concurrency
+        self._executor: Executor | None = None
+        self._semaphore: Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore] | None = None
         return_type = self._signature.return_annotation
         super().__init__(args_model, return_type, func_name, description, strict)
 
     async def run(self, args: BaseModel, cancellation_token: CancellationToken) -> Any:
-        kwargs = {}
-
-        for name in self._signature.parameters.keys():
-            if hasattr(args, name):
-                kwargs[name] = getattr(args, name)
-
-        if asyncio.iscoroutinefunction(self._func):
-            if self._has_cancellation_support:
-                result = await self._func(**kwargs, cancellation_token=cancellation_token)
-            else:
+        kwargs = {name: getattr(args, name) for name in self._arg_names if hasattr(args, name)}
+        if self._has_cancellation_support:
+            kwargs["cancellation_token"] = cancellation_token
+
+        requested = time.time()
+        async with self._concurrency_limit():
+            if self._is_async:
+                started = time.time()
                 result = await self._func(**kwargs)
-        else:
-            if self._has_cancellation_support:
-                result = await asyncio.get_event_loop().run_in_executor(
-                    None,
-                    functools.partial(
-                        self._func,
-                        **kwargs,
-                        cancellation_token=cancellation_token,
-                    ),
-                )
+            elif self._executor_type == "inline":
+                started = time.time()
+                result = self._func(**kwargs)
             else:
-                future = asyncio.get_event_loop().run_in_executor(None, functools.partial(self._func, **kwargs))
-                cancellation_token.link_future(future)
-                result = await future
+                future = asyncio.get_running_loop().run_in_executor(
+                    self._get_executor(), functools.partial(_timed_call, self._func, kwargs)
+                )
+                if not self._has_cancellation_support:
+                    cancellation_token.link_future(future)
+                started, result = await future
 
+        queue_time = max(0.0, started - requested)
+        get_current_span().set_attribute("tool_queue_time", queue_time)
+        trace_logger.debug("Tool %s waited %.3fs before running.", self.name, queue_time)
         return result
 
+    def _concurrency_limit(self) -> AsyncContextManager[Any]:
+        if self._max_concurrency is None:
+            return contextlib.nullcontext()
+        # Semaphores are bound to the event loop they are used in.
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore[0] is not loop:
+            self._semaphore = (loop, asyncio.Semaphore(self._max_concurrency))
+        return self._semaphore[1]
+
+    def _get_executor(self) -> Executor | None:
+        if self._executor_type == "default":
+            return None
+        if self._executor is None:
+            if self._executor_type == "thread":
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrency, thread_name_prefix=f"FunctionTool-{self.name}"
+                )
+            else:
+                self._executor = ProcessPoolExecutor(max_workers=self._max_concurrency)
+            # Shut down the dedicated pool along with the tool.
+            weakref.finalize(self, self._executor.shutdown, wait=False)
+        return self._executor
+
     def _to_config(self) -> FunctionToolConfig:
         return FunctionToolConfig(
             source_code=dedent(to_code(self._func)),
@@ -138,6 +203,8 @@ def _to_config(self) -> FunctionToolConfig:
             name=self.name,
             description=self.description,
             has_cancellation_support=self._has_cancellation_support,
+            executor=self._executor_type,
+            max_concurrency=self._max_concurrency,
         )
 
     @classmethod
@@ -178,4 +245,23 @@ def _from_config(cls, config: FunctionToolConfig) -> Self:
         if not callable(func):
             raise TypeError(f"Expected function but got {type(func)}")
 
-        return cls(func, name=config.name, description=config.description, global_imports=config.global_imports)
+        # The function is defined in a fresh namespace rather than a module, so it cannot be pickled
+        # to a worker process.
+        executor = config.executor
+        if executor == "process":
+            warnings.warn(
+                f"FunctionTool {config.name} loaded from config cannot run in a process pool, "
+                "running it in a dedicated thread pool instead.",
+                UserWarning,
+                stacklevel=2,
+            )
+            executor = "thread"
+
+        return cls(
+            func,
+            name=config.name,
+            description=config.description,
+            global_imports=config.global_imports,
+            executor=executor,
+            max_concurrency=config.max_concurrency,
+        )
@@ -28,13 +28,18 @@ class StaticWorkbench(Workbench, Component[StaticWorkbenchConfig]):
     Args:
         tools (List[BaseTool[Any, Any]]): A list of tools to be included in the workbench.
             The tools should be subclasses of :class:`~autogen_core.tools.BaseTool`.
+            The list is copied, so changing it after the workbench is created has no effect.
     """
 
     component_provider_override = "autogen_core.tools.StaticWorkbench"
     component_config_schema = StaticWorkbenchConfig
 
     def __init__(self, tools: List[BaseTool[Any, Any]]) -> None:
-        self._tools = tools
+        self._tools = list(tools)
+        # Index the tools by name, the first tool wins if names collide.
+        self._tools_by_name: Dict[str, BaseTool[Any, Any]] = {}
+        for tool in self._tools:
+            self._tools_by_name.setdefault(tool.name, tool)
 
     async def list_tools(self) -> List[ToolSchema]:
         return [tool.schema for tool in self._tools]
@@ -42,7 +47,7 @@ async def list_tools(self) -> List[ToolSchema]:
     async def call_tool(
         self, name: str, arguments: Mapping[str, Any] | None = None, cancellation_token: CancellationToken | None = None
     ) -> ToolResult:
-        tool = next((tool for tool in self._tools if tool.name == name), None)
+        tool = self._tools_by_name.get(name)
         if tool is None:
             return ToolResult(
                 name=name,
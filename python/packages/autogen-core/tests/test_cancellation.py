@@ -1,4 +1,6 @@
 import asyncio
+import logging
+import tracemalloc
 from dataclasses import dataclass
 
 import pytest
@@ -158,3 +160,53 @@ async def test_nested_cancellation_inner_called() -> None:
     long_running_agent = await runtime.try_get_underlying_agent_instance(long_running_id, type=LongRunningAgent)
     assert long_running_agent.called
     assert long_running_agent.cancelled
+
+
+@pytest.mark.asyncio
+async def test_link_future_unregisters_done_futures() -> None:
+    token = CancellationToken()
+    done = asyncio.get_running_loop().create_future()
+    pending = asyncio.get_running_loop().create_future()
+    token.link_future(done)
+    token.link_future(pending)
+    assert len(token._callbacks) == 2  # type: ignore
+
+    done.set_result(None)
+    await asyncio.sleep(0)
+    assert len(token._callbacks) == 1  # type: ignore
+
+    token.cancel()
+    assert pending.cancelled()
+    assert len(token._callbacks) == 0  # type: ignore
+
+    # Futures linked after cancellation are cancelled right away.
+    late = asyncio.get_running_loop().create_future()
+    token.link_future(late)
+    assert late.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_link_future_memory_growth() -> None:
+    """Benchmark the memory held by a long-lived token over a 10k-turn run, linking one future per turn."""
+    token = CancellationToken()
+    num_turns = 10_000
+
+    async def turn() -> None:
+        await asyncio.sleep(0)
+
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        for _ in range(num_turns):
+            await token.link_future(asyncio.ensure_future(turn()))
+        await asyncio.sleep(0)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    logging.getLogger(__name__).info(
+        f"Linked {num_turns} futures: retained {(current - baseline) / 1024:.1f} KiB, peak {(peak - baseline) / 1024:.1f} KiB"
+    )
+    assert len(token._callbacks) == 0  # type: ignore
+    # Completed futures are not retained by the token.
+    assert current - baseline < 256 * 1024
@@ -0,0 +1,62 @@
+import base64
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+from autogen_core import Image
+from PIL import Image as PILImage
+
+
+def _encode(pil_image: PILImage.Image, format: str) -> bytes:
+    buffered = BytesIO()
+    pil_image.save(buffered, format=format)
+    return buffered.getvalue()
+
+
+def test_image_keeps_original_encoding(tmp_path: Path) -> None:
+    jpeg = _encode(PILImage.new("RGB", (10, 20), color="red"), "JPEG")
+    jpeg_base64 = base64.b64encode(jpeg).decode("utf-8")
+    path = tmp_path / "image.jpg"
+    path.write_bytes(jpeg)
+
+    for image in [
+        Image.from_bytes(jpeg),
+        Image.from_base64(jpeg_base64),
+        Image.from_uri(f"data:image/jpeg;base64,{jpeg_base64}"),
+        Image.from_file(path),
+    ]:
+        assert image.mime_type == "image/jpeg"
+        assert image.to_bytes() == jpeg
+        assert image.to_base64() == jpeg_base64
+        assert image.data_uri == f"data:image/jpeg;base64,{jpeg_base64}"
+        # Decoded only when the pixels are needed.
+        assert image.image.size == (10, 20)
+        assert image.image.mode == "RGB"
+        assert image.to_base64() == jpeg_base64
+
+
+def test_image_from_pil_is_encoded_once() -> None:
+    image = Image.from_pil(PILImage.new("RGBA", (5, 5)))
+    assert image.image.mode == "RGB"
+    assert image.mime_type == "image/png"
+    first = image.to_base64()
+    assert image.to_base64() is first
+    assert base64.b64decode(first).startswith(b"\x89PNG")
+
+    # Replacing the image invalidates the encoded form.
+    image.image = PILImage.new("RGB", (7, 7))
+    assert image.to_base64() != first
+    assert Image.from_base64(image.to_base64()).image.size == (7, 7)
+
+
+def test_image_other_formats_are_converted_to_png() -> None:
+    bmp = _encode(PILImage.new("RGB", (3, 4)), "BMP")
+    image = Image.from_bytes(bmp)
+    assert image.mime_type == "image/png"
+    assert image.to_bytes().startswith(b"\x89PNG")
+    assert image.image.size == (3, 4)
+
+
+def test_image_invalid_base64() -> None:
+    with pytest.raises(ValueError):
+        Image.from_base64("not an image")
@@ -183,3 +183,17 @@ def model_info(self) -> ModelInfo:
     assert isinstance(messages[1], FunctionExecutionResultMessage)
     assert isinstance(messages[2], AssistantMessage)
     await runtime.stop()
+
+
+@pytest.mark.asyncio
+async def test_tool_agent_copies_tools() -> None:
+    pass_tool = FunctionTool(_pass_function, name="pass", description="Pass function")
+    raise_tool = FunctionTool(_raise_function, name="raise", description="Raise function")
+    tools: List[Tool] = [pass_tool]
+    agent = ToolAgent(description="Tool agent", tools=tools)
+
+    # Changing the given list, or the one returned by the tools property, does not change the agent's tools.
+    tools.append(raise_tool)
+    agent.tools.append(raise_tool)
+    tools.remove(pass_tool)
+    assert agent.tools == [pass_tool]
@@ -1,4 +1,7 @@
+import asyncio
 import inspect
+import threading
+import time
 from dataclasses import dataclass
 from functools import partial
 from typing import Annotated, List
@@ -70,6 +73,24 @@ def test_tool_schema_generation() -> None:
     assert len(schema["parameters"]["properties"]) == 1
 
 
+def test_tool_schema_cached() -> None:
+    tool = MyTool()
+    schema = tool.schema
+    assert tool._schema_cache is not None  # type: ignore
+    cached = tool._schema_cache[1]  # type: ignore
+
+    # Modifying the returned schema does not affect the cache.
+    assert "parameters" in schema
+    schema["parameters"]["properties"]["query"]["description"] = "Changed."
+    assert tool.schema == tool.schema
+    assert tool._schema_cache[1] is cached  # type: ignore
+    assert tool.schema["parameters"]["properties"]["query"]["description"] == "The description."  # type: ignore
+
+    # The cache is invalidated when the tool changes.
+    tool._description = "New description."  # type: ignore
+    assert tool.schema.get("description") == "New description."
+
+
 def test_func_tool_schema_generation() -> None:
     def my_function(arg: str, other: Annotated[int, "int arg"], nonrequired: int = 5) -> MyResult:
         return MyResult(result="test")
@@ -589,3 +610,72 @@ async def test_func_tool_with_dataclass_conversion_failure() -> None:
 
     with pytest.raises(ValidationError, match="Field required"):
         await tool.run_json(test_input, CancellationToken())
+
+
+def _square(x: int) -> int:
+    return x * x
+
+
+def _slow_thread_name(x: int) -> str:
+    time.sleep(0.05)
+    return threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_func_tool_executors() -> None:
+    # Dedicated thread pool, with at most one call at a time.
+    thread_tool = FunctionTool(_slow_thread_name, description="Slow", executor="thread", max_concurrency=1)
+    results = await asyncio.gather(*[thread_tool.run_json({"x": i}, CancellationToken()) for i in range(2)])
+    assert all(name.startswith("FunctionTool-_slow_thread_name") for name in results)
+    assert thread_tool._executor is not None and thread_tool._executor._max_workers == 1  # type: ignore
+
+    # Inline on the event loop.
+    inline_tool = FunctionTool(_slow_thread_name, description="Slow", executor="inline")
+    assert await inline_tool.run_json({"x": 1}, CancellationToken()) == threading.current_thread().name
+
+    # Process pool for picklable functions.
+    process_tool = FunctionTool(_square, description="Square", executor="process", max_concurrency=2)
+    assert await process_tool.run_json({"x": 3}, CancellationToken()) == 9
+
+    # The executor policy is part of the config.
+    config = process_tool.dump_component()
+    assert config.config["executor"] == "process"
+    assert config.config["max_concurrency"] == 2
+
+    # A loaded function cannot be pickled, so a loaded process tool runs in a thread pool instead.
+    with pytest.warns(UserWarning, match="process pool"):
+        loaded_tool = FunctionTool.load_component(config, FunctionTool)
+    assert loaded_tool._executor_type == "thread"  # type: ignore[reportPrivateUsage]
+    assert await loaded_tool.run_json({"x": 4}, CancellationToken()) == 16
+
+    async def async_func(x: int) -> int:
+        return x
+
+    def func_with_token(x: int, cancellation_token: CancellationToken) -> int:
+        return x
+
+    with pytest.raises(ValueError):
+        FunctionTool(async_func, description="Async", executor="thread")
+    with pytest.raises(ValueError):
+        FunctionTool(func_with_token, description="Token", executor="process")
+    with pytest.raises(ValueError):
+        FunctionTool(_square, description="Square", max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_func_tool_max_concurrency() -> None:
+    running = 0
+    max_running = 0
+
+    async def work(x: int) -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return x
+
+    tool = FunctionTool(work, description="Work", max_concurrency=2)
+    results = await asyncio.gather(*[tool.run_json({"x": i}, CancellationToken()) for i in range(6)])
+    assert results == list(range(6))
+    assert max_running == 2
@@ -1,8 +1,8 @@
-from typing import Annotated
+from typing import Annotated, Any, List
 
 import pytest
 from autogen_core.code_executor import ImportFromModule
-from autogen_core.tools import FunctionTool, StaticWorkbench, Workbench
+from autogen_core.tools import BaseTool, FunctionTool, StaticWorkbench, Workbench
 
 
 @pytest.mark.asyncio
@@ -27,7 +27,11 @@ def test_tool_func_2(x: Annotated[int, "The number to add 2."]) -> int:
     )
 
     # Create a StaticWorkbench instance with the test tools.
-    async with StaticWorkbench(tools=[test_tool_1, test_tool_2]) as workbench:
+    tools_list: List[BaseTool[Any, Any]] = [test_tool_1, test_tool_2]
+    async with StaticWorkbench(tools=tools_list) as workbench:
+        # The workbench keeps its own copy of the list.
+        tools_list.remove(test_tool_2)
+
         # List tools
         tools = await workbench.list_tools()
         assert len(tools) == 2
@@ -68,6 +72,11 @@ def test_tool_func_2(x: Annotated[int, "The number to add 2."]) -> int:
         assert result_2.to_text() == "This is a test error"
         assert result_2.is_error is True
 
+        # Call unknown tool
+        result_3 = await workbench.call_tool("unknown_tool", {"x": 5})
+        assert result_3.is_error is True
+        assert result_3.to_text() == "Tool unknown_tool not found."
+
         # Save state.
         state = await workbench.save_state()
         assert state["type"] == "StaticWorkbenchState"
@@ -0,0 +1,376 @@
+import asyncio
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Set
+
+from autogen_core import EVENT_LOGGER_NAME
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36 Edg/122.0.0.0"
+
+PAGE_SCRIPT_PATH = os.path.join(os.path.abspath(os.path.dirname(__file__)), "page_script.js")
+
+logger = logging.getLogger(EVENT_LOGGER_NAME + ".BrowserPool")
+
+
+@dataclass(eq=False)
+class _PooledBrowser:
+    browser: Browser
+    contexts: Set[BrowserContext] = field(default_factory=set)
+    idle: List[BrowserContext] = field(default_factory=list)
+    # Contexts being created in slots reserved on this browser.
+    pending: int = 0
+    served: int = 0
+    retired: bool = False
+
+    @property
+    def load(self) -> int:
+        return len(self.contexts) + len(self.idle) + self.pending
+
+
+class BrowserPool:
+    """
+    A pool of shared Playwright browsers that hands out isolated :class:`~playwright.async_api.BrowserContext` objects.
+
+    Launching a browser per agent is slow and memory hungry. Instead, several
+    :class:`~autogen_ext.agents.web_surfer.MultimodalWebSurfer` agents can share a small number of
+    browsers, each agent getting its own context (cookies, storage and pages are isolated per context).
+
+    Browsers are launched lazily, up to ``max_browsers``, and each serves at most
+    ``max_contexts_per_browser`` contexts at a time. When all browsers are full, :meth:`acquire`
+    waits until a context is released. A browser is recycled (closed once its last context is
+    released, while a fresh one takes over) after it has served ``max_contexts_per_browser_lifetime``
+    contexts, which bounds memory growth, or when it crashes or disconnects.
+
+    The ``page_script.js`` used by the web surfer is injected once per context, so every page
+    opened in a pooled context has it available.
+
+    Args:
+        max_browsers (int, optional): The maximum number of browsers to launch. Defaults to 1.
+        max_contexts_per_browser (int, optional): The maximum number of contexts in use per browser. Defaults to 8.
+        warm_contexts (int, optional): The number of contexts to keep pre-created so that :meth:`acquire` returns immediately. Defaults to 0.
+        max_contexts_per_browser_lifetime (int, optional): Recycle a browser after it served this many contexts. Defaults to None, never recycle.
+        headless (bool, optional): Whether the browsers should be headless. Defaults to True.
+        browser_channel (str, optional): The browser channel. Defaults to None.
+        context_args (Dict[str, Any], optional): Extra keyword arguments for ``Browser.new_context``. Defaults to None.
+        playwright (Playwright, optional): The playwright instance. Defaults to None, a new instance is started and owned by the pool.
+
+    Example usage:
+
+    .. code-block:: python
+
+        import asyncio
+
+        from autogen_agentchat.ui import Console
+        from autogen_ext.agents.web_surfer import BrowserPool, MultimodalWebSurfer
+        from autogen_ext.models.openai import OpenAIChatCompletionClient
+
+
+        async def main() -> None:
+            model_client = OpenAIChatCompletionClient(model="gpt-4o-2024-08-06")
+            async with BrowserPool(max_browsers=2, max_contexts_per_browser=10, warm_contexts=2) as pool:
+                surfers = [
+                    MultimodalWebSurfer(f"WebSurfer{i}", model_client=model_client, browser_pool=pool) for i in range(4)
+                ]
+                await asyncio.gather(*[Console(s.run_stream(task="What is the weather in Seattle?")) for s in surfers])
+                for surfer in surfers:
+                    await surfer.close()
+
+
+        asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        max_browsers: int = 1,
+        max_contexts_per_browser: int = 8,
+        warm_contexts: int = 0,
+        max_contexts_per_browser_lifetime: int | None = None,
+        headless: bool = True,
+        browser_channel: str | None = None,
+        context_args: Dict[str, Any] | None = None,
+        playwright: Playwright | None = None,
+    ) -> None:
+        if max_browsers < 1:
+            raise ValueError("max_browsers must be at least 1.")
+        if max_contexts_per_browser < 1:
+            raise ValueError("max_contexts_per_browser must be at least 1.")
+        if warm_contexts < 0 or warm_contexts > max_browsers * max_contexts_per_browser:
+            raise ValueError("warm_contexts must be between 0 and max_browsers * max_contexts_per_browser.")
+        if max_contexts_per_browser_lifetime is not None and max_contexts_per_browser_lifetime < 1:
+            raise ValueError("max_contexts_per_browser_lifetime must be at least 1.")
+
+        self._max_browsers = max_browsers
+        self._max_contexts_per_browser = max_contexts_per_browser
+        self._warm_contexts = warm_contexts
+        self._max_contexts_per_browser_lifetime = max_contexts_per_browser_lifetime
+        self._headless = headless
+        self._browser_channel = browser_channel
+        self._context_args: Dict[str, Any] = {"user_agent": DEFAULT_USER_AGENT, **(context_args or {})}
+        self._playwright = playwright
+        self._owns_playwright = playwright is None
+        self._browsers: List[_PooledBrowser] = []
+        self._context_owner: Dict[BrowserContext, _PooledBrowser] = {}
+        self._condition = asyncio.Condition()
+        self._start_lock = asyncio.Lock()
+        # Browsers being launched, and warm contexts being created, outside of the lock.
+        self._num_launching = 0
+        self._num_warming = 0
+        self._warm_up_task: asyncio.Task[None] | None = None
+        self._closed = False
+
+    async def __aenter__(self) -> "BrowserPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Start playwright (if not provided) and pre-create the warm contexts."""
+        if self._closed:
+            raise RuntimeError("The browser pool is closed.")
+        async with self._start_lock:
+            # Concurrent first calls must not each start a playwright instance.
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+        await self._warm_up()
+
+    async def acquire(self) -> BrowserContext:
+        """Get an isolated browser context, waiting for capacity if all browsers are full."""
+        if self._closed:
+            raise RuntimeError("The browser pool is closed.")
+        if self._playwright is None:
+            await self.start()
+
+        while True:
+            # Reserve a context slot, or a browser slot, under the lock. The slow launch and context
+            # creation happen outside of it, so that other calls are not held up.
+            async with self._condition:
+                while True:
+                    if self._closed:
+                        raise RuntimeError("The browser pool is closed.")
+                    # Prefer a warm context.
+                    for warm in self._browsers:
+                        if warm.idle:
+                            context = warm.idle.pop()
+                            warm.contexts.add(context)
+                            self._schedule_warm_up()
+                            return context
+
+                    # Otherwise, the least loaded browser that has capacity, or a new browser.
+                    pooled = self._least_loaded()
+                    if pooled is not None:
+                        self._reserve(pooled)
+                        break
+                    if self._num_active_browsers() + self._num_launching < self._max_browsers:
+                        self._num_launching += 1
+                        break
+                    await self._condition.wait()
+
+            if pooled is None:
+                pooled = await self._launch()
+            new_context = await self._new_context(pooled, idle=False)
+            if new_context is not None:
+                return new_context
+            # The browser went away in the meantime, try again.
+
+    async def release(self, context: BrowserContext) -> None:
+        """Return a context to the pool. The context is closed so that no state leaks into later sessions."""
+        to_close: _PooledBrowser | None = None
+        async with self._condition:
+            pooled = self._context_owner.pop(context, None)
+            if pooled is not None:
+                pooled.contexts.discard(context)
+                if pooled.retired and len(pooled.contexts) == 0 and pooled.pending == 0:
+                    self._forget_browser(pooled)
+                    to_close = pooled
+            self._condition.notify_all()
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser context: {e}")
+        if to_close is not None:
+            await self._close_browser(to_close)
+        self._schedule_warm_up()
+
+    async def close(self) -> None:
+        """Close all contexts and browsers, and stop playwright if it is owned by the pool."""
+        self._closed = True
+        if self._warm_up_task is not None:
+            self._warm_up_task.cancel()
+            try:
+                await self._warm_up_task
+            except asyncio.CancelledError:
+                pass
+            self._warm_up_task = None
+        async with self._condition:
+            browsers = list(self._browsers)
+            for pooled in browsers:
+                self._forget_browser(pooled)
+            self._context_owner.clear()
+            self._condition.notify_all()
+        for pooled in browsers:
+            await self._close_browser(pooled)
+        if self._owns_playwright and self._playwright is not None:
+            await self._playwright.stop()
+        self._playwright = None
+
+    @property
+    def num_browsers(self) -> int:
+        """The number of running browsers."""
+        return len(self._browsers)
+
+    @property
+    def num_contexts(self) -> int:
+        """The number of contexts currently handed out."""
+        return sum(len(pooled.contexts) for pooled in self._browsers)
+
+    def _num_active_browsers(self) -> int:
+        # Retired browsers are draining and do not count towards the limit, so they can be replaced right away.
+        return sum(1 for pooled in self._browsers if not pooled.retired)
+
+    def _least_loaded(self) -> _PooledBrowser | None:
+        candidates = [
+            pooled
+            for pooled in self._browsers
+            if not pooled.retired and pooled.load < self._max_contexts_per_browser and pooled.browser.is_connected()
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda pooled: pooled.load)
+
+    def _reserve(self, pooled: _PooledBrowser) -> None:
+        # Reserves a context slot on the browser, under the lock. The context is counted as served right
+        # away, so that concurrent reservations cannot exceed the browser lifetime.
+        pooled.pending += 1
+        pooled.served += 1
+        if (
+            self._max_contexts_per_browser_lifetime is not None
+            and pooled.served >= self._max_contexts_per_browser_lifetime
+        ):
+            pooled.retired = True
+
+    async def _launch(self) -> _PooledBrowser:
+        # Launches a browser for a slot reserved by incrementing _num_launching, and reserves a context slot on it.
+        assert self._playwright is not None
+        launch_args: Dict[str, Any] = {"headless": self._headless}
+        if self._browser_channel is not None:
+            launch_args["channel"] = self._browser_channel
+        try:
+            browser = await self._playwright.chromium.launch(**launch_args)
+        except BaseException:
+            async with self._condition:
+                self._num_launching -= 1
+                self._condition.notify_all()
+            raise
+
+        pooled = _PooledBrowser(browser=browser)
+        async with self._condition:
+            self._num_launching -= 1
+            if not self._closed:
+                browser.on("disconnected", lambda _: self._on_disconnected(pooled))
+                self._browsers.append(pooled)
+                self._reserve(pooled)
+            # Waiters may use the rest of the new browser.
+            self._condition.notify_all()
+        if self._closed:
+            await self._close_browser(pooled)
+            raise RuntimeError("The browser pool is closed.")
+        return pooled
+
+    async def _new_context(self, pooled: _PooledBrowser, idle: bool) -> BrowserContext | None:
+        # Creates a context in a slot reserved with _reserve, and hands it out or adds it to the warm contexts.
+        # Returns None if the browser went away in the meantime.
+        try:
+            context = await pooled.browser.new_context(**self._context_args)
+            await context.add_init_script(path=PAGE_SCRIPT_PATH)
+        except BaseException:
+            async with self._condition:
+                pooled.pending -= 1
+                self._condition.notify_all()
+            if pooled not in self._browsers and not self._closed:
+                return None
+            raise
+
+        async with self._condition:
+            pooled.pending -= 1
+            available = pooled in self._browsers
+            if available:
+                self._context_owner[context] = pooled
+                if idle:
+                    pooled.idle.append(context)
+                else:
+                    pooled.contexts.add(context)
+            self._condition.notify_all()
+        if available:
+            return context
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser context: {e}")
+        if self._closed:
+            raise RuntimeError("The browser pool is closed.")
+        return None
+
+    def _forget_browser(self, pooled: _PooledBrowser) -> None:
+        # Removes the browser from the pool, under the lock. It is then closed with _close_browser.
+        if pooled in self._browsers:
+            self._browsers.remove(pooled)
+        for context in pooled.idle:
+            self._context_owner.pop(context, None)
+        pooled.idle.clear()
+
+    async def _close_browser(self, pooled: _PooledBrowser) -> None:
+        try:
+            await pooled.browser.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser: {e}")
+
+    def _on_disconnected(self, pooled: _PooledBrowser) -> None:
+        # The browser crashed or was closed: forget it so that a new one is launched on demand.
+        if pooled in self._browsers:
+            logger.warning("A pooled browser disconnected, it will be replaced.")
+            self._browsers.remove(pooled)
+        for context in list(pooled.contexts) + pooled.idle:
+            self._context_owner.pop(context, None)
+        pooled.idle.clear()
+
+        async def notify() -> None:
+            async with self._condition:
+                self._condition.notify_all()
+
+        if not self._closed:
+            asyncio.ensure_future(notify())
+            self._schedule_warm_up()
+
+    def _schedule_warm_up(self) -> None:
+        if self._warm_contexts == 0 or self._closed:
+            return
+        if self._warm_up_task is None or self._warm_up_task.done():
+            self._warm_up_task = asyncio.create_task(self._warm_up())
+
+    async def _warm_up(self) -> None:
+        while True:
+            async with self._condition:
+                if self._closed:
+                    return
+                num_idle = sum(len(pooled.idle) for pooled in self._browsers) + self._num_warming
+                if num_idle >= self._warm_contexts:
+                    return
+                pooled = self._least_loaded()
+                if pooled is not None:
+                    self._reserve(pooled)
+                elif self._num_active_browsers() + self._num_launching < self._max_browsers:
+                    self._num_launching += 1
+                else:
+                    return
+                self._num_warming += 1
+            try:
+                if pooled is None:
+                    pooled = await self._launch()
+                await self._new_context(pooled, idle=True)
+            finally:
+                async with self._condition:
+                    self._num_warming -= 1
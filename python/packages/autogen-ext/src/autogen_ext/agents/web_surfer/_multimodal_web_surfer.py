@@ -17,6 +17,7 @@
     List,
     Optional,
     Sequence,
+    Tuple,
 )
 from urllib.parse import quote_plus
 
@@ -37,11 +38,11 @@
     SystemMessage,
     UserMessage,
 )
-from PIL import Image
 from playwright.async_api import BrowserContext, Download, Page, Playwright, async_playwright
 from pydantic import BaseModel
 from typing_extensions import Self
 
+from ._browser_pool import DEFAULT_USER_AGENT, PAGE_SCRIPT_PATH, BrowserPool
 from ._events import WebSurferEvent
 from ._prompts import (
     WEB_SURFER_QA_PROMPT,
@@ -63,12 +64,39 @@
     TOOL_VISIT_URL,
     TOOL_WEB_SEARCH,
 )
-from ._types import InteractiveRegion, UserContent
+from ._types import InteractiveRegion, PageSnapshot, UserContent
 from .playwright_controller import PlaywrightController
 
 DEFAULT_CONTEXT_SIZE = 128000
 
 
+def _render_set_of_mark(
+    screenshot: bytes,
+    rects: Dict[str, InteractiveRegion],
+    size: Tuple[int, int] | None,
+    save_path: str | None,
+) -> Tuple[AGImage, List[str], List[str], List[str]]:
+    """Render the set-of-mark screenshot. CPU bound, so it is run off the event loop."""
+    som_screenshot, visible_rects, rects_above, rects_below = add_set_of_mark(screenshot, rects, size)
+    if save_path is not None:
+        som_screenshot.save(save_path)
+    image = AGImage.from_pil(som_screenshot)
+    som_screenshot.close()
+    return image, visible_rects, rects_above, rects_below
+
+
+def _decode_screenshot(screenshot: bytes, size: Tuple[int, int] | None = None) -> AGImage:
+    """Decode (and optionally scale) a screenshot. CPU bound, so it is run off the event loop."""
+    image: PIL.Image.Image = PIL.Image.open(io.BytesIO(screenshot))
+    if size is not None:
+        scaled = image.resize(size)
+        image.close()
+        image = scaled
+    result = AGImage.from_pil(image)
+    image.close()
+    return result
+
+
 class MultimodalWebSurferConfig(BaseModel):
     name: str
     model_client: ComponentModel
@@ -83,6 +111,7 @@ class MultimodalWebSurferConfig(BaseModel):
     browser_channel: str | None = None
     browser_data_dir: str | None = None
     to_resize_viewport: bool = True
+    screenshot_max_age: float = 10.0
 
 
 class MultimodalWebSurfer(BaseChatAgent, Component[MultimodalWebSurferConfig]):
@@ -103,7 +132,7 @@ class MultimodalWebSurfer(BaseChatAgent, Component[MultimodalWebSurferConfig]):
     When :meth:`on_messages` or :meth:`on_messages_stream` is called, the following occurs:
         1) If this is the first call, the browser is initialized and the page is loaded. This is done in :meth:`_lazy_init`. The browser is only closed when :meth:`close` is called.
         2) The method :meth:`_generate_reply` is called, which then creates the final response as below.
-        3) The agent takes a screenshot of the page, extracts the interactive elements, and prepares a set-of-mark screenshot with bounding boxes around the interactive elements.
+        3) The agent takes a screenshot of the page, extracts the interactive elements, and prepares a set-of-mark screenshot with bounding boxes around the interactive elements. The screenshot is rendered at the model resolution off the event loop, and is reused when the page has not changed since the previous step. Changes are detected from DOM mutations, the URL and the viewport, so changes to the pixels alone (e.g., canvas, video, CSS animations or images still loading) are missed; a capture is therefore reused for at most ``screenshot_max_age`` seconds.
         4) The agent makes a call to the :attr:`model_client` with the SOM screenshot, history of messages, and the list of available tools.
             - If the model returns a string, the agent returns the string as the final response.
             - If the model returns a list of tool calls, the agent executes the tool calls with :meth:`_execute_tool` using :attr:`_playwright_controller`.
@@ -144,6 +173,8 @@ class MultimodalWebSurfer(BaseChatAgent, Component[MultimodalWebSurferConfig]):
         to_resize_viewport (bool, optional): Whether to resize the viewport. Defaults to True.
         playwright (Playwright, optional): The playwright instance. Defaults to None.
         context (BrowserContext, optional): The browser context. Defaults to None.
+        browser_pool (BrowserPool, optional): A pool of shared browsers to take the browser context from, instead of launching a browser for this agent. The context is returned to the pool on :meth:`close`. Defaults to None.
+        screenshot_max_age (float, optional): The number of seconds a screenshot may be reused while the page shows no DOM, URL or viewport change. Set it to 0 to take a new screenshot at every step, e.g. for pages with canvas, video or animated content. Defaults to 10.
 
 
 
@@ -223,6 +254,8 @@ def __init__(
         to_resize_viewport: bool = True,
         playwright: Playwright | None = None,
         context: BrowserContext | None = None,
+        browser_pool: BrowserPool | None = None,
+        screenshot_max_age: float = 10.0,
     ):
         """
         Initialize the MultimodalWebSurfer.
@@ -232,6 +265,8 @@ def __init__(
             raise ValueError(
                 "Cannot save screenshots without a debug directory. Set it using the 'debug_dir' parameter. The debug directory is created if it does not exist."
             )
+        if browser_pool is not None and (context is not None or browser_data_dir is not None):
+            raise ValueError("A browser pool cannot be combined with a browser context or a browser data directory.")
         if model_client.model_info["function_calling"] is False:
             raise ValueError(
                 "The model does not support function calling. MultimodalWebSurfer requires a model that supports function calling."
@@ -248,13 +283,23 @@ def __init__(
         self.use_ocr = use_ocr
         self.to_resize_viewport = to_resize_viewport
         self.animate_actions = animate_actions
+        self.screenshot_max_age = screenshot_max_age
 
         # Call init to set these in case not set
         self._playwright: Playwright | None = playwright
         self._context: BrowserContext | None = context
+        self._browser_pool = browser_pool
         self._page: Page | None = None
         self._last_download: Download | None = None
         self._prior_metadata_hash: str | None = None
+        # The last screenshot, the page state it was captured in, and the set-of-mark rendering derived from it.
+        # They let a step reuse the previous capture when neither the DOM nor the viewport changed,
+        # as long as it is not older than screenshot_max_age.
+        self._screenshot: bytes | None = None
+        self._screenshot_state: Tuple[Any, ...] | None = None
+        self._screenshot_time = 0.0
+        self._som_key: str | None = None
+        self._som: Tuple[AGImage, List[str], List[str], List[str]] | None = None
         self.logger = logging.getLogger(EVENT_LOGGER_NAME + f".{self.name}.MultimodalWebSurfer")
         self._chat_history: List[LLMMessage] = []
 
@@ -310,25 +355,28 @@ async def _lazy_init(
 
         self._last_download = None
         self._prior_metadata_hash = None
+        self._clear_screenshot_cache()
 
-        # Create the playwright self
-        launch_args: Dict[str, Any] = {"headless": self.headless}
-        if self.browser_channel is not None:
-            launch_args["channel"] = self.browser_channel
-        if self._playwright is None:
-            self._playwright = await async_playwright().start()
-
-        # Create the context -- are we launching persistent?
-        if self._context is None:
-            if self.browser_data_dir is None:
-                browser = await self._playwright.chromium.launch(**launch_args)
-                self._context = await browser.new_context(
-                    user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36 Edg/122.0.0.0"
-                )
-            else:
-                self._context = await self._playwright.chromium.launch_persistent_context(
-                    self.browser_data_dir, **launch_args
-                )
+        if self._browser_pool is not None:
+            # The pool owns the browsers and injects the page script into its contexts
+            self._context = await self._browser_pool.acquire()
+        else:
+            # Create the playwright self
+            launch_args: Dict[str, Any] = {"headless": self.headless}
+            if self.browser_channel is not None:
+                launch_args["channel"] = self.browser_channel
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+
+            # Create the context -- are we launching persistent?
+            if self._context is None:
+                if self.browser_data_dir is None:
+                    browser = await self._playwright.chromium.launch(**launch_args)
+                    self._context = await browser.new_context(user_agent=DEFAULT_USER_AGENT)
+                else:
+                    self._context = await self._playwright.chromium.launch_persistent_context(
+                        self.browser_data_dir, **launch_args
+                    )
 
         # Create the page
         self._context.set_default_timeout(60000)  # One minute
@@ -338,9 +386,8 @@ async def _lazy_init(
         self._page.on("download", self._download_handler)
         if self.to_resize_viewport:
             await self._page.set_viewport_size({"width": self.VIEWPORT_WIDTH, "height": self.VIEWPORT_HEIGHT})
-        await self._page.add_init_script(
-            path=os.path.join(os.path.abspath(os.path.dirname(__file__)), "page_script.js")
-        )
+        if self._browser_pool is None:
+            await self._page.add_init_script(path=PAGE_SCRIPT_PATH)
         await self._page.goto(self.start_page)
         await self._page.wait_for_load_state()
 
@@ -357,7 +404,10 @@ async def close(self) -> None:
             await self._page.close()
             self._page = None
         if self._context is not None:
-            await self._context.close()
+            if self._browser_pool is not None:
+                await self._browser_pool.release(self._context)
+            else:
+                await self._context.close()
             self._context = None
         if self._playwright is not None:
             await self._playwright.stop()
@@ -394,6 +444,7 @@ async def on_reset(self, cancellation_token: CancellationToken) -> None:
         assert self._page is not None
 
         self._chat_history.clear()
+        self._clear_screenshot_cache()
         reset_prior_metadata, reset_last_download = await self._playwright_controller.visit_page(
             self._page, self.start_page
         )
@@ -487,23 +538,12 @@ async def _generate_reply(self, cancellation_token: CancellationToken) -> UserCo
         ]:
             history = []
 
-        # Ask the page for interactive elements, then prepare the state-of-mark screenshot
-        rects = await self._playwright_controller.get_interactive_rects(self._page)
-        viewport = await self._playwright_controller.get_visual_viewport(self._page)
-        screenshot = await self._page.screenshot()
-        som_screenshot, visible_rects, rects_above, rects_below = add_set_of_mark(screenshot, rects)
-
-        if self.to_save_screenshots:
-            current_timestamp = "_" + int(time.time()).__str__()
-            screenshot_png_name = "screenshot_som" + current_timestamp + ".png"
-            som_screenshot.save(os.path.join(self.debug_dir, screenshot_png_name))  # type: ignore
-            self.logger.info(
-                WebSurferEvent(
-                    source=self.name,
-                    url=self._page.url,
-                    message="Screenshot: " + screenshot_png_name,
-                )
-            )
+        # Ask the page for interactive elements (and the rest of its state, in the same round-trip),
+        # then prepare the state-of-mark screenshot
+        snapshot = await self._playwright_controller.get_page_snapshot(self._page)
+        rects = snapshot["interactive_rects"]
+        viewport = snapshot["visual_viewport"]
+        som_screenshot, visible_rects, rects_above, rects_below = await self._get_som_screenshot(snapshot)
         # What tools are available?
         tools = self.default_tools.copy()
 
@@ -516,7 +556,7 @@ async def _generate_reply(self, cancellation_token: CancellationToken) -> UserCo
             tools.append(TOOL_SCROLL_DOWN)
 
         # Focus hint
-        focused = await self._playwright_controller.get_focused_rect_id(self._page)
+        focused = snapshot["focused_element_id"]
         focused_hint = ""
         if focused:
             name = self._target_name(focused, rects)
@@ -553,9 +593,9 @@ async def _generate_reply(self, cancellation_token: CancellationToken) -> UserCo
         else:
             other_targets_str = ""
 
-        state_description = "Your " + await self._get_state_description()
+        state_description = "Your " + await self._get_state_description(snapshot)
         tool_names = "\n".join([t["name"] for t in tools])
-        page_title = await self._page.title()
+        page_title = snapshot["title"]
 
         prompt_message = None
         if self._model_client.model_info["vision"]:
@@ -569,15 +609,9 @@ async def _generate_reply(self, cancellation_token: CancellationToken) -> UserCo
                 url=self._page.url,
             ).strip()
 
-            # Scale the screenshot for the MLM, and close the original
-            scaled_screenshot = som_screenshot.resize((self.MLM_WIDTH, self.MLM_HEIGHT))
-            som_screenshot.close()
-            if self.to_save_screenshots:
-                scaled_screenshot.save(os.path.join(self.debug_dir, "screenshot_scaled.png"))  # type: ignore
-
-            # Create the message
+            # Create the message, the set-of-mark screenshot is already rendered at the MLM resolution
             prompt_message = UserMessage(
-                content=[re.sub(r"(\n\s*){3,}", "\n\n", text_prompt), AGImage.from_pil(scaled_screenshot)],
+                content=[re.sub(r"(\n\s*){3,}", "\n\n", text_prompt), som_screenshot],
                 source=self.name,
             )
         else:
@@ -781,7 +815,8 @@ async def _execute_tool(
             await self._page.wait_for_load_state()
 
         # Handle metadata
-        page_metadata = json.dumps(await self._playwright_controller.get_page_metadata(self._page), indent=4)
+        snapshot = await self._playwright_controller.get_page_snapshot(self._page)
+        page_metadata = json.dumps(snapshot["page_metadata"], indent=4)
         metadata_hash = hashlib.md5(page_metadata.encode("utf-8")).hexdigest()
         if metadata_hash != self._prior_metadata_hash:
             page_metadata = (
@@ -791,7 +826,11 @@ async def _execute_tool(
             page_metadata = ""
         self._prior_metadata_hash = metadata_hash
 
+        # Remember the page state the screenshot was taken in, so the next step can reuse it
         new_screenshot = await self._page.screenshot()
+        self._screenshot = new_screenshot
+        self._screenshot_state = self._get_screenshot_state(snapshot)
+        self._screenshot_time = time.monotonic()
         if self.to_save_screenshots:
             current_timestamp = "_" + int(time.time()).__str__()
             screenshot_png_name = "screenshot" + current_timestamp + ".png"
@@ -807,22 +846,91 @@ async def _execute_tool(
             )
 
         # Return the complete observation
-        state_description = "The " + await self._get_state_description()
+        state_description = "The " + await self._get_state_description(snapshot)
         message_content = (
             f"{action_description}\n\n" + state_description + page_metadata + "\nHere is a screenshot of the page."
         )
 
         return [
             re.sub(r"(\n\s*){3,}", "\n\n", message_content),  # Removing blank lines
-            AGImage.from_pil(PIL.Image.open(io.BytesIO(new_screenshot))),
+            await asyncio.to_thread(_decode_screenshot, new_screenshot),
         ]
 
-    async def _get_state_description(self) -> str:
+    def _clear_screenshot_cache(self) -> None:
+        self._screenshot = None
+        self._screenshot_state = None
+        self._som_key = None
+        self._som = None
+
+    def _get_screenshot_state(self, snapshot: PageSnapshot) -> Tuple[Any, ...]:
+        """Identify what the page currently shows: the document and its DOM mutations, and the scroll position."""
+        assert self._page is not None
+        viewport = snapshot["visual_viewport"]
+        return (
+            self._page.url,
+            snapshot["mutation_epoch"],
+            viewport["pageLeft"],
+            viewport["pageTop"],
+            viewport["width"],
+            viewport["height"],
+        )
+
+    async def _get_som_screenshot(self, snapshot: PageSnapshot) -> Tuple[AGImage, List[str], List[str], List[str]]:
+        """
+        Return the set-of-mark screenshot for the current page, rendered at the MLM resolution.
+        The screenshot is only re-captured when the page changed since the last capture, or the capture
+        is older than screenshot_max_age, and the rendering is only redone when the captured pixels or the
+        interactive regions changed.
+        """
+        assert self._page is not None
+
+        rects = snapshot["interactive_rects"]
+        screenshot_state = self._get_screenshot_state(snapshot)
+        if (
+            self._screenshot is None
+            or screenshot_state != self._screenshot_state
+            or time.monotonic() - self._screenshot_time >= self.screenshot_max_age
+        ):
+            self._screenshot = await self._page.screenshot()
+            self._screenshot_state = screenshot_state
+            self._screenshot_time = time.monotonic()
+
+        size = (self.MLM_WIDTH, self.MLM_HEIGHT) if self._model_client.model_info["vision"] else None
+        som_hash = hashlib.md5(self._screenshot)
+        som_hash.update(json.dumps(rects, sort_keys=True).encode("utf-8"))
+        som_hash.update(str(size).encode("utf-8"))
+        som_key = som_hash.hexdigest()
+        if self._som is not None and som_key == self._som_key:
+            return self._som
+
+        screenshot_png_name: str | None = None
+        save_path: str | None = None
+        if self.to_save_screenshots:
+            current_timestamp = "_" + int(time.time()).__str__()
+            screenshot_png_name = "screenshot_som" + current_timestamp + ".png"
+            save_path = os.path.join(self.debug_dir, screenshot_png_name)  # type: ignore
+
+        self._som = await asyncio.to_thread(_render_set_of_mark, self._screenshot, rects, size, save_path)
+        self._som_key = som_key
+
+        if screenshot_png_name is not None:
+            self.logger.info(
+                WebSurferEvent(
+                    source=self.name,
+                    url=self._page.url,
+                    message="Screenshot: " + screenshot_png_name,
+                )
+            )
+        return self._som
+
+    async def _get_state_description(self, snapshot: PageSnapshot | None = None) -> str:
         assert self._playwright_controller is not None
         assert self._page is not None
+        if snapshot is None:
+            snapshot = await self._playwright_controller.get_page_snapshot(self._page)
 
         # Describe the viewport of the new page in words
-        viewport = await self._playwright_controller.get_visual_viewport(self._page)
+        viewport = snapshot["visual_viewport"]
         percent_visible = int(viewport["height"] * 100 / viewport["scrollHeight"])
         percent_scrolled = int(viewport["pageTop"] * 100 / viewport["scrollHeight"])
         if percent_scrolled < 1:  # Allow some rounding error
@@ -832,10 +940,10 @@ async def _get_state_description(self) -> str:
         else:
             position_text = str(percent_scrolled) + "% down from the top of the page"
 
-        visible_text = await self._playwright_controller.get_visible_text(self._page)
+        visible_text = snapshot["visible_text"]
 
         # Return the complete observation
-        page_title = await self._page.title()
+        page_title = snapshot["title"]
         message_content = f"web browser is open to the page [{page_title}]({self._page.url}).\nThe viewport shows {percent_visible}% of the webpage, and is positioned {position_text}\n"
         message_content += f"The following text is visible in the viewport:\n\n{visible_text}"
         return message_content
@@ -887,10 +995,8 @@ async def _summarize_page(
             pass
 
         # Take a screenshot and scale it
-        screenshot = Image.open(io.BytesIO(await self._page.screenshot()))
-        scaled_screenshot = screenshot.resize((self.MLM_WIDTH, self.MLM_HEIGHT))
-        screenshot.close()
-        ag_image = AGImage.from_pil(scaled_screenshot)
+        screenshot = await self._page.screenshot()
+        ag_image = await asyncio.to_thread(_decode_screenshot, screenshot, (self.MLM_WIDTH, self.MLM_HEIGHT))
 
         # Prepare the system prompt
         messages: List[LLMMessage] = []
@@ -948,7 +1054,6 @@ async def _summarize_page(
         # Generate the response
         response = await self._model_client.create(messages, cancellation_token=cancellation_token)
         self.model_usage.append(response.usage)
-        scaled_screenshot.close()
         assert isinstance(response.content, str)
         return response.content
 
@@ -967,6 +1072,7 @@ def _to_config(self) -> MultimodalWebSurferConfig:
             browser_channel=self.browser_channel,
             browser_data_dir=self.browser_data_dir,
             to_resize_viewport=self.to_resize_viewport,
+            screenshot_max_age=self.screenshot_max_age,
         )
 
     @classmethod
@@ -985,4 +1091,5 @@ def _from_config(cls, config: MultimodalWebSurferConfig) -> Self:
             browser_channel=config.browser_channel,
             browser_data_dir=config.browser_data_dir,
             to_resize_viewport=config.to_resize_viewport,
+            screenshot_max_age=config.screenshot_max_age,
         )
@@ -1,6 +1,6 @@
 import io
 import random
-from typing import BinaryIO, Dict, List, Tuple, cast
+from typing import BinaryIO, Dict, List, Optional, Tuple, cast
 
 from PIL import Image, ImageDraw, ImageFont
 
@@ -10,30 +10,47 @@
 
 
 def add_set_of_mark(
-    screenshot: bytes | Image.Image | io.BufferedIOBase, ROIs: Dict[str, InteractiveRegion]
+    screenshot: bytes | Image.Image | io.BufferedIOBase,
+    ROIs: Dict[str, InteractiveRegion],
+    size: Optional[Tuple[int, int]] = None,
 ) -> Tuple[Image.Image, List[str], List[str], List[str]]:
+    """Draw the set-of-mark annotations for ``ROIs`` on ``screenshot``.
+
+    If ``size`` is given, the screenshot is scaled to that size first and the marks are drawn
+    directly at the target resolution, rather than drawing at full resolution and resizing
+    the annotated image afterwards. Region coordinates are always in screenshot pixels.
+    """
     if isinstance(screenshot, Image.Image):
-        return _add_set_of_mark(screenshot, ROIs)
+        return _add_set_of_mark(screenshot, ROIs, size)
 
     if isinstance(screenshot, bytes):
         screenshot = io.BytesIO(screenshot)
 
     # TODO: Not sure why this cast was needed, but by this point screenshot is a binary file-like object
     image = Image.open(cast(BinaryIO, screenshot))
-    comp, visible_rects, rects_above, rects_below = _add_set_of_mark(image, ROIs)
+    comp, visible_rects, rects_above, rects_below = _add_set_of_mark(image, ROIs, size)
     image.close()
     return comp, visible_rects, rects_above, rects_below
 
 
 def _add_set_of_mark(
-    screenshot: Image.Image, ROIs: Dict[str, InteractiveRegion]
+    screenshot: Image.Image, ROIs: Dict[str, InteractiveRegion], size: Optional[Tuple[int, int]] = None
 ) -> Tuple[Image.Image, List[str], List[str], List[str]]:
     visible_rects: List[str] = list()
     rects_above: List[str] = list()  # Scroll up to see
     rects_below: List[str] = list()  # Scroll down to see
 
     fnt = ImageFont.load_default(14)
-    base = screenshot.convert("L").convert("RGBA")
+    width, height = screenshot.size
+    grayscale = screenshot.convert("L")
+    if size is not None and size != screenshot.size:
+        scaled = grayscale.resize(size)
+        grayscale.close()
+        grayscale = scaled
+    base = grayscale.convert("RGBA")
+    grayscale.close()
+    scale_x = base.size[0] / width
+    scale_y = base.size[1] / height
     overlay = Image.new("RGBA", base.size)
 
     draw = ImageDraw.Draw(overlay)
@@ -47,20 +64,35 @@ def _add_set_of_mark(
 
             mid = ((rect["right"] + rect["left"]) / 2.0, (rect["top"] + rect["bottom"]) / 2.0)
 
-            if 0 <= mid[0] and mid[0] < base.size[0]:
+            if 0 <= mid[0] and mid[0] < width:
                 if mid[1] < 0:
                     rects_above.append(r)
-                elif mid[1] >= base.size[1]:
+                elif mid[1] >= height:
                     rects_below.append(r)
                 else:
                     visible_rects.append(r)
-                    _draw_roi(draw, int(r), fnt, rect)
+                    _draw_roi(draw, int(r), fnt, _scale_rect(rect, scale_x, scale_y))
 
     comp = Image.alpha_composite(base, overlay)
     overlay.close()
     return comp, visible_rects, rects_above, rects_below
 
 
+def _scale_rect(rect: DOMRectangle, scale_x: float, scale_y: float) -> DOMRectangle:
+    if scale_x == 1 and scale_y == 1:
+        return rect
+    return DOMRectangle(
+        x=rect["x"] * scale_x,
+        y=rect["y"] * scale_y,
+        width=rect["width"] * scale_x,
+        height=rect["height"] * scale_y,
+        top=rect["top"] * scale_y,
+        right=rect["right"] * scale_x,
+        bottom=rect["bottom"] * scale_y,
+        left=rect["left"] * scale_x,
+    )
+
+
 def _draw_roi(
     draw: ImageDraw.ImageDraw, idx: int, font: ImageFont.FreeTypeFont | ImageFont.ImageFont, rect: DOMRectangle
 ) -> None:
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, TypedDict, Union
+from typing import Any, Dict, List, TypedDict, Union, cast
 
 from autogen_core import FunctionCall, Image
 from autogen_core.models import FunctionExecutionResult
@@ -42,6 +42,16 @@ class InteractiveRegion(TypedDict):
     rects: List[DOMRectangle]
 
 
+class PageSnapshot(TypedDict):
+    mutation_epoch: str
+    title: str
+    focused_element_id: str | None
+    interactive_rects: Dict[str, InteractiveRegion]
+    visual_viewport: VisualViewport
+    page_metadata: Dict[str, Any]
+    visible_text: str
+
+
 # Helper functions for dealing with JSON. Not sure there's a better way?
 
 
@@ -104,3 +114,18 @@ def visualviewport_from_dict(viewport: Dict[str, Any]) -> VisualViewport:
         scrollWidth=_get_number(viewport, "scrollWidth"),
         scrollHeight=_get_number(viewport, "scrollHeight"),
     )
+
+
+def pagesnapshot_from_dict(snapshot: Dict[str, Any]) -> PageSnapshot:
+    focused = snapshot["focusedElementId"]
+    page_metadata = snapshot["pageMetadata"]
+    assert isinstance(page_metadata, dict)
+    return PageSnapshot(
+        mutation_epoch=_get_str(snapshot, "mutationEpoch"),
+        title=_get_str(snapshot, "title"),
+        focused_element_id=None if focused is None else str(focused),
+        interactive_rects={str(k): interactiveregion_from_dict(v) for k, v in snapshot["interactiveRects"].items()},
+        visual_viewport=visualviewport_from_dict(snapshot["visualViewport"]),
+        page_metadata=cast(Dict[str, Any], page_metadata),
+        visible_text=_get_str(snapshot, "visibleText"),
+    )
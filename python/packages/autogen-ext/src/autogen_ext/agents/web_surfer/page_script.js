@@ -419,11 +419,81 @@ var MultimodalWebSurfer = MultimodalWebSurfer || (function() {
      return textInView;
    };	
 
+   // Count DOM mutations so callers can tell whether the page changed between two observations.
+   // Our own labelling of interactive elements is not counted as a change. Resource loads (e.g., images)
+   // change the layout without mutating the DOM, so they are counted too.
+   let documentId = Math.random().toString(36).slice(2);
+   let mutationCount = 0;
+   let mutationObserver = null;
+
+   let observeMutations = function() {
+     if (mutationObserver !== null || typeof MutationObserver === "undefined" || !document.documentElement) {
+       return;
+     }
+     mutationObserver = new MutationObserver(function(records) {
+       for (let i = 0; i < records.length; i++) {
+         if (records[i].type !== "attributes" || records[i].attributeName !== "__elementid") {
+           mutationCount++;
+           return;
+         }
+       }
+     });
+     mutationObserver.observe(document.documentElement, {
+       subtree: true,
+       childList: true,
+       attributes: true,
+       characterData: true
+     });
+   };
+
+   if (document.documentElement) {
+     observeMutations();
+   } else {
+     document.addEventListener("DOMContentLoaded", observeMutations);
+   }
+   document.addEventListener("load", function() { mutationCount++; }, true);
+   window.addEventListener("resize", function() { mutationCount++; });
+
+   let getMutationEpoch = function() {
+     observeMutations();
+     return documentId + ":" + mutationCount;
+   };
+
+   // Everything the web surfer needs for one step, in a single call. The expensive parts are
+   // cached until the DOM mutates or the viewport scrolls.
+   let snapshotKey = null;
+   let snapshot = null;
+
+   let getSnapshot = function() {
+     let epoch = getMutationEpoch();
+     let key = epoch + ":" + window.scrollX + ":" + window.scrollY + ":" + window.innerWidth + ":" + window.innerHeight;
+     if (snapshot === null || key !== snapshotKey) {
+       snapshot = {
+         "interactiveRects": getInteractiveRects(),
+         "visualViewport": getVisualViewport(),
+         "pageMetadata": getPageMetadata(),
+         "visibleText": getVisibleText(),
+       };
+       snapshotKey = key;
+     }
+     return {
+       "mutationEpoch": epoch,
+       "title": document.title,
+       "focusedElementId": getFocusedElementId(),
+       "interactiveRects": snapshot["interactiveRects"],
+       "visualViewport": snapshot["visualViewport"],
+       "pageMetadata": snapshot["pageMetadata"],
+       "visibleText": snapshot["visibleText"],
+     };
+   };
+
    return {
        getInteractiveRects: getInteractiveRects,
        getVisualViewport: getVisualViewport,
        getFocusedElementId: getFocusedElementId,
        getPageMetadata: getPageMetadata,
        getVisibleText: getVisibleText,
+       getMutationEpoch: getMutationEpoch,
+       getSnapshot: getSnapshot,
    };
 })();
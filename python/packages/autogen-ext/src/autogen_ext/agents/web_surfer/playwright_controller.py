@@ -13,8 +13,10 @@
 
 from ._types import (
     InteractiveRegion,
+    PageSnapshot,
     VisualViewport,
     interactiveregion_from_dict,
+    pagesnapshot_from_dict,
     visualviewport_from_dict,
 )
 
@@ -166,6 +168,50 @@ async def get_page_metadata(self, page: Page) -> Dict[str, Any]:
         assert isinstance(result, dict)
         return cast(Dict[str, Any], result)
 
+    async def get_mutation_epoch(self, page: Page) -> str:
+        """
+        Retrieve a token identifying the current DOM state of the web page.
+        The token changes whenever the document is replaced or mutated, so two equal tokens
+        mean the page content did not change in between.
+
+        Args:
+            page (Page): The Playwright page object.
+
+        Returns:
+            str: The mutation epoch of the page.
+        """
+        assert page is not None
+        try:
+            await page.evaluate(self._page_script)
+        except Exception:
+            pass
+        result = await page.evaluate("MultimodalWebSurfer.getMutationEpoch();")
+        assert isinstance(result, str)
+        return result
+
+    async def get_page_snapshot(self, page: Page) -> PageSnapshot:
+        """
+        Retrieve the interactive regions, visual viewport, focused element, metadata, visible text,
+        title and mutation epoch of the web page in a single round-trip.
+
+        The page caches the expensive parts of the snapshot until the DOM mutates or the viewport
+        scrolls, and the page script is only injected if the page does not have it yet.
+
+        Args:
+            page (Page): The Playwright page object.
+
+        Returns:
+            PageSnapshot: The snapshot of the page.
+        """
+        assert page is not None
+        expression = "(typeof MultimodalWebSurfer === 'undefined') ? null : MultimodalWebSurfer.getSnapshot();"
+        result = await page.evaluate(expression)
+        if result is None:
+            await page.evaluate(self._page_script)
+            result = await page.evaluate(expression)
+        assert isinstance(result, dict)
+        return pagesnapshot_from_dict(cast(Dict[str, Any], result))
+
     async def on_new_page(self, page: Page) -> None:
         """
         Handle actions to perform on a new page.
@@ -1,6 +1,8 @@
 from ._jupyter_code_executor import JupyterCodeExecutor, JupyterCodeResult
+from ._jupyter_kernel_pool import JupyterKernelPool
 
 __all__ = [
     "JupyterCodeExecutor",
     "JupyterCodeResult",
+    "JupyterKernelPool",
 ]
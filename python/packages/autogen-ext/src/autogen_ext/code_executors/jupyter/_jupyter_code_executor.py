@@ -28,6 +28,7 @@
 from typing_extensions import Self
 
 from .._common import silence_pip
+from ._jupyter_kernel_pool import JupyterKernelPool
 
 
 @dataclass
@@ -124,9 +125,13 @@ async def main() -> None:
 
 
     Args:
-        kernel_name (str): The kernel name to use. By default, "python3".
+        kernel_name (str): The kernel name to use. By default, "python3". Ignored when a kernel pool is used.
         timeout (int): The timeout for code execution, by default 60.
         output_dir (Path): The directory to save output files, by default a temporary directory.
+        kernel_pool (JupyterKernelPool, optional): A pool to lease a pre-started kernel from, instead of starting one. By default, None.
+            The pool is not part of the component config.
+        session_id (str, optional): The session to lease the kernel for. Executors with the same session share the kernel
+            and its state. By default, a new session for each executor.
 
 
     .. note::
@@ -141,6 +146,8 @@ def __init__(
         kernel_name: str = "python3",
         timeout: int = 60,
         output_dir: Optional[Union[Path, str]] = None,
+        kernel_pool: Optional[JupyterKernelPool] = None,
+        session_id: Optional[str] = None,
     ):
         if timeout < 1:
             raise ValueError("Timeout must be greater than or equal to 1.")
@@ -155,6 +162,8 @@ def __init__(
 
         self._kernel_name = kernel_name
         self._timeout = timeout
+        self._kernel_pool = kernel_pool
+        self._session_id = session_id if session_id is not None else uuid.uuid4().hex
 
         self._client: Optional[NotebookClient] = None
         self.kernel_context: Optional[AbstractAsyncContextManager[None]] = None
@@ -266,7 +275,11 @@ def _save_html(self, html_data: str) -> Path:
         return path.absolute()
 
     async def restart(self) -> None:
-        """Restart the code executor."""
+        """Restart the code executor.
+
+        With a `kernel_pool`, the kernel is handed back to the pool and a kernel is leased again. If other
+        executors of the same `session_id` are still running, the same kernel is leased back and its state
+        is not cleared: it is only reset once every executor of the session has stopped."""
         await self.stop()
         await self.start()
 
@@ -282,15 +295,31 @@ async def start(self) -> None:
 
         notebook: NotebookNode = nbformat.new_notebook()  # type: ignore
 
-        self._client = NotebookClient(
-            nb=notebook,
-            kernel_name=self._kernel_name,
-            timeout=self._timeout,
-            allow_errors=True,
-        )
+        if self._kernel_pool is not None:
+            # The kernel is already running, the client only connects to it.
+            kernel_manager = await self._kernel_pool.acquire(self._session_id)
+            self._client = NotebookClient(
+                nb=notebook,
+                km=kernel_manager,
+                kernel_name=self._kernel_pool.kernel_name,
+                timeout=self._timeout,
+                allow_errors=True,
+            )
+        else:
+            self._client = NotebookClient(
+                nb=notebook,
+                kernel_name=self._kernel_name,
+                timeout=self._timeout,
+                allow_errors=True,
+            )
 
         self.kernel_context = self._client.async_setup_kernel()
-        await self.kernel_context.__aenter__()
+        try:
+            await self.kernel_context.__aenter__()
+        except BaseException:
+            if self._kernel_pool is not None:
+                await self._kernel_pool.release(self._session_id)
+            raise
 
         self._started = True
 
@@ -305,6 +334,12 @@ async def stop(self) -> None:
             await self.kernel_context.__aexit__(None, None, None)
             self.kernel_context = None
 
+        if self._kernel_pool is not None:
+            # The pooled kernel outlives the client: disconnect from it and hand it back to the pool.
+            if self._client is not None and self._client.kc is not None:
+                self._client.kc.stop_channels()
+            await self._kernel_pool.release(self._session_id)
+
         self._client = None
         self._started = False
 
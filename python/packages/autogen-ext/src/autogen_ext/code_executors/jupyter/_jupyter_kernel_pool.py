@@ -0,0 +1,322 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Coroutine, Dict, List, Optional, Sequence, Set
+
+from autogen_core import EVENT_LOGGER_NAME
+from jupyter_client.manager import AsyncKernelManager
+from jupyter_client.session import Session
+
+logger = logging.getLogger(EVENT_LOGGER_NAME + ".JupyterKernelPool")
+
+
+class _PooledKernelManager(AsyncKernelManager):
+    def client(self, **kwargs: Any) -> Any:
+        # By default, all clients share the manager's session, and the kernel routes replies by session id,
+        # so only one of them would get replies. Give each client its own session, allowing several executors
+        # of the same session to use the kernel.
+        kwargs.setdefault("session", Session(key=self.session.key, signature_scheme=self.session.signature_scheme))
+        return super().client(**kwargs)
+
+
+@dataclass(eq=False)
+class _Lease:
+    kernel_manager: AsyncKernelManager
+    count: int = 1
+
+
+class JupyterKernelPool:
+    """A pool of pre-started Jupyter kernels shared by several :class:`~autogen_ext.code_executors.jupyter.JupyterCodeExecutor` instances.
+
+    Starting a kernel takes a second or two, which is otherwise paid every time an executor starts.
+    The pool keeps ``size`` kernels started and ready (with ``preload_modules`` already imported), and
+    leases one to each executor when it starts. Executors that use the same ``session_id`` share the same
+    kernel, and thus the same state. Once the last executor of a session stops, the kernel is restarted
+    in the background, to clear its state, and returned to the pool.
+
+    When no ready kernel is available, a new one is started on demand, unless ``max_kernels`` kernels are
+    already running, in which case :meth:`acquire` waits for a kernel to be released. The time spent waiting
+    is available through :attr:`total_wait_time` and :attr:`max_wait_time`.
+
+    Args:
+        size (int, optional): The number of ready kernels to keep in the pool. Defaults to 2.
+        max_kernels (int, optional): The maximum number of kernels, leased or ready. Defaults to None, no limit.
+        kernel_name (str, optional): The kernel name to use. Defaults to "python3".
+        preload_modules (Sequence[str], optional): Modules to import in every kernel before it is leased. Defaults to None.
+        startup_timeout (int, optional): The timeout for a kernel to start and import the modules, in seconds. Defaults to 60.
+
+    Example usage:
+
+    .. code-block:: python
+
+        import asyncio
+        from autogen_core import CancellationToken
+        from autogen_core.code_executor import CodeBlock
+        from autogen_ext.code_executors.jupyter import JupyterCodeExecutor, JupyterKernelPool
+
+
+        async def main() -> None:
+            async with JupyterKernelPool(size=2, preload_modules=["numpy", "pandas"]) as pool:
+                async with JupyterCodeExecutor(kernel_pool=pool) as executor:
+                    code_blocks = [CodeBlock(code="print(numpy.arange(3))", language="python")]
+                    code_result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+                    print(code_result)
+                print(f"Waited {pool.total_wait_time:.2f}s for kernels")
+
+
+        asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        max_kernels: Optional[int] = None,
+        kernel_name: str = "python3",
+        preload_modules: Optional[Sequence[str]] = None,
+        startup_timeout: int = 60,
+    ) -> None:
+        if size < 0:
+            raise ValueError("size must be non-negative.")
+        if max_kernels is not None and (max_kernels < 1 or max_kernels < size):
+            raise ValueError("max_kernels must be at least 1 and at least size.")
+        if startup_timeout < 1:
+            raise ValueError("startup_timeout must be greater than or equal to 1.")
+
+        self._size = size
+        self._max_kernels = max_kernels
+        self._kernel_name = kernel_name
+        self._preload_modules = list(preload_modules or [])
+        self._startup_timeout = startup_timeout
+
+        self._idle: List[AsyncKernelManager] = []
+        self._leases: Dict[str, _Lease] = {}
+        # Kernels being started or reset, which will join the idle kernels, and kernels started on demand.
+        self._num_pending = 0
+        self._num_on_demand = 0
+        self._num_waiting = 0
+        self._condition = asyncio.Condition()
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._closed = False
+
+        self._num_acquired = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    async def __aenter__(self) -> "JupyterKernelPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    @property
+    def kernel_name(self) -> str:
+        """The kernel name used by the pool."""
+        return self._kernel_name
+
+    async def start(self) -> None:
+        """Start the ready kernels and wait until they are all ready."""
+        if self._closed:
+            raise RuntimeError("The kernel pool is closed.")
+        await self._fill()
+
+    async def acquire(self, session_id: str) -> AsyncKernelManager:
+        """Lease a kernel to the session, waiting for one if the pool is at capacity.
+
+        If the session already holds a kernel, the same kernel is returned and the lease is shared.
+        Every call must be matched by a call to :meth:`release`."""
+        if self._closed:
+            raise RuntimeError("The kernel pool is closed.")
+        start_time = time.perf_counter()
+        kernel_manager: Optional[AsyncKernelManager] = None
+        async with self._condition:
+            while True:
+                lease = self._leases.get(session_id)
+                if lease is not None:
+                    lease.count += 1
+                    kernel_manager = lease.kernel_manager
+                    break
+                if self._idle:
+                    kernel_manager = self._idle.pop(0)
+                    self._leases[session_id] = _Lease(kernel_manager)
+                    break
+                if self._has_capacity():
+                    self._num_on_demand += 1
+                    break
+                self._num_waiting += 1
+                try:
+                    await self._condition.wait()
+                finally:
+                    self._num_waiting -= 1
+
+        if kernel_manager is None:
+            # No ready kernel, start one for this session.
+            try:
+                kernel_manager = await self._start_kernel()
+            finally:
+                async with self._condition:
+                    self._num_on_demand -= 1
+            async with self._condition:
+                lease = self._leases.get(session_id)
+                if lease is not None:
+                    # Another call for the same session got a kernel first, keep this one for later.
+                    self._idle.append(kernel_manager)
+                    lease.count += 1
+                    kernel_manager = lease.kernel_manager
+                else:
+                    self._leases[session_id] = _Lease(kernel_manager)
+
+        wait_time = time.perf_counter() - start_time
+        self._num_acquired += 1
+        self._total_wait_time += wait_time
+        self._max_wait_time = max(self._max_wait_time, wait_time)
+        self._spawn(self._fill())
+        return kernel_manager
+
+    async def release(self, session_id: str) -> None:
+        """End a lease. Once a session holds no more leases, its kernel is reset in the background and reused."""
+        async with self._condition:
+            lease = self._leases.get(session_id)
+            if lease is None:
+                return
+            lease.count -= 1
+            if lease.count > 0:
+                return
+            del self._leases[session_id]
+            if self._closed:
+                reset = False
+            else:
+                self._num_pending += 1
+                reset = True
+        if reset:
+            self._spawn(self._reset(lease.kernel_manager))
+        else:
+            await self._shutdown(lease.kernel_manager)
+
+    async def close(self) -> None:
+        """Shut down all kernels, including the leased ones."""
+        self._closed = True
+        # Let the kernels being started or reset settle, they are shut down as they finish.
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        async with self._condition:
+            kernel_managers = self._idle + [lease.kernel_manager for lease in self._leases.values()]
+            self._idle.clear()
+            self._leases.clear()
+            self._condition.notify_all()
+        await asyncio.gather(*[self._shutdown(km) for km in kernel_managers])
+
+    @property
+    def num_idle(self) -> int:
+        """The number of ready kernels waiting to be leased."""
+        return len(self._idle)
+
+    @property
+    def num_leased(self) -> int:
+        """The number of kernels currently leased."""
+        return len(self._leases)
+
+    @property
+    def num_acquired(self) -> int:
+        """The number of leases handed out so far."""
+        return self._num_acquired
+
+    @property
+    def total_wait_time(self) -> float:
+        """The total time, in seconds, that :meth:`acquire` spent waiting for a kernel."""
+        return self._total_wait_time
+
+    @property
+    def max_wait_time(self) -> float:
+        """The longest time, in seconds, that a single :meth:`acquire` call waited for a kernel."""
+        return self._max_wait_time
+
+    def _num_kernels(self) -> int:
+        return len(self._idle) + len(self._leases) + self._num_pending + self._num_on_demand
+
+    def _has_capacity(self) -> bool:
+        return self._max_kernels is None or self._num_kernels() < self._max_kernels
+
+    async def _fill(self) -> None:
+        async with self._condition:
+            num_to_start = self._size - len(self._idle) - self._num_pending
+            if self._max_kernels is not None:
+                num_to_start = min(num_to_start, self._max_kernels - self._num_kernels())
+            if self._closed or num_to_start <= 0:
+                return
+            self._num_pending += num_to_start
+        results = await asyncio.gather(*[self._start_kernel() for _ in range(num_to_start)], return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.warning(f"Failed to start a pooled kernel: {result}")
+                await self._add_idle(None)
+            else:
+                await self._add_idle(result)
+
+    async def _reset(self, kernel_manager: AsyncKernelManager) -> None:
+        try:
+            await kernel_manager.restart_kernel(now=True)
+            await self._preload(kernel_manager)
+        except Exception as e:
+            logger.warning(f"Failed to reset a pooled kernel: {e}")
+            await self._shutdown(kernel_manager)
+            await self._add_idle(None)
+            self._spawn(self._fill())
+            return
+        await self._add_idle(kernel_manager)
+
+    async def _add_idle(self, kernel_manager: Optional[AsyncKernelManager]) -> None:
+        # Settles a pending kernel, either adding it to the ready kernels or dropping it.
+        async with self._condition:
+            self._num_pending -= 1
+            # Keep the kernel if the pool is short of ready kernels, or if an acquire() call is waiting for it.
+            num_to_keep = max(self._size, self._num_waiting)
+            if kernel_manager is not None and not self._closed and len(self._idle) < num_to_keep:
+                self._idle.append(kernel_manager)
+                kernel_manager = None
+            self._condition.notify_all()
+        if kernel_manager is not None:
+            await self._shutdown(kernel_manager)
+
+    async def _start_kernel(self) -> AsyncKernelManager:
+        kernel_manager = _PooledKernelManager(kernel_name=self._kernel_name)
+        # Same as nbclient, keep the IPython history in memory.
+        extra_arguments = ["--HistoryManager.hist_file=:memory:"] if kernel_manager.ipykernel else []
+        await kernel_manager.start_kernel(extra_arguments=extra_arguments)
+        try:
+            await self._preload(kernel_manager)
+        except BaseException:
+            await self._shutdown(kernel_manager)
+            raise
+        return kernel_manager
+
+    async def _preload(self, kernel_manager: AsyncKernelManager) -> None:
+        # Wait for the kernel to be ready and import the modules, without adding to the execution count.
+        client = kernel_manager.client()
+        client.start_channels()
+        try:
+            await client.wait_for_ready(timeout=self._startup_timeout)
+            if self._preload_modules:
+                code = "\n".join(f"import {module}" for module in self._preload_modules)
+                reply = await client.execute_interactive(
+                    code, store_history=False, timeout=self._startup_timeout, output_hook=lambda msg: None
+                )
+                if reply["content"]["status"] != "ok":
+                    logger.warning(f"Failed to preload modules in a pooled kernel: {reply['content'].get('evalue')}")
+        finally:
+            client.stop_channels()
+
+    async def _shutdown(self, kernel_manager: AsyncKernelManager) -> None:
+        try:
+            await kernel_manager.shutdown_kernel(now=True)
+        except Exception as e:
+            logger.warning(f"Error shutting down a pooled kernel: {e}")
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        if self._closed:
+            coro.close()
+            return
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
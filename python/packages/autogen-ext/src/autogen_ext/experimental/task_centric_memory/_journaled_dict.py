@@ -0,0 +1,162 @@
+import os
+import pickle
+from contextlib import contextmanager
+from typing import Any, Dict, Generic, Iterator, MutableMapping, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+# The operations recorded in the journal, each as an (op, key, value) record.
+_SET = "set"
+_DELETE = "delete"
+
+
+class JournaledDict(MutableMapping[K, V], Generic[K, V]):
+    """
+    A dict persisted to disk as a pickled snapshot plus an append-only journal of changes.
+
+    Each change appends one small record to the journal instead of re-pickling the whole dict,
+    so adding N items writes O(N) bytes rather than O(N²). The snapshot is the same pickled dict
+    the memory bank always stored, so existing files load unchanged. Once the journal holds more
+    records than the dict has items (and at least `min_compaction_records`), it is compacted:
+    a new snapshot is written to a temporary file, fsynced, and atomically swapped in before the
+    journal is truncated. A crash at any point leaves a loadable bank. A record torn by a crash is
+    dropped on the next load, and replaying records already in the snapshot is harmless.
+
+    The files are only read on first access. Changes are fsynced one by one, except inside
+    :meth:`batch`, which defers the fsync to the end of the batch. The journal is only kept open
+    while a change or a batch of changes is being written.
+
+    Args:
+        - path: Path to the snapshot file. The journal is kept next to it, with a ".journal" suffix.
+        - min_compaction_records: The minimum number of journal records before compacting.
+    """
+
+    def __init__(self, path: str, min_compaction_records: int = 1000) -> None:
+        self.path = path
+        self.journal_path = path + ".journal"
+        self.min_compaction_records = min_compaction_records
+        self._data: Dict[K, V] | None = None
+        self._journal_records = 0
+        self._batch_depth = 0
+        self._journal_file: Any = None
+
+    @property
+    def data(self) -> Dict[K, V]:
+        """The in-memory dict, loaded from disk on first access."""
+        if self._data is None:
+            self._data = self._load()
+        return self._data
+
+    def _load(self) -> Dict[K, V]:
+        data: Dict[K, V] = {}
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as f:
+                data = pickle.load(f)
+
+        self._journal_records = 0
+        if os.path.exists(self.journal_path):
+            valid_length = 0
+            with open(self.journal_path, "rb") as f:
+                while True:
+                    try:
+                        op, key, value = pickle.load(f)
+                    except EOFError:
+                        break
+                    except (pickle.UnpicklingError, ValueError, TypeError, AttributeError):
+                        # A record torn by a crash. Everything before it is valid.
+                        break
+                    if op == _DELETE:
+                        data.pop(key, None)
+                    else:
+                        data[key] = value
+                    self._journal_records += 1
+                    valid_length = f.tell()
+            if valid_length < os.path.getsize(self.journal_path):
+                with open(self.journal_path, "r+b") as f:
+                    f.truncate(valid_length)
+        return data
+
+    def __getitem__(self, key: K) -> V:
+        return self.data[key]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        self.data[key] = value
+        self._append(_SET, key, value)
+
+    def __delitem__(self, key: K) -> None:
+        del self.data[key]
+        self._append(_DELETE, key, None)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.data
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Groups several changes, syncing the journal to disk once at the end instead of after each change.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.close()
+                self._maybe_compact()
+
+    def _append(self, op: str, key: K, value: Any) -> None:
+        if self._journal_file is None:
+            self._journal_file = open(self.journal_path, "ab")
+        pickle.dump((op, key, value), self._journal_file)
+        self._journal_records += 1
+        if self._batch_depth == 0:
+            self.close()
+            self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        if self._journal_records >= max(self.min_compaction_records, len(self.data)):
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Writes the whole dict to a new snapshot, atomically replacing the old one, and empties the journal.
+        """
+        data = self.data
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+        # The snapshot now holds every change, so the journal can start over.
+        if self._journal_file is not None:
+            self._journal_file.close()
+            self._journal_file = None
+        if os.path.exists(self.journal_path):
+            os.remove(self.journal_path)
+        self._journal_records = 0
+
+    def clear(self) -> None:
+        """
+        Deletes all items, in memory and on disk.
+        """
+        self._data = {}
+        self.compact()
+
+    def close(self) -> None:
+        """
+        Syncs and closes the journal file. It is reopened if more changes are made.
+        """
+        if self._journal_file is not None:
+            self._journal_file.flush()
+            os.fsync(self._journal_file.fileno())
+            self._journal_file.close()
+            self._journal_file = None
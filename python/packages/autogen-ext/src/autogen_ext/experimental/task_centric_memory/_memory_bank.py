@@ -1,8 +1,8 @@
 import os
-import pickle
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple, TypedDict
 
+from ._journaled_dict import JournaledDict
 from ._string_similarity_map import StringSimilarityMap
 from .utils.page_logger import PageLogger
 
@@ -74,18 +74,17 @@ def __init__(
         self.string_map = StringSimilarityMap(reset=reset, path_to_db_dir=path_to_db_dir, logger=self.logger)
 
         # Load or create the associated memo dict on disk.
-        self.uid_memo_dict: Dict[str, Memo] = {}
+        # New memos are appended to a journal next to the dict's snapshot, rather than re-pickling the whole dict.
+        self.uid_memo_dict: JournaledDict[str, Memo] = JournaledDict(self.path_to_dict)
         self.last_memo_id = 0
-        if (not reset) and os.path.exists(self.path_to_dict):
-            self.logger.info("\nLOADING MEMOS FROM DISK  at {}".format(self.path_to_dict))
-            with open(self.path_to_dict, "rb") as f:
-                self.uid_memo_dict = pickle.load(f)
-                self.last_memo_id = len(self.uid_memo_dict)
-                self.logger.info("\n{} MEMOS LOADED".format(len(self.uid_memo_dict)))
 
         # Clear the DB if requested.
         if reset:
             self._reset_memos()
+        elif os.path.exists(self.path_to_dict) or os.path.exists(self.uid_memo_dict.journal_path):
+            self.logger.info("\nLOADING MEMOS FROM DISK  at {}".format(self.path_to_dict))
+            self.last_memo_id = len(self.uid_memo_dict)
+            self.logger.info("\n{} MEMOS LOADED".format(len(self.uid_memo_dict)))
 
         self.logger.leave_function()
 
@@ -101,17 +100,18 @@ def _reset_memos(self) -> None:
         Forces immediate deletion of the memos, in memory and on disk.
         """
         self.logger.info("\nCLEARING MEMOS")
-        self.uid_memo_dict = {}
+        self.uid_memo_dict.clear()
+        self.last_memo_id = 0
         self.save_memos()
 
     def save_memos(self) -> None:
         """
-        Saves the current memo structures (possibly empty) to disk.
+        Saves the current memo structures (possibly empty) to disk as complete snapshots.
+        New memos are already persisted as they are added, so this is only needed to compact the journals.
         """
         self.string_map.save_string_pairs()
-        with open(self.path_to_dict, "wb") as file:
-            self.logger.info("\nSAVING MEMOS TO DISK  at {}".format(self.path_to_dict))
-            pickle.dump(self.uid_memo_dict, file)
+        self.logger.info("\nSAVING MEMOS TO DISK  at {}".format(self.path_to_dict))
+        self.uid_memo_dict.compact()
 
     def contains_memos(self) -> bool:
         """
@@ -127,9 +127,8 @@ def _map_topics_to_memo(self, topics: List[str], memo_id: str, memo: Memo) -> No
         self.logger.info("\nINSIGHT\n{}".format(memo.insight))
         for topic in topics:
             self.logger.info("\n TOPIC = {}".format(topic))
-            self.string_map.add_input_output_pair(topic, memo_id)
+        self.string_map.add_input_output_pairs([(topic, memo_id) for topic in topics])
         self.uid_memo_dict[memo_id] = memo
-        self.save_memos()
         self.logger.leave_function()
 
     def add_memo(self, insight_str: str, topics: List[str], task_str: Optional[str] = None) -> None:
@@ -143,6 +142,26 @@ def add_memo(self, insight_str: str, topics: List[str], task_str: Optional[str]
         self._map_topics_to_memo(topics, id_str, insight)
         self.logger.leave_function()
 
+    def add_memos(self, memos: List[Tuple[Memo, List[str]]]) -> None:
+        """
+        Adds several memos to the memory bank, each given with its list of topics.
+        All topics are embedded in one call, and the files are synced to disk once at the end.
+        """
+        self.logger.enter_function()
+        pairs: List[Tuple[str, str]] = []
+        with self.uid_memo_dict.batch():
+            for memo, topics in memos:
+                self.last_memo_id += 1
+                memo_id = str(self.last_memo_id)
+                self.logger.info("\nINSIGHT\n{}".format(memo.insight))
+                for topic in topics:
+                    self.logger.info("\n TOPIC = {}".format(topic))
+                    pairs.append((topic, memo_id))
+                self.uid_memo_dict[memo_id] = memo
+            # The memos are only synced once their topics are in the string map as well.
+            self.string_map.add_input_output_pairs(pairs)
+        self.logger.leave_function()
+
     def add_task_with_solution(self, task: str, solution: str, topics: List[str]) -> None:
         """
         Adds a task-solution pair to the memory bank, to be retrieved together later as a combined insight.
@@ -163,10 +182,12 @@ def get_relevant_memos(self, topics: List[str]) -> List[Memo]:
         """
         self.logger.enter_function()
 
-        # Retrieve all topic matches, and gather them into a single list.
+        # Retrieve all topic matches in one query, and gather them into a single list.
         matches: List[Tuple[str, str, float]] = []  # Each match is a tuple: (topic, memo_id, distance)
-        for topic in topics:
-            matches.extend(self.string_map.get_related_string_pairs(topic, self.n_results, self.distance_threshold))
+        for topic_matches in self.string_map.get_related_string_pairs_for_queries(
+            topics, self.n_results, self.distance_threshold
+        ):
+            matches.extend(topic_matches)
 
         # Build a dict of memo-relevance pairs from the matches.
         memo_relevance_dict: Dict[str, float] = {}
@@ -1,6 +1,5 @@
 import os
-import pickle
-from typing import Dict, List, Tuple, Union
+from typing import List, Tuple, Union
 
 import chromadb
 from chromadb.api.types import (
@@ -8,6 +7,7 @@
 )
 from chromadb.config import Settings
 
+from ._journaled_dict import JournaledDict
 from .utils.page_logger import PageLogger
 
 
@@ -40,20 +40,18 @@ def __init__(self, reset: bool, path_to_db_dir: str, logger: PageLogger | None =
 
         # Load or create the associated string-pair dict on disk.
         self.path_to_dict = os.path.join(path_to_db_dir, "uid_text_dict.pkl")
-        self.uid_text_dict: Dict[str, Tuple[str, str]] = {}
+        self.uid_text_dict: JournaledDict[str, Tuple[str, str]] = JournaledDict(self.path_to_dict)
         self.last_string_pair_id = 0
-        if (not reset) and os.path.exists(self.path_to_dict):
-            self.logger.debug("\nLOADING STRING SIMILARITY MAP FROM DISK  at {}".format(self.path_to_dict))
-            with open(self.path_to_dict, "rb") as f:
-                self.uid_text_dict = pickle.load(f)
-                self.last_string_pair_id = len(self.uid_text_dict)
-                if len(self.uid_text_dict) > 0:
-                    self.logger.debug("\n{} STRING PAIRS LOADED".format(len(self.uid_text_dict)))
-                    self._log_string_pairs()
 
         # Clear the DB if requested.
         if reset:
             self.reset_db()
+        elif os.path.exists(self.path_to_dict) or os.path.exists(self.uid_text_dict.journal_path):
+            self.logger.debug("\nLOADING STRING SIMILARITY MAP FROM DISK  at {}".format(self.path_to_dict))
+            self.last_string_pair_id = len(self.uid_text_dict)
+            if len(self.uid_text_dict) > 0:
+                self.logger.debug("\n{} STRING PAIRS LOADED".format(len(self.uid_text_dict)))
+                self._log_string_pairs()
 
     def _log_string_pairs(self) -> None:
         """
@@ -66,11 +64,11 @@ def _log_string_pairs(self) -> None:
 
     def save_string_pairs(self) -> None:
         """
-        Saves the string-pair dict (self.uid_text_dict) to disk.
+        Saves the string-pair dict (self.uid_text_dict) to disk as a complete snapshot.
+        New pairs are already persisted as they are added, so this is only needed to compact the journal.
         """
         self.logger.debug("\nSAVING STRING SIMILARITY MAP TO DISK  at {}".format(self.path_to_dict))
-        with open(self.path_to_dict, "wb") as file:
-            pickle.dump(self.uid_text_dict, file)
+        self.uid_text_dict.compact()
 
     def reset_db(self) -> None:
         """
@@ -79,21 +77,33 @@ def reset_db(self) -> None:
         self.logger.debug("\nCLEARING STRING-PAIR MAP")
         self.db_client.delete_collection("string-pairs")
         self.vec_db = self.db_client.create_collection("string-pairs")
-        self.uid_text_dict = {}
-        self.save_string_pairs()
+        self.uid_text_dict.clear()
+        self.last_string_pair_id = 0
 
     def add_input_output_pair(self, input_text: str, output_text: str) -> None:
         """
         Adds one input-output string pair to the DB.
         """
-        self.last_string_pair_id += 1
-        self.vec_db.add(documents=[input_text], ids=[str(self.last_string_pair_id)])
-        self.uid_text_dict[str(self.last_string_pair_id)] = input_text, output_text
-        self.logger.debug(
-            "\nINPUT-OUTPUT PAIR ADDED TO VECTOR DATABASE:\n  ID\n    {}\n  INPUT\n    {}\n  OUTPUT\n    {}\n".format(
-                self.last_string_pair_id, input_text, output_text
-            )
-        )
+        self.add_input_output_pairs([(input_text, output_text)])
+
+    def add_input_output_pairs(self, pairs: List[Tuple[str, str]]) -> None:
+        """
+        Adds several input-output string pairs to the DB, embedding all input strings in one call.
+        """
+        if len(pairs) == 0:
+            return
+        first_id = self.last_string_pair_id + 1
+        ids = [str(first_id + i) for i in range(len(pairs))]
+        self.vec_db.add(documents=[input_text for input_text, _ in pairs], ids=ids)
+        self.last_string_pair_id += len(pairs)
+        with self.uid_text_dict.batch():
+            for uid, (input_text, output_text) in zip(ids, pairs, strict=True):
+                self.uid_text_dict[uid] = input_text, output_text
+                self.logger.debug(
+                    "\nINPUT-OUTPUT PAIR ADDED TO VECTOR DATABASE:\n  ID\n    {}\n  INPUT\n    {}\n  OUTPUT\n    {}\n".format(
+                        uid, input_text, output_text
+                    )
+                )
         # self._log_string_pairs()  # For deeper debugging, uncomment to log all string pairs after each addition.
 
     def get_related_string_pairs(
@@ -102,23 +112,33 @@ def get_related_string_pairs(
         """
         Retrieves up to n string pairs that are related to the given query text within the specified distance threshold.
         """
-        string_pairs_with_distances: List[Tuple[str, str, float]] = []
+        return self.get_related_string_pairs_for_queries([query_text], n_results, threshold)[0]
+
+    def get_related_string_pairs_for_queries(
+        self, query_texts: List[str], n_results: int, threshold: Union[int, float]
+    ) -> List[List[Tuple[str, str, float]]]:
+        """
+        Retrieves up to n related string pairs for each of the given query texts, in a single vector DB query.
+        Returns one list of (input_text, output_text, distance) tuples per query text, in the same order.
+        """
+        string_pairs_per_query: List[List[Tuple[str, str, float]]] = [[] for _ in query_texts]
         if n_results > len(self.uid_text_dict):
             n_results = len(self.uid_text_dict)
-        if n_results > 0:
-            results: QueryResult = self.vec_db.query(query_texts=[query_text], n_results=n_results)
-            num_results = len(results["ids"][0])
-            for i in range(num_results):
-                uid = results["ids"][0][i]
-                input_text = results["documents"][0][i] if results["documents"] else ""
-                distance = results["distances"][0][i] if results["distances"] else 0.0
-                if distance < threshold:
-                    input_text_2, output_text = self.uid_text_dict[uid]
-                    assert input_text == input_text_2
-                    self.logger.debug(
-                        "\nINPUT-OUTPUT PAIR RETRIEVED FROM VECTOR DATABASE:\n  INPUT1\n    {}\n  OUTPUT\n    {}\n  DISTANCE\n    {}".format(
-                            input_text, output_text, distance
+        if n_results > 0 and len(query_texts) > 0:
+            results: QueryResult = self.vec_db.query(query_texts=query_texts, n_results=n_results)
+            for query_index, string_pairs_with_distances in enumerate(string_pairs_per_query):
+                num_results = len(results["ids"][query_index])
+                for i in range(num_results):
+                    uid = results["ids"][query_index][i]
+                    input_text = results["documents"][query_index][i] if results["documents"] else ""
+                    distance = results["distances"][query_index][i] if results["distances"] else 0.0
+                    if distance < threshold:
+                        input_text_2, output_text = self.uid_text_dict[uid]
+                        assert input_text == input_text_2
+                        self.logger.debug(
+                            "\nINPUT-OUTPUT PAIR RETRIEVED FROM VECTOR DATABASE:\n  INPUT1\n    {}\n  OUTPUT\n    {}\n  DISTANCE\n    {}".format(
+                                input_text, output_text, distance
+                            )
                         )
-                    )
-                    string_pairs_with_distances.append((input_text, output_text, distance))
-        return string_pairs_with_distances
+                        string_pairs_with_distances.append((input_text, output_text, distance))
+        return string_pairs_per_query
@@ -1,4 +1,8 @@
-from typing import TYPE_CHECKING, Awaitable, Callable, List, Tuple, TypedDict
+import asyncio
+import time
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Deque, Dict, List, Tuple, TypedDict, TypeVar
 
 from autogen_core.models import (
     ChatCompletionClient,
@@ -12,6 +16,8 @@
 from .utils.grader import Grader
 from .utils.page_logger import PageLogger
 
+T = TypeVar("T")
+
 
 # Following the nested-config pattern, this TypedDict minimizes code changes by encapsulating
 # the settings that change frequently, as when loading many settings from a single YAML file.
@@ -20,9 +26,12 @@ class MemoryControllerConfig(TypedDict, total=False):
     revise_generalized_task: bool
     generate_topics: bool
     validate_memos: bool
+    max_concurrent_validations: int
+    cache_task_analysis: bool
     max_memos_to_retrieve: int
     max_train_trials: int
     max_test_trials: int
+    max_concurrent_trials: int
     MemoryBank: "MemoryBankConfig"
 
 
@@ -42,9 +51,13 @@ class MemoryController:
             - revise_generalized_task: Whether to critique then rewrite the generalized task.
             - generate_topics: Whether to base retrieval directly on tasks, or on topics extracted from tasks.
             - validate_memos: Whether to apply a final validation stage to retrieved memos.
+            - max_concurrent_validations: The maximum number of memos validated by the model at the same time.
+            - cache_task_analysis: Whether to reuse the generalized task and topics previously extracted from the same text.
             - max_memos_to_retrieve: The maximum number of memos to return from retrieve_relevant_memos().
             - max_train_trials: The maximum number of learning iterations to attempt when training on a task.
             - max_test_trials: The total number of attempts made when testing for failure on a task.
+            - max_concurrent_trials: The maximum number of trials run at the same time by test_on_task() and
+              when testing for failure. Values above 1 require a task_assignment_callback that can be called concurrently.
             - MemoryBank: A config dict passed to MemoryBank.
 
         logger: An optional logger. If None, a default logger will be created.
@@ -105,18 +118,24 @@ def __init__(
         self.revise_generalized_task = True
         self.generate_topics = True
         self.validate_memos = True
+        self.max_concurrent_validations = 4
+        self.cache_task_analysis = True
         self.max_memos_to_retrieve = 10
         self.max_train_trials = 10
         self.max_test_trials = 3
+        self.max_concurrent_trials = 1
         memory_bank_config = None
         if config is not None:
             self.generalize_task = config.get("generalize_task", self.generalize_task)
             self.revise_generalized_task = config.get("revise_generalized_task", self.revise_generalized_task)
             self.generate_topics = config.get("generate_topics", self.generate_topics)
             self.validate_memos = config.get("validate_memos", self.validate_memos)
+            self.max_concurrent_validations = config.get("max_concurrent_validations", self.max_concurrent_validations)
+            self.cache_task_analysis = config.get("cache_task_analysis", self.cache_task_analysis)
             self.max_memos_to_retrieve = config.get("max_memos_to_retrieve", self.max_memos_to_retrieve)
             self.max_train_trials = config.get("max_train_trials", self.max_train_trials)
             self.max_test_trials = config.get("max_test_trials", self.max_test_trials)
+            self.max_concurrent_trials = config.get("max_concurrent_trials", self.max_concurrent_trials)
             memory_bank_config = config.get("MemoryBank", memory_bank_config)
 
         self.client = client
@@ -124,6 +143,9 @@ def __init__(
         self.prompter = Prompter(client, logger)
         self.memory_bank = MemoryBank(reset=reset, config=memory_bank_config, logger=logger)
         self.grader = Grader(client, logger)
+        self._max_cache_entries = 256
+        self._generalized_task_cache: Dict[str, str] = {}
+        self._topics_cache: Dict[str, List[str]] = {}
         self.logger.leave_function()
 
     def reset_memory(self) -> None:
@@ -152,15 +174,17 @@ async def test_on_task(self, task: str, expected_answer: str, num_trials: int =
         """
         self.logger.enter_function()
         assert self.task_assignment_callback is not None
-        response = ""
-        num_successes = 0
+        task_assignment_callback = self.task_assignment_callback
+        retrieval_lock = asyncio.Lock()
 
-        for trial in range(num_trials):
+        async def run_trial(trial: int) -> Tuple[str, bool]:
             self.logger.info("\n-----  TRIAL {}  -----\n".format(trial + 1))
             task_plus_insights = task
 
             # Try to retrieve any relevant memories from the DB.
-            filtered_memos = await self.retrieve_relevant_memos(task)
+            # The prompter keeps a chat history across calls, so concurrent trials take turns at this step.
+            async with retrieval_lock:
+                filtered_memos = await self.retrieve_relevant_memos(task)
             filtered_insights = [memo.insight for memo in filtered_memos]
             if len(filtered_insights) > 0:
                 self.logger.info("Relevant insights were retrieved from memory.\n")
@@ -170,7 +194,7 @@ async def test_on_task(self, task: str, expected_answer: str, num_trials: int =
 
             # Attempt to solve the task.
             self.logger.info("Try to solve the task.\n")
-            response, _ = await self.task_assignment_callback(task_plus_insights)
+            response, _ = await task_assignment_callback(task_plus_insights)
 
             # Check if the response is correct.
             response_is_correct, extracted_answer = await self.grader.is_response_correct(
@@ -179,9 +203,13 @@ async def test_on_task(self, task: str, expected_answer: str, num_trials: int =
             self.logger.info("Extracted answer:  {}".format(extracted_answer))
             if response_is_correct:
                 self.logger.info("Answer is CORRECT.\n")
-                num_successes += 1
             else:
                 self.logger.info("Answer is INCORRECT.\n")
+            return response, response_is_correct
+
+        results = await self._run_trials(num_trials, run_trial)
+        response = results[max(results)][0] if len(results) > 0 else ""
+        num_successes = sum(1 for _, response_is_correct in results.values() if response_is_correct)
 
         # Calculate the success rate as a percentage, rounded to the nearest whole number.
         self.logger.info("\nSuccess rate:  {}%\n".format(round((num_successes / num_trials) * 100)))
@@ -199,7 +227,7 @@ async def add_memo(self, insight: str, task: None | str = None, index_on_both: b
             self.logger.info("\nGIVEN TASK:")
             self.logger.info(task)
             if self.generalize_task:
-                generalized_task = await self.prompter.generalize_task(task, revise=self.revise_generalized_task)
+                generalized_task = await self._generalize_task(task)
             else:
                 generalized_task = task
 
@@ -219,7 +247,7 @@ async def add_memo(self, insight: str, task: None | str = None, index_on_both: b
                 self.logger.info("\nTOPICS EXTRACTED FROM TASK:")
 
         if self.generate_topics:
-            topics = await self.prompter.find_index_topics(text_to_index)
+            topics = await self._find_index_topics(text_to_index)
         else:
             topics = [text_to_index]
         self.logger.info("\n".join(topics))
@@ -244,7 +272,7 @@ async def add_task_solution_pair_to_memory(self, task: str, solution: str) -> No
 
         # Get a list of topics from the task.
         if self.generate_topics:
-            topics = await self.prompter.find_index_topics(task.strip())
+            topics = await self._find_index_topics(task.strip())
         else:
             topics = [task.strip()]
         self.logger.info("\nTOPICS EXTRACTED FROM TASK:")
@@ -267,11 +295,11 @@ async def retrieve_relevant_memos(self, task: str) -> List[Memo]:
 
             # Get a list of topics from the generalized task.
             if self.generalize_task:
-                generalized_task = await self.prompter.generalize_task(task, revise=self.revise_generalized_task)
+                generalized_task = await self._generalize_task(task)
             else:
                 generalized_task = task
             if self.generate_topics:
-                task_topics = await self.prompter.find_index_topics(generalized_task)
+                task_topics = await self._find_index_topics(generalized_task)
             else:
                 task_topics = [generalized_task]
             self.logger.info("\nTOPICS EXTRACTED FROM TASK:")
@@ -282,12 +310,10 @@ async def retrieve_relevant_memos(self, task: str) -> List[Memo]:
             memo_list = self.memory_bank.get_relevant_memos(topics=task_topics)
 
             # Apply a final validation stage to keep only the memos that the LLM concludes are sufficiently relevant.
-            validated_memos: List[Memo] = []
-            for memo in memo_list:
-                if len(validated_memos) >= self.max_memos_to_retrieve:
-                    break
-                if (not self.validate_memos) or await self.prompter.validate_insight(memo.insight, task):
-                    validated_memos.append(memo)
+            if self.validate_memos:
+                validated_memos = await self._validate_memos(memo_list, task)
+            else:
+                validated_memos = memo_list[: self.max_memos_to_retrieve]
 
             self.logger.info("\n{} VALIDATED MEMOS".format(len(validated_memos)))
             for memo in validated_memos:
@@ -301,6 +327,63 @@ async def retrieve_relevant_memos(self, task: str) -> List[Memo]:
         self.logger.leave_function()
         return validated_memos
 
+    async def _validate_memos(self, memo_list: List[Memo], task: str) -> List[Memo]:
+        """
+        Asks the model to validate the memos, several at a time, keeping the first ones that pass in relevance order.
+        Validation stops as soon as max_memos_to_retrieve memos have passed.
+        """
+        validated_memos: List[Memo] = []
+        in_flight: Deque[Tuple[Memo, asyncio.Task[bool]]] = deque()
+        memos_to_validate = iter(memo_list)
+        try:
+            while len(validated_memos) < self.max_memos_to_retrieve:
+                # Keep up to max_concurrent_validations calls in flight, started in relevance order.
+                num_to_start = max(1, self.max_concurrent_validations) - len(in_flight)
+                for memo in islice(memos_to_validate, num_to_start):
+                    validation = asyncio.ensure_future(self.prompter.validate_insight(memo.insight, task))
+                    in_flight.append((memo, validation))
+                if len(in_flight) == 0:
+                    break
+                # Consume the results in order, so that the same memos are kept as with sequential validation.
+                memo, validation = in_flight.popleft()
+                if await validation:
+                    validated_memos.append(memo)
+        finally:
+            # Enough memos passed (or something failed), so the remaining validations are not needed.
+            for _, validation in in_flight:
+                validation.cancel()
+        return validated_memos
+
+    async def _generalize_task(self, task: str) -> str:
+        """
+        Rewrites the task in more general terms, reusing the previous result for the same task if caching is enabled.
+        """
+        if not self.cache_task_analysis:
+            return await self.prompter.generalize_task(task, revise=self.revise_generalized_task)
+        if task not in self._generalized_task_cache:
+            generalized_task = await self.prompter.generalize_task(task, revise=self.revise_generalized_task)
+            self._add_to_cache(self._generalized_task_cache, task, generalized_task)
+        return self._generalized_task_cache[task]
+
+    async def _find_index_topics(self, text: str) -> List[str]:
+        """
+        Extracts topics from the text, reusing the previous result for the same text if caching is enabled.
+        """
+        if not self.cache_task_analysis:
+            return await self.prompter.find_index_topics(text)
+        if text not in self._topics_cache:
+            topics = await self.prompter.find_index_topics(text)
+            self._add_to_cache(self._topics_cache, text, topics)
+        return list(self._topics_cache[text])
+
+    def _add_to_cache(self, cache: Dict[str, Any], key: str, value: Any) -> None:
+        """
+        Adds an entry to one of the task-analysis caches, evicting the oldest entry once the cache is full.
+        """
+        if len(cache) >= self._max_cache_entries:
+            del cache[next(iter(cache))]
+        cache[key] = value
+
     def _format_memory_section(self, memories: List[str]) -> str:
         """
         Formats a list of memories as a section for appending to a task description.
@@ -323,15 +406,14 @@ async def _test_for_failure(
         self.logger.info("\nExpected answer:  {}\n".format(expected_answer))
 
         assert self.task_assignment_callback is not None
-        failure_found = False
-        response, work_history = "", ""
+        task_assignment_callback = self.task_assignment_callback
 
-        for trial in range(self.max_test_trials):
+        async def run_trial(trial: int) -> Tuple[bool, str, str]:
             self.logger.info("\n-----  TRIAL {}  -----\n".format(trial + 1))
 
             # Attempt to solve the task.
             self.logger.info("Try to solve the task.")
-            response, work_history = await self.task_assignment_callback(task_plus_insights)
+            response, work_history = await task_assignment_callback(task_plus_insights)
 
             response_is_correct, extracted_answer = await self.grader.is_response_correct(
                 task, response, expected_answer
@@ -341,12 +423,72 @@ async def _test_for_failure(
                 self.logger.info("Answer is CORRECT.\n")
             else:
                 self.logger.info("Answer is INCORRECT.\n  Stop testing, and return the details of the failure.\n")
-                failure_found = True
-                break
+            return response_is_correct, response, work_history
+
+        # Stop at the first failure, cancelling any trials still running.
+        results = await self._run_trials(self.max_test_trials, run_trial, stop=lambda result: not result[0])
+        failures = [result for result in results.values() if not result[0]]
+        if len(failures) > 0:
+            failure_found, response, work_history = True, failures[0][1], failures[0][2]
+        elif len(results) > 0:
+            failure_found, response, work_history = False, results[max(results)][1], results[max(results)][2]
+        else:
+            failure_found, response, work_history = False, "", ""
 
         self.logger.leave_function()
         return failure_found, response, work_history
 
+    async def _run_trials(
+        self,
+        num_trials: int,
+        run_trial: Callable[[int], Awaitable[T]],
+        stop: Callable[[T], bool] | None = None,
+    ) -> Dict[int, T]:
+        """
+        Runs the trials, up to max_concurrent_trials at a time, and returns their results keyed by trial index.
+        If stop() returns True for a result, no more trials are started and those still running are cancelled.
+        """
+        results: Dict[int, T] = {}
+        durations: List[float] = []
+        in_flight: Dict["asyncio.Future[T]", int] = {}
+        next_trial = 0
+        parallelism = max(1, self.max_concurrent_trials)
+        start_time = time.perf_counter()
+
+        async def timed_trial(trial: int) -> T:
+            trial_start_time = time.perf_counter()
+            result = await run_trial(trial)
+            durations.append(time.perf_counter() - trial_start_time)
+            return result
+
+        try:
+            stopped = False
+            while not stopped and (next_trial < num_trials or len(in_flight) > 0):
+                while next_trial < num_trials and len(in_flight) < parallelism:
+                    in_flight[asyncio.ensure_future(timed_trial(next_trial))] = next_trial
+                    next_trial += 1
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for future in sorted(done, key=lambda future: in_flight[future]):
+                    trial = in_flight.pop(future)
+                    results[trial] = future.result()
+                    if stop is not None and stop(results[trial]):
+                        stopped = True
+                        break
+        finally:
+            for future in in_flight:
+                future.cancel()
+            if len(in_flight) > 0:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+        # Log the aggregate timing, to show how much the concurrency saved.
+        wall_time = time.perf_counter() - start_time
+        self.logger.info(
+            "\n{} of {} trials finished in {:.1f}s, {} at a time (total trial time {:.1f}s, {} cancelled)\n".format(
+                len(results), num_trials, wall_time, parallelism, sum(durations), len(in_flight)
+            )
+        )
+        return results
+
     async def _iterate_on_task(self, task: str, expected_answer: str) -> Tuple[str, None | str]:
         """
         Repeatedly assigns a task to the agent, and tries to learn from failures by creating useful insights as memories.
@@ -2,7 +2,8 @@
 import json
 import os
 import shutil
-from typing import Any, Dict, List, Mapping, Optional, Sequence, TypedDict
+from contextvars import ContextVar
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, TypedDict
 
 from autogen_agentchat.base import TaskResult
 from autogen_agentchat.messages import BaseAgentEvent, BaseChatMessage
@@ -510,31 +511,51 @@ def flush(self) -> None:
             f.flush()
 
 
+# The function pages opened by the current task and the tasks that started it, across all page stacks.
+_task_pages: ContextVar[Tuple[Tuple["PageStack", Page], ...]] = ContextVar("task_pages", default=())
+
+
 class PageStack:
     """
     A call stack containing a list of currently active function pages in the order they called each other.
+    Each task sees the pages opened by itself and by the tasks that started it, so functions running concurrently
+    as separate asyncio tasks nest their pages under the task that started them, rather than popping each other's pages.
     """
 
     def __init__(self) -> None:
-        self.stack: List[Page] = []
+        # The number of pages still open in any task, which tells finalize() whether the app is exiting early.
+        self._num_open_pages = 0
+
+    @property
+    def stack(self) -> List[Page]:
+        """The pages in the stack of the current task, from bottom to top."""
+        return [page for stack, page in _task_pages.get() if stack is self]
 
     def push(self, page: Page) -> None:
         """Adds a page to the top of the stack."""
-        self.stack.append(page)
+        _task_pages.set(_task_pages.get() + ((self, page),))
+        self._num_open_pages += 1
 
     def pop(self) -> Page:
         """Removes and returns the top page from the stack"""
-        return self.stack.pop()
+        entries = _task_pages.get()
+        for i in range(len(entries) - 1, -1, -1):
+            if entries[i][0] is self:
+                _task_pages.set(entries[:i] + entries[i + 1 :])
+                self._num_open_pages -= 1
+                return entries[i][1]
+        raise IndexError("pop from empty page stack")
 
     def size(self) -> int:
-        """Returns the number of pages in the stack."""
-        return len(self.stack)
+        """Returns the number of pages still open in any task."""
+        return self._num_open_pages
 
     def top(self) -> Page | None:
         """Returns the top page from the stack without removing it"""
-        if self.size() == 0:
+        stack = self.stack
+        if len(stack) == 0:
             return None
-        return self.stack[-1]
+        return stack[-1]
 
     def write_stack_to_page(self, page: Page) -> None:
         # Logs a properly indented string displaying the current call stack.
@@ -1,5 +1,5 @@
 import difflib
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 try:  # pragma: no cover
     from unidiff import PatchSet
@@ -8,17 +8,41 @@
 
 from ._canvas import BaseCanvas
 
+# A forward delta: replace lines ``[start:end]`` of the previous revision with ``lines``.
+LineDelta = List[Tuple[int, int, List[str]]]
+
 
 class FileRevision:
-    """Tracks the history of one file's content."""
+    """Tracks the history of one file's content.
+
+    A revision either holds a full *snapshot* of the content or a *delta* against
+    the previous revision, see :meth:`TextCanvas.get_revision_content`.
+    """
 
-    __slots__ = ("content", "revision")
+    __slots__ = ("snapshot", "delta", "revision")
 
-    def __init__(self, content: str, revision: int) -> None:
-        self.content: str = content
+    def __init__(self, revision: int, snapshot: Optional[str] = None, delta: Optional[LineDelta] = None) -> None:
+        self.snapshot: Optional[str] = snapshot
+        self.delta: Optional[LineDelta] = delta
         self.revision: int = revision  # e.g. an integer, a timestamp, or git hash
 
 
+def _compute_delta(old_lines: List[str], new_lines: List[str]) -> LineDelta:
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
+    return [(i1, i2, new_lines[j1:j2]) for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"]
+
+
+def _apply_delta(old_lines: List[str], delta: LineDelta) -> List[str]:
+    new_lines: List[str] = []
+    position = 0
+    for start, end, lines in delta:
+        new_lines.extend(old_lines[position:start])
+        new_lines.extend(lines)
+        position = end
+    new_lines.extend(old_lines[position:])
+    return new_lines
+
+
 class TextCanvas(BaseCanvas):
     """An in‑memory canvas that stores *text* files with full revision history.
 
@@ -34,17 +58,33 @@ class TextCanvas(BaseCanvas):
     * **get_revision_diffs** – obtain the list of diffs applied between every
       consecutive pair of revisions so that a caller can replay or audit the
       full change history.
+
+    Only every *snapshot_interval*-th revision keeps a full copy of the file,
+    the others store a compact line delta against the previous revision, so
+    iterating on a large file does not hold a copy per revision. Diffs are
+    cached since revisions never change once written.
+
+    Args:
+        snapshot_interval (int, optional): Store a full snapshot every this many
+            revisions. Defaults to 10.
     """
 
     # ----------------------------------------------------------------------------------
     # Construction helpers
     # ----------------------------------------------------------------------------------
 
-    def __init__(self) -> None:
+    def __init__(self, snapshot_interval: int = 10) -> None:
+        if snapshot_interval < 1:
+            raise ValueError("snapshot_interval must be at least 1.")
+        self._snapshot_interval = snapshot_interval
         # For each file we keep an *ordered* list of FileRevision where the last
         # element is the most recent.  Using a list keeps the memory footprint
         # small and preserves order without any extra bookkeeping.
         self._files: Dict[str, List[FileRevision]] = {}
+        # The content of the newest revision of each file, so that reads and
+        # new deltas do not need a replay.
+        self._latest: Dict[str, str] = {}
+        self._diff_cache: Dict[Tuple[str, int, int], str] = {}
 
     # ----------------------------------------------------------------------------------
     # Internal utilities
@@ -58,6 +98,43 @@ def _ensure_file(self, filename: str) -> None:
         if filename not in self._files:
             raise ValueError(f"File '{filename}' does not exist on the canvas; create it first.")
 
+    def _revision_index(self, filename: str, revision: int) -> int:
+        """Return the index of *revision*, or -1 if it does not exist."""
+        revisions = self._files.get(filename, [])
+        # Revision numbers are consecutive, starting at 1.
+        idx = revision - revisions[0].revision if revisions else -1
+        return idx if 0 <= idx < len(revisions) else -1
+
+    def _content_at(self, filename: str, idx: int) -> str:
+        """Rebuild the content at index *idx* by replaying deltas from the nearest snapshot."""
+        revisions = self._files[filename]
+        if idx == len(revisions) - 1:
+            return self._latest[filename]
+        base = idx
+        while revisions[base].snapshot is None:
+            base -= 1
+        snapshot = revisions[base].snapshot
+        assert snapshot is not None
+        if base == idx:
+            return snapshot
+        lines = snapshot.splitlines(keepends=True)
+        for rev in revisions[base + 1 : idx + 1]:
+            assert rev.delta is not None
+            lines = _apply_delta(lines, rev.delta)
+        return "".join(lines)
+
+    def _unified_diff(self, filename: str, from_revision: int, to_revision: int) -> str:
+        key = (filename, from_revision, to_revision)
+        if key not in self._diff_cache:
+            diff = difflib.unified_diff(
+                self.get_revision_content(filename, from_revision).splitlines(keepends=True),
+                self.get_revision_content(filename, to_revision).splitlines(keepends=True),
+                fromfile=f"{filename}@r{from_revision}",
+                tofile=f"{filename}@r{to_revision}",
+            )
+            self._diff_cache[key] = "".join(diff)
+        return self._diff_cache[key]
+
     # ----------------------------------------------------------------------------------
     # Revision inspection helpers
     # ----------------------------------------------------------------------------------
@@ -68,10 +145,10 @@ def get_revision_content(self, filename: str, revision: int) -> str:  # NEW 🚀
         If the revision does not exist an empty string is returned so that
         downstream code can handle the "not found" case without exceptions.
         """
-        for rev in self._files.get(filename, []):
-            if rev.revision == revision:
-                return rev.content
-        return ""
+        idx = self._revision_index(filename, revision)
+        if idx < 0:
+            return ""
+        return self._content_at(filename, idx)
 
     def get_revision_diffs(self, filename: str) -> List[str]:  # NEW 🚀
         """Return a *chronological* list of unified‑diffs for *filename*.
@@ -80,17 +157,10 @@ def get_revision_diffs(self, filename: str) -> List[str]:  # NEW 🚀
         revision *n* into revision *n+1* (starting at revision 1 → 2).
         """
         revisions = self._files.get(filename, [])
-        diffs: List[str] = []
-        for i in range(1, len(revisions)):
-            older, newer = revisions[i - 1], revisions[i]
-            diff = difflib.unified_diff(
-                older.content.splitlines(keepends=True),
-                newer.content.splitlines(keepends=True),
-                fromfile=f"{filename}@r{older.revision}",
-                tofile=f"{filename}@r{newer.revision}",
-            )
-            diffs.append("".join(diff))
-        return diffs
+        return [
+            self._unified_diff(filename, older.revision, newer.revision)
+            for older, newer in zip(revisions, revisions[1:], strict=False)
+        ]
 
     # ----------------------------------------------------------------------------------
     # BaseCanvas interface implementation
@@ -102,8 +172,7 @@ def list_files(self) -> Dict[str, int]:
 
     def get_latest_content(self, filename: str) -> str:  # noqa: D401 – keep API identical
         """Return the most recent content or an empty string if the file is new."""
-        revs = self._files.get(filename, [])
-        return revs[-1].content if revs else ""
+        return self._latest.get(filename, "")
 
     def add_or_update_file(self, filename: str, new_content: Union[str, bytes, Any]) -> None:
         """Create *filename* or append a new revision containing *new_content*."""
@@ -112,10 +181,22 @@ def add_or_update_file(self, filename: str, new_content: Union[str, bytes, Any])
         if not isinstance(new_content, str):
             raise ValueError(f"Expected str or bytes, got {type(new_content)}")
         if filename not in self._files:
-            self._files[filename] = [FileRevision(new_content, 1)]
+            self._files[filename] = [FileRevision(1, snapshot=new_content)]
         else:
-            last_rev_num = self._files[filename][-1].revision
-            self._files[filename].append(FileRevision(new_content, last_rev_num + 1))
+            revisions = self._files[filename]
+            revision = revisions[-1].revision + 1
+            new_lines = new_content.splitlines(keepends=True)
+            delta: Optional[LineDelta] = None
+            if len(revisions) % self._snapshot_interval != 0:
+                delta = _compute_delta(self._latest[filename].splitlines(keepends=True), new_lines)
+                # Rewrites are cheaper to store as a snapshot.
+                if sum(len(lines) for _, _, lines in delta) > len(new_lines) // 2:
+                    delta = None
+            if delta is None:
+                revisions.append(FileRevision(revision, snapshot=new_content))
+            else:
+                revisions.append(FileRevision(revision, delta=delta))
+        self._latest[filename] = new_content
 
     def get_diff(self, filename: str, from_revision: int, to_revision: int) -> str:
         """Return a unified diff between *from_revision* and *to_revision*."""
@@ -127,13 +208,7 @@ def get_diff(self, filename: str, from_revision: int, to_revision: int) -> str:
         to_content = self.get_revision_content(filename, to_revision)
         if from_content == "" and to_content == "":  # one (or both) revision ids not found
             return ""
-        diff = difflib.unified_diff(
-            from_content.splitlines(keepends=True),
-            to_content.splitlines(keepends=True),
-            fromfile=f"{filename}@r{from_revision}",
-            tofile=f"{filename}@r{to_revision}",
-        )
-        return "".join(diff)
+        return self._unified_diff(filename, from_revision, to_revision)
 
     def apply_patch(self, filename: str, patch_data: Union[str, bytes, Any]) -> None:
         """Apply *patch_text* (unified diff) to the latest revision and save a new revision.
@@ -186,7 +261,27 @@ def get_all_contents_for_context(self) -> str:  # noqa: D401 – keep public API
         """Return a summarised view of every file and its *latest* revision."""
         out: List[str] = ["=== CANVAS FILES ==="]
         for fname, revs in self._files.items():
-            latest = revs[-1]
-            out.append(f"File: {fname} (rev {latest.revision}):\n{latest.content}\n")
+            out.append(f"File: {fname} (rev {revs[-1].revision}):\n{self._latest[fname]}\n")
         out.append("=== END OF CANVAS ===")
         return "\n".join(out)
+
+    def get_changed_contents_for_context(self, since: Mapping[str, int]) -> str:
+        """Return the latest revision of every file that changed after the revisions in *since*.
+
+        *since* maps filenames to the revision the reader already has, files missing
+        from it are treated as new. Returns an empty string if nothing changed.
+        """
+        out: List[str] = []
+        for fname, revs in self._files.items():
+            latest = revs[-1].revision
+            if since.get(fname) != latest:
+                out.append(f"File: {fname} (rev {latest}):\n{self._latest[fname]}\n")
+        if not out:
+            return ""
+        return "\n".join(
+            [
+                "=== CANVAS UPDATES (replacing earlier revisions of these files) ===",
+                *out,
+                "=== END OF CANVAS UPDATES ===",
+            ]
+        )
@@ -1,4 +1,6 @@
-from typing import Any, Optional
+import weakref
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 from autogen_core import CancellationToken
 from autogen_core.memory import (
@@ -9,12 +11,21 @@
     UpdateContextResult,
 )
 from autogen_core.model_context import ChatCompletionContext
-from autogen_core.models import SystemMessage
+from autogen_core.models import LLMMessage, SystemMessage
 
 from ._canvas_writer import ApplyPatchTool, UpdateFileTool
 from ._text_canvas import TextCanvas
 
 
+@dataclass
+class _ContextState:
+    """What a model context has already received from the canvas."""
+
+    canvas: TextCanvas
+    revisions: Dict[str, int]
+    messages: List[LLMMessage] = field(default_factory=list)
+
+
 class TextCanvasMemory(Memory):
     """
     A memory implementation that uses a Canvas for storing file-like content.
@@ -26,7 +37,9 @@ class TextCanvasMemory(Memory):
 
     The TextCanvasMemory provides a persistent, file-like storage mechanism that can be used
     by agents to read and write content. It automatically injects the current state of all files
-    in the canvas into the model context before each inference.
+    in the canvas into the model context before each inference. On later turns, only the files
+    that changed since the previous injection into the same model context are sent; the full canvas
+    is sent again if the earlier canvas messages are no longer in the context.
 
     This is particularly useful for:
     - Allowing agents to create and modify documents over multiple turns
@@ -174,16 +187,39 @@ async def main():
     def __init__(self, canvas: Optional[TextCanvas] = None):
         super().__init__()
         self.canvas = canvas if canvas is not None else TextCanvas()
+        self._context_states: weakref.WeakKeyDictionary[ChatCompletionContext, _ContextState] = (
+            weakref.WeakKeyDictionary()
+        )
 
     async def update_context(self, model_context: ChatCompletionContext) -> UpdateContextResult:
         """
-        Inject the entire canvas summary (or a selected subset) as reference data.
+        Inject the canvas summary as reference data.
         Here, we just put it into a system message, but you could customize.
+
+        The first time, every file is injected. After that, only the files that changed since the
+        last injection into this model context are, unless the earlier canvas messages were dropped
+        from the context (e.g. by a buffered context, or a clear), in which case every file is injected again.
         """
-        snapshot = self.canvas.get_all_contents_for_context()
+        state = self._context_states.get(model_context)
+        if state is not None and state.canvas is self.canvas and state.messages:
+            present = {id(message) for message in await model_context.get_messages()}
+            if not all(id(sent) in present for sent in state.messages):
+                state = None
+        else:
+            state = None
+
+        if state is None:
+            snapshot = self.canvas.get_all_contents_for_context()
+            state = _ContextState(canvas=self.canvas, revisions={})
+            self._context_states[model_context] = state
+        else:
+            snapshot = self.canvas.get_changed_contents_for_context(state.revisions)
+
         if snapshot.strip():
             msg = SystemMessage(content=snapshot)
             await model_context.add_message(msg)
+            state.messages.append(msg)
+            state.revisions = self.canvas.list_files()
 
             # Return it for debugging/logging
             memory_content = MemoryContent(content=snapshot, mime_type=MemoryMimeType.TEXT)
@@ -212,6 +248,7 @@ async def clear(self) -> None:
         """Clear the entire canvas by replacing it with a new empty instance."""
         # Create a new TextCanvas instance instead of calling __init__ directly
         self.canvas = TextCanvas()
+        self._context_states.clear()
 
     async def close(self) -> None:
         pass
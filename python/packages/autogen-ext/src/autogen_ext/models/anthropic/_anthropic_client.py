@@ -1,5 +1,4 @@
 import asyncio
-import base64
 import inspect
 import json
 import logging
@@ -128,20 +127,13 @@ def type_to_role(message: LLMMessage) -> str:
 
 def get_mime_type_from_image(image: Image) -> Literal["image/jpeg", "image/png", "image/gif", "image/webp"]:
     """Get a valid Anthropic media type from an Image object."""
-    # Get base64 data first
-    base64_data = image.to_base64()
-
-    # Decode the base64 string
-    image_data = base64.b64decode(base64_data)
-
-    # Check the first few bytes for known signatures
-    if image_data.startswith(b"\xff\xd8\xff"):
-        return "image/jpeg"
-    elif image_data.startswith(b"\x89PNG\r\n\x1a\n"):
+    # The image records the MIME type of its encoded form, which is always one of these.
+    mime_type = image.mime_type
+    if mime_type == "image/png":
         return "image/png"
-    elif image_data.startswith(b"GIF87a") or image_data.startswith(b"GIF89a"):
+    elif mime_type == "image/gif":
         return "image/gif"
-    elif image_data.startswith(b"RIFF") and image_data[8:12] == b"WEBP":
+    elif mime_type == "image/webp":
         return "image/webp"
     else:
         # Default to JPEG as a fallback
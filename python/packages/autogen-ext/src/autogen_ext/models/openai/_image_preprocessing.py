@@ -0,0 +1,163 @@
+import asyncio
+import logging
+from io import BytesIO
+from typing import Any, Dict, Iterable, List, Literal, Tuple
+from weakref import WeakKeyDictionary
+
+from autogen_core import TRACE_LOGGER_NAME, Image
+from PIL import Image as PILImage
+
+trace_logger = logging.getLogger(TRACE_LOGGER_NAME)
+
+ImageDetail = Literal["auto", "low", "high"]
+
+# The sizes OpenAI vision models scale images to before tokenizing them.
+MAX_LONG_EDGE = 2048
+MAX_SHORT_EDGE = 768
+LOW_DETAIL_SIZE = 512
+
+
+def get_max_useful_size(width: int, height: int, detail: str = "auto") -> Tuple[int, int]:
+    """Return the size the model scales a ``width`` x ``height`` image to at the given detail level.
+
+    Pixels beyond this size are discarded by the model, so sending them only adds to the request size.
+    With "low" detail, the image is scaled to fit within a 512 x 512 square. Otherwise ("high" or "auto",
+    which may pick "high"), it is scaled to fit within a 2048 x 2048 square, and then so that its
+    shortest side is 768 if both sides exceed 768. Images are never scaled up."""
+    if detail == "low":
+        if width > LOW_DETAIL_SIZE or height > LOW_DETAIL_SIZE:
+            scale = LOW_DETAIL_SIZE / max(width, height)
+            width, height = max(1, int(width * scale)), max(1, int(height * scale))
+        return width, height
+
+    # Scale down to fit within a MAX_LONG_EDGE x MAX_LONG_EDGE square if necessary
+    if width > MAX_LONG_EDGE or height > MAX_LONG_EDGE:
+        aspect_ratio = width / height
+        if aspect_ratio > 1:
+            width = MAX_LONG_EDGE
+            height = int(MAX_LONG_EDGE / aspect_ratio)
+        else:
+            height = MAX_LONG_EDGE
+            width = int(MAX_LONG_EDGE * aspect_ratio)
+
+    # Resize such that the shortest side is MAX_SHORT_EDGE if both dimensions exceed MAX_SHORT_EDGE
+    aspect_ratio = width / height
+    if width > MAX_SHORT_EDGE and height > MAX_SHORT_EDGE:
+        if aspect_ratio > 1:
+            height = MAX_SHORT_EDGE
+            width = int(MAX_SHORT_EDGE * aspect_ratio)
+        else:
+            width = MAX_SHORT_EDGE
+            height = int(MAX_SHORT_EDGE / aspect_ratio)
+
+    return width, height
+
+
+class ImagePreprocessor:
+    """Downscales images to the largest size the model makes use of at the requested detail level,
+    see :func:`get_max_useful_size`, before they are embedded in a request.
+
+    JPEG images are re-encoded as JPEG, other images as PNG. The original image is kept when it is
+    already small enough, or when the re-encoded image would not be smaller. The result is cached per
+    image and detail level for as long as the image is alive, so an image that is sent with every
+    request of a conversation is only processed once. The bytes saved are counted in :attr:`bytes_saved`.
+    Resizing and re-encoding large images is slow, so :meth:`prepare` does it in a worker thread before
+    the images are converted with :meth:`process`.
+    """
+
+    def __init__(self, jpeg_quality: int = 90) -> None:
+        self._jpeg_quality = jpeg_quality
+        # None marks an image that is sent as is. Caching the image itself would keep it alive, as
+        # the value would hold a strong reference to its own weak key.
+        self._cache: WeakKeyDictionary[Image, Dict[str, Image | None]] = WeakKeyDictionary()
+        self._num_images = 0
+        self._num_downscaled = 0
+        self._bytes_saved = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The cache holds weak references, which cannot be pickled. It starts empty again when unpickled.
+        state = self.__dict__.copy()
+        del state["_cache"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._cache = WeakKeyDictionary()
+
+    @property
+    def num_images(self) -> int:
+        """The number of distinct images processed."""
+        return self._num_images
+
+    @property
+    def num_downscaled(self) -> int:
+        """The number of images that were replaced by a smaller one."""
+        return self._num_downscaled
+
+    @property
+    def bytes_saved(self) -> int:
+        """The total number of encoded bytes removed from the images, counting each image once."""
+        return self._bytes_saved
+
+    def process(self, image: Image, detail: ImageDetail = "auto") -> Image:
+        """Return the image to send at the given detail level, either a downscaled copy or the image itself."""
+        cached = self._cache.get(image)
+        if cached is not None and detail in cached:
+            return cached[detail] or image
+        return self._store(image, detail, *self._downscale(image, detail))
+
+    async def prepare(self, images: Iterable[Image], detail: ImageDetail = "auto") -> None:
+        """Process the images that are not cached yet in a worker thread, so that :meth:`process` then
+        returns them without resizing and re-encoding them on the event loop."""
+        pending: Dict[int, Image] = {}
+        for image in images:
+            cached = self._cache.get(image)
+            if cached is None or detail not in cached:
+                pending[id(image)] = image
+        if len(pending) == 0:
+            return
+
+        def downscale_all() -> List[Tuple[Image | None, int]]:
+            return [self._downscale(image, detail) for image in pending.values()]
+
+        results = await asyncio.to_thread(downscale_all)
+        for image, (result, saved) in zip(pending.values(), results, strict=True):
+            self._store(image, detail, result, saved)
+
+    def _downscale(self, image: Image, detail: str) -> Tuple[Image | None, int]:
+        # Returns the downscaled copy and the bytes saved, or None if the image is sent as is.
+        # This may run in a worker thread, so it does not change the state of the preprocessor.
+        width, height = image.image.size
+        target_size = get_max_useful_size(width, height, detail)
+        if target_size == (width, height):
+            return None, 0
+
+        original = image.to_bytes()
+        resized = image.image.resize(target_size, PILImage.Resampling.LANCZOS)
+        buffered = BytesIO()
+        if image.mime_type == "image/jpeg":
+            resized.save(buffered, format="JPEG", quality=self._jpeg_quality)
+        else:
+            resized.save(buffered, format="PNG", optimize=True)
+        data = buffered.getvalue()
+        if len(data) >= len(original):
+            return None, 0
+        return Image.from_bytes(data), len(original) - len(data)
+
+    def _store(self, image: Image, detail: str, result: Image | None, saved: int) -> Image:
+        # Caches and counts the result, unless the image was already processed at this detail level.
+        cached = self._cache.setdefault(image, {})
+        if detail not in cached:
+            cached[detail] = result
+            self._num_images += 1
+            if result is not None:
+                self._num_downscaled += 1
+                self._bytes_saved += saved
+                if trace_logger.isEnabledFor(logging.DEBUG):
+                    width, height = image.image.size
+                    new_width, new_height = result.image.size
+                    trace_logger.debug(
+                        f"Downscaled image from {width}x{height} to {new_width}x{new_height} for {detail} detail, "
+                        f"saving {saved} bytes ({self._bytes_saved} bytes in total)."
+                    )
+        return cached[detail] or image
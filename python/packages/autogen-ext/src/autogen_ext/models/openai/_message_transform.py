@@ -229,8 +229,10 @@ def _set_multimodal_content(
             parts.append(ChatCompletionContentPartTextParam(type="text", text=text))
         elif isinstance(part, Image):
             # TODO: support url based images
-            # TODO: support specifying details
-            parts.append(cast(ChatCompletionContentPartImageParam, part.to_openai_format()))
+            detail = context.get("image_detail", "auto")
+            preprocessor = context.get("image_preprocessor")
+            image = preprocessor.process(part, detail) if preprocessor is not None else part
+            parts.append(cast(ChatCompletionContentPartImageParam, image.to_openai_format(detail)))
         else:
             raise ValueError(f"Unknown content part: {part}")
 
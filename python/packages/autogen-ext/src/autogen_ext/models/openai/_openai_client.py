@@ -19,6 +19,7 @@
     Optional,
     Sequence,
     Set,
+    Tuple,
     Type,
     Union,
     cast,
@@ -75,7 +76,9 @@
 from .._utils.normalize_stop_reason import normalize_stop_reason
 from .._utils.parse_r1_content import parse_r1_content
 from . import _model_info
+from ._image_preprocessing import ImageDetail, ImagePreprocessor, get_max_useful_size
 from ._transformation import (
+    TransformerMap,
     get_transformer,
 )
 from ._utils import assert_valid_name
@@ -162,12 +165,21 @@ def type_to_role(message: LLMMessage) -> ChatCompletionRole:
 
 
 def to_oai_type(
-    message: LLMMessage, prepend_name: bool = False, model: str = "unknown", model_family: str = ModelFamily.UNKNOWN
+    message: LLMMessage,
+    prepend_name: bool = False,
+    model: str = "unknown",
+    model_family: str = ModelFamily.UNKNOWN,
+    image_detail: ImageDetail = "auto",
+    image_preprocessor: ImagePreprocessor | None = None,
+    transformers: TransformerMap | None = None,
 ) -> Sequence[ChatCompletionMessageParam]:
-    context = {
+    context: Dict[str, Any] = {
         "prepend_name": prepend_name,
+        "image_detail": image_detail,
+        "image_preprocessor": image_preprocessor,
     }
-    transformers = get_transformer("openai", model, model_family)
+    if transformers is None:
+        transformers = get_transformer("openai", model, model_family)
 
     def raise_value_error(message: LLMMessage, context: Dict[str, Any]) -> Sequence[ChatCompletionMessageParam]:
         raise ValueError(f"Unknown message type: {type(message)}")
@@ -179,42 +191,70 @@ def raise_value_error(message: LLMMessage, context: Dict[str, Any]) -> Sequence[
     return result
 
 
+class _ConvertedMessageCache:
+    """Keeps the OpenAI params converted from the messages of the last request, so that the history sent
+    with every request is only converted once.
+
+    Entries are keyed by message identity and transformer map, and are only used while the message fields
+    are the same objects as when it was converted: a message whose fields are reassigned is converted again.
+    Changes made in place to a field, such as appending to a content list, are not detected.
+
+    Entries of messages that were not part of the last request are evicted, so that messages dropped from
+    the history (and their image payloads) are not kept alive by the client."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[
+            Tuple[int, int], Tuple[LLMMessage, Tuple[Any, ...], Sequence[ChatCompletionMessageParam]]
+        ] = {}
+        self._used: Set[Tuple[int, int]] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, message: LLMMessage, transformers: TransformerMap) -> Optional[Sequence[ChatCompletionMessageParam]]:
+        key = (id(message), id(transformers))
+        entry = self._entries.get(key)
+        if entry is not None:
+            cached_message, fields, params = entry
+            if cached_message is message and all(
+                a is b for a, b in zip(fields, message.__dict__.values(), strict=True)
+            ):
+                self._used.add(key)
+                self.hits += 1
+                return params
+        self.misses += 1
+        return None
+
+    def put(
+        self, message: LLMMessage, transformers: TransformerMap, params: Sequence[ChatCompletionMessageParam]
+    ) -> None:
+        # The message is kept alive with its entry, so its id is not reused while the entry exists.
+        key = (id(message), id(transformers))
+        self._entries[key] = (message, tuple(message.__dict__.values()), params)
+        self._used.add(key)
+
+    def evict_unused(self) -> None:
+        """Evicts the entries of messages that were not used since the last call."""
+        if len(self._used) < len(self._entries):
+            self._entries = {key: entry for key, entry in self._entries.items() if key in self._used}
+        self._used = set()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._used.clear()
+
+
 def calculate_vision_tokens(image: Image, detail: str = "auto") -> int:
-    MAX_LONG_EDGE = 2048
     BASE_TOKEN_COUNT = 85
     TOKENS_PER_TILE = 170
-    MAX_SHORT_EDGE = 768
     TILE_SIZE = 512
 
     if detail == "low":
         return BASE_TOKEN_COUNT
 
-    width, height = image.image.size
-
-    # Scale down to fit within a MAX_LONG_EDGE x MAX_LONG_EDGE square if necessary
-
-    if width > MAX_LONG_EDGE or height > MAX_LONG_EDGE:
-        aspect_ratio = width / height
-        if aspect_ratio > 1:
-            # Width is greater than height
-            width = MAX_LONG_EDGE
-            height = int(MAX_LONG_EDGE / aspect_ratio)
-        else:
-            # Height is greater than or equal to width
-            height = MAX_LONG_EDGE
-            width = int(MAX_LONG_EDGE * aspect_ratio)
-
-    # Resize such that the shortest side is MAX_SHORT_EDGE if both dimensions exceed MAX_SHORT_EDGE
-    aspect_ratio = width / height
-    if width > MAX_SHORT_EDGE and height > MAX_SHORT_EDGE:
-        if aspect_ratio > 1:
-            # Width is greater than height
-            height = MAX_SHORT_EDGE
-            width = int(MAX_SHORT_EDGE * aspect_ratio)
-        else:
-            # Height is greater than or equal to width
-            width = MAX_SHORT_EDGE
-            height = int(MAX_SHORT_EDGE / aspect_ratio)
+    width, height = get_max_useful_size(*image.image.size, detail=detail)
 
     # Calculate the number of tiles based on TILE_SIZE
 
@@ -281,6 +321,7 @@ def count_tokens_openai(
     add_name_prefixes: bool = False,
     tools: Sequence[Tool | ToolSchema] = [],
     model_family: str = ModelFamily.UNKNOWN,
+    image_detail: ImageDetail = "auto",
 ) -> int:
     try:
         encoding = tiktoken.encoding_for_model(model)
@@ -294,7 +335,9 @@ def count_tokens_openai(
     # Message tokens.
     for message in messages:
         num_tokens += tokens_per_message
-        oai_message = to_oai_type(message, prepend_name=add_name_prefixes, model=model, model_family=model_family)
+        oai_message = to_oai_type(
+            message, prepend_name=add_name_prefixes, model=model, model_family=model_family, image_detail=image_detail
+        )
         for oai_message_part in oai_message:
             for key, value in oai_message_part.items():
                 if value is None:
@@ -310,8 +353,7 @@ def count_tokens_openai(
                     # We need image properties that are only in the original message
                     for part, content_part in zip(typed_message_value, message.content, strict=False):
                         if isinstance(content_part, Image):
-                            # TODO: add detail parameter
-                            num_tokens += calculate_vision_tokens(content_part)
+                            num_tokens += calculate_vision_tokens(content_part, detail=image_detail)
                         elif isinstance(part, str):
                             num_tokens += len(encoding.encode(part))
                         else:
@@ -387,9 +429,14 @@ def __init__(
         model_capabilities: Optional[ModelCapabilities] = None,  # type: ignore
         model_info: Optional[ModelInfo] = None,
         add_name_prefixes: bool = False,
+        image_detail: ImageDetail = "auto",
+        downscale_images: bool = False,
     ):
         self._client = client
         self._add_name_prefixes = add_name_prefixes
+        self._image_detail: ImageDetail = image_detail
+        self._image_preprocessor = ImagePreprocessor() if downscale_images else None
+        self._converted_messages = _ConvertedMessageCache()
         if model_capabilities is None and model_info is None:
             try:
                 self._model_info = _model_info.get_info(create_args["model"])
@@ -427,6 +474,8 @@ def __init__(
             raise ValueError("Model does not support JSON output.")
 
         self._create_args = create_args
+        # Resolve the message transformers for the configured model once, rather than on every message.
+        self._transformers = get_transformer("openai", create_args.get("model", "unknown"), self._model_info["family"])
         self._total_usage = RequestUsage(prompt_tokens=0, completion_tokens=0)
         self._actual_usage = RequestUsage(prompt_tokens=0, completion_tokens=0)
 
@@ -558,17 +607,29 @@ def _process_create_args(
             # When Claude models last message is AssistantMessage, It could not end with whitespace
             messages = self._rstrip_last_assistant_message(messages)
 
-        oai_messages_nested = [
-            to_oai_type(
-                m,
-                prepend_name=self._add_name_prefixes,
-                model=create_args.get("model", "unknown"),
-                model_family=self._model_info["family"],
-            )
-            for m in messages
-        ]
-
-        oai_messages = [item for sublist in oai_messages_nested for item in sublist]
+        model = create_args.get("model", "unknown")
+        if model == self._create_args.get("model", "unknown"):
+            transformers = self._transformers
+        else:
+            transformers = get_transformer("openai", model, self._model_info["family"])
+
+        oai_messages: List[ChatCompletionMessageParam] = []
+        for m in messages:
+            # Messages already sent in previous requests are not converted again.
+            oai_message = self._converted_messages.get(m, transformers)
+            if oai_message is None:
+                oai_message = to_oai_type(
+                    m,
+                    prepend_name=self._add_name_prefixes,
+                    model=model,
+                    model_family=self._model_info["family"],
+                    image_detail=self._image_detail,
+                    image_preprocessor=self._image_preprocessor,
+                    transformers=transformers,
+                )
+                self._converted_messages.put(m, transformers, oai_message)
+            oai_messages.extend(oai_message)
+        self._converted_messages.evict_unused()
 
         if self.model_info["function_calling"] is False and len(tools) > 0:
             raise ValueError("Model does not support function calling")
@@ -582,6 +643,20 @@ def _process_create_args(
             create_args=create_args,
         )
 
+    async def _prepare_images(self, messages: Sequence[LLMMessage]) -> None:
+        """Downscales the images of the messages in a worker thread, so that converting them does not block the event loop."""
+        if self._image_preprocessor is None:
+            return
+        images = [
+            part
+            for message in messages
+            if isinstance(message, UserMessage) and isinstance(message.content, list)
+            for part in message.content
+            if isinstance(part, Image)
+        ]
+        if len(images) > 0:
+            await self._image_preprocessor.prepare(images, self._image_detail)
+
     async def create(
         self,
         messages: Sequence[LLMMessage],
@@ -591,6 +666,7 @@ async def create(
         extra_create_args: Mapping[str, Any] = {},
         cancellation_token: Optional[CancellationToken] = None,
     ) -> CreateResult:
+        await self._prepare_images(messages)
         create_params = self._process_create_args(
             messages,
             tools,
@@ -764,6 +840,7 @@ async def create_stream(
             - `presence_penalty` (float): A value between -2.0 and 2.0 that penalizes new tokens based on whether they appear in the text so far, encouraging the model to talk about new topics.
         """
 
+        await self._prepare_images(messages)
         create_params = self._process_create_args(
             messages,
             tools,
@@ -1071,8 +1148,16 @@ def count_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool |
             add_name_prefixes=self._add_name_prefixes,
             tools=tools,
             model_family=self._model_info["family"],
+            image_detail=self._image_detail,
         )
 
+    @property
+    def image_bytes_saved(self) -> int:
+        """The number of image bytes left out of requests by downscaling, see the `downscale_images` option."""
+        if self._image_preprocessor is None:
+            return 0
+        return self._image_preprocessor.bytes_saved
+
     def remaining_tokens(self, messages: Sequence[LLMMessage], *, tools: Sequence[Tool | ToolSchema] = []) -> int:
         token_limit = _model_info.get_token_limit(self._create_args["model"])
         return token_limit - self.count_tokens(messages, tools=tools)
@@ -1171,6 +1256,13 @@ class OpenAIChatCompletionClient(BaseOpenAIChatCompletionClient, Component[OpenA
             "this is content" becomes "Reviewer said: this is content."
             This can be useful for models that do not support the `name` field in
             message. Defaults to False.
+        image_detail (optional, str): The `detail` level, "auto", "low" or "high", requested for the images in
+            :class:`~autogen_core.models.UserMessage` content. Defaults to "auto".
+        downscale_images (optional, bool): Whether to downscale images to the largest size the model makes use of
+            at the `image_detail` level before sending them. This makes requests with large images, such as
+            screenshots, smaller and faster to upload, without changing what the model sees. Only enable it for
+            models that scale images the way OpenAI models do. The bytes saved are available from
+            :attr:`image_bytes_saved`. Defaults to False.
         stream_options (optional, dict): Additional options for streaming. Currently only `include_usage` is supported.
 
     Examples:
@@ -1370,6 +1462,9 @@ def __init__(self, **kwargs: Unpack[OpenAIClientConfiguration]):
         if "add_name_prefixes" in kwargs:
             add_name_prefixes = kwargs["add_name_prefixes"]
 
+        image_detail: ImageDetail = kwargs.get("image_detail", "auto")
+        downscale_images: bool = kwargs.get("downscale_images", False)
+
         # Special handling for Gemini model.
         assert "model" in copied_args and isinstance(copied_args["model"], str)
         if copied_args["model"].startswith("gemini-"):
@@ -1397,16 +1492,24 @@ def __init__(self, **kwargs: Unpack[OpenAIClientConfiguration]):
             model_capabilities=model_capabilities,
             model_info=model_info,
             add_name_prefixes=add_name_prefixes,
+            image_detail=image_detail,
+            downscale_images=downscale_images,
         )
 
     def __getstate__(self) -> Dict[str, Any]:
         state = self.__dict__.copy()
         state["_client"] = None
+        # Transformers are closures, which cannot be pickled. They are resolved again when unpickled.
+        del state["_transformers"]
+        state["_converted_messages"] = _ConvertedMessageCache()
         return state
 
     def __setstate__(self, state: Dict[str, Any]) -> None:
         self.__dict__.update(state)
         self._client = _openai_client_from_config(state["_raw_config"])
+        self._transformers = get_transformer(
+            "openai", self._create_args.get("model", "unknown"), self._model_info["family"]
+        )
 
     def _to_config(self) -> OpenAIClientConfigurationConfigModel:
         copied_config = self._raw_config.copy()
@@ -1498,6 +1601,9 @@ class AzureOpenAIChatCompletionClient(
         top_p (optional, float):
         user (optional, str):
         default_headers (optional, dict[str, str]):  Custom headers; useful for authentication or other custom requirements.
+        image_detail (optional, str): The `detail` level requested for images. Defaults to "auto".
+        downscale_images (optional, bool): Whether to downscale images to the largest size the model makes use of
+            at the `image_detail` level before sending them. Defaults to False.
 
 
     To use the client, you need to provide your deployment name, Azure Cognitive Services endpoint, and api version.
@@ -1589,6 +1695,9 @@ def __init__(self, **kwargs: Unpack[AzureOpenAIClientConfiguration]):
         if "add_name_prefixes" in kwargs:
             add_name_prefixes = kwargs["add_name_prefixes"]
 
+        image_detail: ImageDetail = kwargs.get("image_detail", "auto")
+        downscale_images: bool = kwargs.get("downscale_images", False)
+
         client = _azure_openai_client_from_config(copied_args)
         create_args = _create_args_from_config(copied_args)
         self._raw_config: Dict[str, Any] = copied_args
@@ -1598,16 +1707,24 @@ def __init__(self, **kwargs: Unpack[AzureOpenAIClientConfiguration]):
             model_capabilities=model_capabilities,
             model_info=model_info,
             add_name_prefixes=add_name_prefixes,
+            image_detail=image_detail,
+            downscale_images=downscale_images,
         )
 
     def __getstate__(self) -> Dict[str, Any]:
         state = self.__dict__.copy()
         state["_client"] = None
+        # Transformers are closures, which cannot be pickled. They are resolved again when unpickled.
+        del state["_transformers"]
+        state["_converted_messages"] = _ConvertedMessageCache()
         return state
 
     def __setstate__(self, state: Dict[str, Any]) -> None:
         self.__dict__.update(state)
         self._client = _azure_openai_client_from_config(state["_raw_config"])
+        self._transformers = get_transformer(
+            "openai", self._create_args.get("model", "unknown"), self._model_info["family"]
+        )
 
     def _to_config(self) -> AzureOpenAIClientConfigurationConfigModel:
         from ...auth.azure import AzureTokenProvider
@@ -1,5 +1,5 @@
 from collections import defaultdict
-from typing import Any, Callable, Dict, List, get_args
+from typing import Any, Callable, Dict, List, Tuple, get_args
 
 from autogen_core.models import LLMMessage, ModelFamily
 
@@ -12,6 +12,11 @@
 # Each model family (e.g. "gpt-4o", "gemini-1.5-flash") maps to a dict of LLMMessage type → transformer function
 MESSAGE_TRANSFORMERS: Dict[str, Dict[str, TransformerMap]] = defaultdict(dict)
 
+_KNOWN_MODEL_FAMILIES = frozenset(get_args(ModelFamily.ANY))
+
+# (api, model) → model family found by _find_model_family, cleared whenever a transformer is registered.
+_MODEL_FAMILY_CACHE: Dict[Tuple[str, str], str] = {}
+
 
 def build_transformer_func(
     funcs: List[Callable[[LLMMessage, Dict[str, Any]], Dict[str, Any]]], message_param_func: Callable[..., Any]
@@ -80,6 +85,7 @@ def register_transformer(api: str, model_family: str, transformer_map: Transform
         })
     """
     MESSAGE_TRANSFORMERS[api][model_family] = transformer_map
+    _MODEL_FAMILY_CACHE.clear()
 
 
 def _find_model_family(api: str, model: str) -> str:
@@ -87,6 +93,9 @@ def _find_model_family(api: str, model: str) -> str:
     Finds the best matching model family for the given model.
     Search via prefix matching (e.g. "gpt-4o" → "gpt-4o-1.0").
     """
+    cached = _MODEL_FAMILY_CACHE.get((api, model))
+    if cached is not None:
+        return cached
     len_family = 0
     family = ModelFamily.UNKNOWN
     for _family in MESSAGE_TRANSFORMERS[api].keys():
@@ -94,6 +103,7 @@ def _find_model_family(api: str, model: str) -> str:
             if len(_family) > len_family:
                 family = _family
                 len_family = len(_family)
+    _MODEL_FAMILY_CACHE[(api, model)] = family
     return family
 
 
@@ -111,7 +121,7 @@ def get_transformer(api: str, model: str, model_family: str) -> TransformerMap:
     Keeping this as a function (instead of direct dict access) improves long-term flexibility.
     """
 
-    if model_family not in set(get_args(ModelFamily.ANY)) or model_family == ModelFamily.UNKNOWN:
+    if model_family not in _KNOWN_MODEL_FAMILIES or model_family == ModelFamily.UNKNOWN:
         # fallback to finding the best matching model family
         model_family = _find_model_family(api, model)
 
@@ -64,6 +64,8 @@ class BaseOpenAIClientConfiguration(CreateArguments, total=False):
     add_name_prefixes: bool
     """What functionality the model supports, determined by default from model name but is overriden if value passed."""
     default_headers: Dict[str, str] | None
+    image_detail: Literal["auto", "low", "high"]
+    downscale_images: bool
 
 
 # See OpenAI docs for explanation of these parameters
@@ -106,6 +108,8 @@ class BaseOpenAIClientConfigurationConfigModel(CreateArgumentsConfigModel):
     model_info: ModelInfo | None = None
     add_name_prefixes: bool | None = None
     default_headers: Dict[str, str] | None = None
+    image_detail: Literal["auto", "low", "high"] | None = None
+    downscale_images: bool | None = None
 
 
 # See OpenAI docs for explanation of these parameters
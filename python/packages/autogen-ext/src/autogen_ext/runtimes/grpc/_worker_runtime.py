@@ -19,7 +19,6 @@
     ClassVar,
     DefaultDict,
     Dict,
-    List,
     Literal,
     Mapping,
     ParamSpec,
@@ -81,6 +80,34 @@
 type_func_alias = type
 
 
+def _stringify_attributes(
+    attributes: Mapping[str, cloudevent_pb2.CloudEvent.CloudEventAttributeValue],
+) -> Mapping[str, str]:
+    result: Dict[str, str] = {}
+    for key, value in attributes.items():
+        item = None
+        match value.WhichOneof("attr"):
+            case "ce_boolean":
+                item = str(value.ce_boolean)
+            case "ce_integer":
+                item = str(value.ce_integer)
+            case "ce_string":
+                item = value.ce_string
+            case "ce_bytes":
+                item = str(value.ce_bytes)
+            case "ce_uri":
+                item = value.ce_uri
+            case "ce_uri_ref":
+                item = value.ce_uri_ref
+            case "ce_timestamp":
+                item = str(value.ce_timestamp)
+            case _:
+                raise ValueError("Unknown attribute kind")
+        result[key] = item
+
+    return result
+
+
 class QueueAsyncIterable(AsyncIterator[Any], AsyncIterable[Any]):
     def __init__(self, queue: asyncio.Queue[Any]) -> None:
         self._queue = queue
@@ -223,6 +250,16 @@ class GrpcWorkerAgentRuntime(AgentRuntime):
 
     .. _cloudevent.proto: https://github.com/microsoft/autogen/blob/main/protos/cloudevent.proto
 
+    Args:
+        host_address (str): The address of the host runtime to connect to.
+        tracer_provider (TracerProvider, optional): The tracer provider to use for telemetry.
+        extra_grpc_config (ChannelArgumentType, optional): Additional gRPC channel options.
+        payload_serialization_format (str, optional): The content type used to serialize published payloads.
+            Defaults to JSON.
+        max_concurrent_event_handlers (int, optional): The maximum number of local subscribers that handle a
+            single received event concurrently. Events are decoded once and fanned out to all local recipients;
+            this bounds how many of them run at the same time. Defaults to None, which means no limit.
+
     """
 
     # TODO: Needs to handle agent close() call
@@ -232,6 +269,7 @@ def __init__(
         tracer_provider: TracerProvider | None = None,
         extra_grpc_config: ChannelArgumentType | None = None,
         payload_serialization_format: str = JSON_DATA_CONTENT_TYPE,
+        max_concurrent_event_handlers: int | None = None,
     ) -> None:
         self._host_address = host_address
         self._trace_helper = TraceHelper(tracer_provider, MessageRuntimeTracingConfig("Worker Runtime"))
@@ -258,6 +296,10 @@ def __init__(
 
         self._payload_serialization_format = payload_serialization_format
 
+        if max_concurrent_event_handlers is not None and max_concurrent_event_handlers < 1:
+            raise ValueError("max_concurrent_event_handlers must be at least 1.")
+        self._max_concurrent_event_handlers = max_concurrent_event_handlers
+
     async def start(self) -> None:
         """Start the runtime in a background task."""
         if self._running:
@@ -643,11 +685,20 @@ async def _process_event(self, event: cloudevent_pb2.CloudEvent) -> None:
         if is_rpc and not is_marked_rpc_type:
             warnings.warn("Received RPC request with topic type suffix but not marked as RPC request.", stacklevel=2)
 
-        # Send the message to each recipient.
-        responses: List[Awaitable[Any]] = []
-        for agent_id in recipients:
-            if agent_id == sender:
-                continue
+        # Everything shared between recipients is computed once per event; only the
+        # cancellation token (which is mutable) is created per recipient.
+        parent_metadata = _stringify_attributes(event_attributes)
+        targets = [agent_id for agent_id in recipients if agent_id != sender]
+        if not targets:
+            return
+        semaphore = (
+            asyncio.Semaphore(self._max_concurrent_event_handlers)
+            if self._max_concurrent_event_handlers is not None and len(targets) > self._max_concurrent_event_handlers
+            else None
+        )
+
+        async def send_message(agent_id: AgentId) -> None:
+            agent = await self._get_agent(agent_id)
             message_context = MessageContext(
                 sender=sender,
                 topic_id=topic_id,
@@ -655,50 +706,27 @@ async def _process_event(self, event: cloudevent_pb2.CloudEvent) -> None:
                 cancellation_token=CancellationToken(),
                 message_id=event.id,
             )
-            agent = await self._get_agent(agent_id)
             with MessageHandlerContext.populate_context(agent.id):
+                with self._trace_helper.trace_block(
+                    "process",
+                    agent.id,
+                    parent=parent_metadata,
+                    extraAttributes={"message_type": message_type},
+                ):
+                    await agent.on_message(message, ctx=message_context)
+
+        async def send_message_bounded(agent_id: AgentId) -> None:
+            assert semaphore is not None
+            async with semaphore:
+                await send_message(agent_id)
 
-                def stringify_attributes(
-                    attributes: Mapping[str, cloudevent_pb2.CloudEvent.CloudEventAttributeValue],
-                ) -> Mapping[str, str]:
-                    result: Dict[str, str] = {}
-                    for key, value in attributes.items():
-                        item = None
-                        match value.WhichOneof("attr"):
-                            case "ce_boolean":
-                                item = str(value.ce_boolean)
-                            case "ce_integer":
-                                item = str(value.ce_integer)
-                            case "ce_string":
-                                item = value.ce_string
-                            case "ce_bytes":
-                                item = str(value.ce_bytes)
-                            case "ce_uri":
-                                item = value.ce_uri
-                            case "ce_uri_ref":
-                                item = value.ce_uri_ref
-                            case "ce_timestamp":
-                                item = str(value.ce_timestamp)
-                            case _:
-                                raise ValueError("Unknown attribute kind")
-                        result[key] = item
-
-                    return result
-
-                async def send_message(agent: Agent, message_context: MessageContext) -> Any:
-                    with self._trace_helper.trace_block(
-                        "process",
-                        agent.id,
-                        parent=stringify_attributes(event.attributes),
-                        extraAttributes={"message_type": message_type},
-                    ):
-                        await agent.on_message(message, ctx=message_context)
-
-                future = send_message(agent, message_context)
-            responses.append(future)
+        dispatch = send_message if semaphore is None else send_message_bounded
         # Wait for all responses.
         try:
-            await asyncio.gather(*responses)
+            if len(targets) == 1:
+                await dispatch(targets[0])
+            else:
+                await asyncio.gather(*[dispatch(agent_id) for agent_id in targets])
         except BaseException as e:
             logger.error("Error handling event", exc_info=e)
 
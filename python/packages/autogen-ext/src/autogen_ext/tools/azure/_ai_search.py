@@ -4,6 +4,7 @@
 import logging
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from contextvars import ContextVar
 from typing import (
     TYPE_CHECKING,
@@ -13,6 +14,9 @@
     Literal,
     Optional,
     Protocol,
+    Sequence,
+    Set,
+    Tuple,
     Union,
 )
 
@@ -129,13 +133,80 @@ async def _get_embedding(self, query: str) -> List[float]:
         ...
 
 
+# The maximum number of texts sent in one embeddings request.
+_EMBEDDING_BATCH_SIZE = 256
+
+
 class EmbeddingProviderMixin:
-    """Mixin class providing embedding generation functionality."""
+    """Mixin class providing embedding generation functionality.
+
+    The embedding client is created once per tool instance and reused. Query embeddings are kept
+    in a bounded LRU cache (``embedding_cache_size``), and the number of concurrent embedding requests
+    is limited by ``embedding_max_concurrency``. Queries of concurrent searches, such as parallel tool
+    calls, are collected and embedded together in batched requests.
+    """
 
     search_config: AzureAISearchConfig
+    _embedding_client: Any = None
+    _embedding_loop: Optional[asyncio.AbstractEventLoop] = None
+    _embedding_semaphore: Optional[asyncio.Semaphore] = None
+    # Cached vectors are stored as tuples, and callers get a fresh list, so that they cannot change the cache.
+    _embedding_cache: Optional[OrderedDict[str, Tuple[float, ...]]] = None
+    # The queries waiting to be embedded in the next batch, and the event loop the batch is scheduled in.
+    _embedding_batch: Optional[Dict[str, "asyncio.Future[List[float]]"]] = None
+    _embedding_batch_loop: Optional[asyncio.AbstractEventLoop] = None
+    _embedding_batch_tasks: Optional[Set["asyncio.Task[None]"]] = None
 
     async def _get_embedding(self, query: str) -> List[float]:
-        """Generate embedding vector for the query text."""
+        """Generate embedding vector for the query text.
+
+        The query joins the queries requested by other searches in the same event loop iteration,
+        which are embedded together by :meth:`_get_embeddings`.
+        """
+        loop = asyncio.get_running_loop()
+        if self._embedding_batch is None or self._embedding_batch_loop is not loop:
+            self._embedding_batch = {}
+            self._embedding_batch_loop = loop
+            loop.call_soon(self._start_embedding_batch)
+        batch = self._embedding_batch
+        if query not in batch:
+            batch[query] = loop.create_future()
+        # Shielded, so that a cancelled search does not cancel the embedding of the other searches.
+        return list(await asyncio.shield(batch[query]))
+
+    def _start_embedding_batch(self) -> None:
+        """Embed the queries collected since the batch was scheduled."""
+        batch, self._embedding_batch = self._embedding_batch, None
+        if not batch:
+            return
+        if self._embedding_batch_tasks is None:
+            self._embedding_batch_tasks = set()
+        task = asyncio.ensure_future(self._embed_batch(batch))
+        # Keep a reference to the task until it is done.
+        self._embedding_batch_tasks.add(task)
+        task.add_done_callback(self._embedding_batch_tasks.discard)
+
+    async def _embed_batch(self, batch: Dict[str, "asyncio.Future[List[float]]"]) -> None:
+        """Embed a batch of queries and pass each embedding, or the error, to the searches waiting for it."""
+        try:
+            embeddings = await self._get_embeddings(list(batch))
+        except BaseException as e:
+            for future in batch.values():
+                if future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        for future, embedding in zip(batch.values(), embeddings, strict=True):
+            if not future.done():
+                future.set_result(embedding)
+
+    async def _get_embeddings(self, queries: List[str]) -> List[List[float]]:
+        """Generate embedding vectors for several query texts, using the cache and batched requests."""
         if not hasattr(self, "search_config"):
             raise ValueError("Host class must have a search_config attribute")
 
@@ -148,6 +219,61 @@ async def _get_embedding(self, query: str) -> List[float]:
                 "Client-side embedding is not configured. `embedding_provider` and `embedding_model` must be set."
             ) from None
 
+        if self._embedding_cache is None:
+            self._embedding_cache = OrderedDict()
+        cache = self._embedding_cache
+        embeddings: Dict[str, Sequence[float]] = {}
+        missing: List[str] = []
+        for query in queries:
+            if query in cache:
+                cache.move_to_end(query)
+                embeddings[query] = cache[query]
+            elif query not in missing:
+                missing.append(query)
+
+        if missing:
+            client = await self._get_embedding_client(embedding_provider)
+            assert self._embedding_semaphore is not None
+            provider_name = "Azure OpenAI" if embedding_provider.lower() == "azure_openai" else "OpenAI"
+
+            async def embed_batch(batch: List[str]) -> None:
+                async with self._embedding_semaphore:  # type: ignore[union-attr]
+                    try:
+                        # A single text is sent as is, to match the request of a plain query.
+                        response = await client.embeddings.create(
+                            model=embedding_model, input=batch[0] if len(batch) == 1 else batch
+                        )
+                    except Exception as e:
+                        raise ValueError(f"Failed to generate embeddings with {provider_name}: {str(e)}") from e
+                for text, data in zip(batch, response.data, strict=True):
+                    embeddings[text] = data.embedding
+
+            await asyncio.gather(
+                *[
+                    embed_batch(missing[i : i + _EMBEDDING_BATCH_SIZE])
+                    for i in range(0, len(missing), _EMBEDDING_BATCH_SIZE)
+                ]
+            )
+            cache_size = search_config.embedding_cache_size
+            if cache_size > 0:
+                for text in missing:
+                    cache[text] = tuple(embeddings[text])
+                while len(cache) > cache_size:
+                    cache.popitem(last=False)
+
+        return [list(embeddings[query]) for query in queries]
+
+    async def _get_embedding_client(self, embedding_provider: str) -> Any:
+        """Return the embedding client of this tool, creating it on first use."""
+        # The client and the semaphore are bound to the event loop they are used in.
+        loop = asyncio.get_running_loop()
+        if self._embedding_client is not None:
+            if self._embedding_loop is loop:
+                return self._embedding_client
+            # Used from a new event loop, release the client of the previous one.
+            await self._close_embedding_client()
+
+        search_config = self.search_config
         if embedding_provider.lower() == "azure_openai":
             try:
                 from azure.identity import DefaultAzureCredential
@@ -168,26 +294,24 @@ async def _get_embedding(self, query: str) -> List[float]:
                 ) from None
 
             if api_key:
-                azure_client = AsyncAzureOpenAI(api_key=api_key, api_version=api_version, azure_endpoint=endpoint)
+                client: Any = AsyncAzureOpenAI(api_key=api_key, api_version=api_version, azure_endpoint=endpoint)
             else:
+                # One credential for the lifetime of the client, and the token is reused until it is about to expire.
+                credential = DefaultAzureCredential()
+                cached_token: List[Any] = []
 
                 def get_token() -> str:
-                    credential = DefaultAzureCredential()
-                    token = credential.get_token("https://cognitiveservices.azure.com/.default")
-                    if not token or not token.token:
-                        raise ValueError("Failed to acquire token using DefaultAzureCredential for Azure OpenAI.")
-                    return token.token
-
-                azure_client = AsyncAzureOpenAI(
+                    if not cached_token or cached_token[0].expires_on - 300 < time.time():
+                        token = credential.get_token("https://cognitiveservices.azure.com/.default")
+                        if not token or not token.token:
+                            raise ValueError("Failed to acquire token using DefaultAzureCredential for Azure OpenAI.")
+                        cached_token[:] = [token]
+                    return str(cached_token[0].token)
+
+                client = AsyncAzureOpenAI(
                     azure_ad_token_provider=get_token, api_version=api_version, azure_endpoint=endpoint
                 )
 
-            try:
-                response = await azure_client.embeddings.create(model=embedding_model, input=query)
-                return response.data[0].embedding
-            except Exception as e:
-                raise ValueError(f"Failed to generate embeddings with Azure OpenAI: {str(e)}") from e
-
         elif embedding_provider.lower() == "openai":
             try:
                 from openai import AsyncOpenAI
@@ -198,19 +322,30 @@ def get_token() -> str:
                 ) from None
 
             api_key = getattr(search_config, "openai_api_key", None)
-            openai_client = AsyncOpenAI(api_key=api_key)
-
-            try:
-                response = await openai_client.embeddings.create(model=embedding_model, input=query)
-                return response.data[0].embedding
-            except Exception as e:
-                raise ValueError(f"Failed to generate embeddings with OpenAI: {str(e)}") from e
+            client = AsyncOpenAI(api_key=api_key)
         else:
             raise ValueError(
                 f"Unsupported client-side embedding provider: {embedding_provider}. "
                 "Currently supported providers are 'azure_openai' and 'openai'."
             )
 
+        self._embedding_client = client
+        self._embedding_loop = loop
+        self._embedding_semaphore = asyncio.Semaphore(search_config.embedding_max_concurrency)
+        return client
+
+    async def _close_embedding_client(self) -> None:
+        """Close the embedding client, if it was created."""
+        if self._embedding_client is not None:
+            try:
+                await self._embedding_client.close()
+            except Exception as e:
+                # The client may be bound to an event loop that is already closed.
+                logger.debug(f"Error closing the embedding client: {e}")
+            finally:
+                self._embedding_client = None
+                self._embedding_loop = None
+
 
 class BaseAzureAISearchTool(
     BaseTool[SearchQuery, SearchResults], Component[AzureAISearchConfig], EmbeddingProvider, ABC
@@ -254,6 +389,8 @@ def __init__(
         openai_api_key: Optional[str] = None,
         openai_api_version: Optional[str] = None,
         openai_endpoint: Optional[str] = None,
+        embedding_cache_size: int = 1024,
+        embedding_max_concurrency: int = 4,
     ):
         """Initialize the Azure AI Search tool.
 
@@ -278,6 +415,8 @@ def __init__(
             openai_api_key (Optional[str]): API key for OpenAI/Azure OpenAI embeddings
             openai_api_version (Optional[str]): API version for Azure OpenAI embeddings
             openai_endpoint (Optional[str]): Endpoint URL for Azure OpenAI embeddings
+            embedding_cache_size (int): Maximum number of query embeddings to cache, 0 disables the cache
+            embedding_max_concurrency (int): Maximum number of concurrent embedding requests
         """
         if not has_azure_search:
             raise ImportError(
@@ -321,6 +460,8 @@ def __init__(
             openai_api_key=openai_api_key,
             openai_api_version=openai_api_version,
             openai_endpoint=openai_endpoint,
+            embedding_cache_size=embedding_cache_size,
+            embedding_max_concurrency=embedding_max_concurrency,
         )
 
         self._endpoint = endpoint
@@ -696,6 +837,11 @@ class AzureAISearchTool(EmbeddingProviderMixin, BaseAzureAISearchTool):
 
     component_provider_override = "autogen_ext.tools.azure.AzureAISearchTool"
 
+    async def close(self) -> None:
+        """Close the Azure SearchClient and the embedding client."""
+        await self._close_embedding_client()
+        await super().close()
+
     @classmethod
     def _from_config(cls, config: AzureAISearchConfig) -> "AzureAISearchTool":
         """Create a tool instance from a configuration object.
@@ -729,6 +875,8 @@ def _from_config(cls, config: AzureAISearchConfig) -> "AzureAISearchTool":
                 openai_api_key=config.openai_api_key,
                 openai_api_version=config.openai_api_version,
                 openai_endpoint=config.openai_endpoint,
+                embedding_cache_size=config.embedding_cache_size,
+                embedding_max_concurrency=config.embedding_max_concurrency,
             )
             return instance
         finally:
@@ -890,6 +1038,8 @@ def create_vector_search(
         openai_api_key: Optional[str] = None,
         openai_api_version: Optional[str] = None,
         openai_endpoint: Optional[str] = None,
+        embedding_cache_size: int = 1024,
+        embedding_max_concurrency: int = 4,
     ) -> "AzureAISearchTool":
         """Create a tool for pure vector/similarity search.
 
@@ -914,6 +1064,8 @@ def create_vector_search(
             openai_api_key: API key for OpenAI/Azure OpenAI embeddings
             openai_api_version: API version for Azure OpenAI embeddings
             openai_endpoint: Endpoint URL for Azure OpenAI embeddings
+            embedding_cache_size: Maximum number of query embeddings to cache, 0 disables the cache
+            embedding_max_concurrency: Maximum number of concurrent embedding requests
 
         Returns:
             An initialized AzureAISearchTool for vector search
@@ -995,6 +1147,8 @@ def create_vector_search(
             "openai_api_key": openai_api_key,
             "openai_api_version": openai_api_version,
             "openai_endpoint": openai_endpoint,
+            "embedding_cache_size": embedding_cache_size,
+            "embedding_max_concurrency": embedding_max_concurrency,
         }
 
         return cls._create_from_params(config_dict, "vector")
@@ -1022,6 +1176,8 @@ def create_hybrid_search(
         openai_api_key: Optional[str] = None,
         openai_api_version: Optional[str] = None,
         openai_endpoint: Optional[str] = None,
+        embedding_cache_size: int = 1024,
+        embedding_max_concurrency: int = 4,
     ) -> "AzureAISearchTool":
         """Create a tool that combines vector and text search capabilities.
 
@@ -1053,6 +1209,8 @@ def create_hybrid_search(
             openai_api_key: API key for OpenAI/Azure OpenAI embeddings
             openai_api_version: API version for Azure OpenAI embeddings
             openai_endpoint: Endpoint URL for Azure OpenAI embeddings
+            embedding_cache_size: Maximum number of query embeddings to cache, 0 disables the cache
+            embedding_max_concurrency: Maximum number of concurrent embedding requests
 
         Returns:
             An initialized AzureAISearchTool for hybrid search
@@ -1130,6 +1288,8 @@ def create_hybrid_search(
             "openai_api_key": openai_api_key,
             "openai_api_version": openai_api_version,
             "openai_endpoint": openai_endpoint,
+            "embedding_cache_size": embedding_cache_size,
+            "embedding_max_concurrency": embedding_max_concurrency,
         }
 
         return cls._create_from_params(config_dict, "hybrid")
@@ -137,6 +137,12 @@ class AzureAISearchConfig(BaseModel):
     openai_api_key: Optional[str] = Field(default=None, description="API key for OpenAI/Azure OpenAI embeddings")
     openai_api_version: Optional[str] = Field(default=None, description="API version for Azure OpenAI embeddings")
     openai_endpoint: Optional[str] = Field(default=None, description="Endpoint URL for Azure OpenAI embeddings")
+    embedding_cache_size: int = Field(
+        default=1024, ge=0, description="Maximum number of query embeddings to cache, 0 disables the cache"
+    )
+    embedding_max_concurrency: int = Field(
+        default=4, ge=1, description="Maximum number of concurrent embedding requests"
+    )
 
     model_config = {"arbitrary_types_allowed": True}
 
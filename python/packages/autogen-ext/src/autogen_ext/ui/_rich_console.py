@@ -1,4 +1,6 @@
 import asyncio
+import contextlib
+import functools
 import os
 import sys
 import time
@@ -20,7 +22,7 @@
     MultiModalMessage,
     UserInputRequestedEvent,
 )
-from autogen_agentchat.ui._console import UserInputManager
+from autogen_agentchat.ui._console import UserInputManager, _ConsoleWriter  # pyright: ignore[reportPrivateUsage]
 from autogen_core import Image
 from autogen_core.models import RequestUsage
 from rich.align import AlignMethod
@@ -66,22 +68,25 @@ def _extract_message_content(message: BaseAgentEvent | BaseChatMessage) -> Tuple
     return text_parts, image_parts
 
 
-async def _aprint_panel(console: Console, text: str, title: str) -> None:
+def _print_panel(writer: _ConsoleWriter, console: Console, text: str, title: str) -> None:
     color = AGENT_COLORS.get(title, DEFAULT_AGENT_COLOR)
     title_align = AGENT_ALIGNMENTS.get(title, DEFAULT_AGENT_ALIGNMENT)
 
-    await asyncio.to_thread(
-        console.print,
-        Panel(
-            text,
-            title=title,
-            title_align=title_align,
-            border_style=color,
-        ),
+    writer.submit(
+        functools.partial(
+            console.print,
+            Panel(
+                text,
+                title=title,
+                title_align=title_align,
+                border_style=color,
+            ),
+        )
     )
 
 
-async def _aprint_message_content(
+def _print_message_content(
+    writer: _ConsoleWriter,
     console: Console,
     text_parts: List[str],
     image_parts: List[Image],
@@ -90,13 +95,13 @@ async def _aprint_message_content(
     render_image_iterm: bool = False,
 ) -> None:
     if text_parts:
-        await _aprint_panel(console, "\n".join(text_parts), source)
+        _print_panel(writer, console, "\n".join(text_parts), source)
 
     for img in image_parts:
         if render_image_iterm:
-            await aprint(_image_to_iterm(img))
+            writer.write(_image_to_iterm(img) + "\n")
         else:
-            await aprint("<image>\n")
+            writer.write("<image>\n\n")
 
 
 async def RichConsole(
@@ -105,6 +110,7 @@ async def RichConsole(
     no_inline_images: bool = False,
     output_stats: bool = False,
     user_input_manager: UserInputManager | None = None,
+    buffered: bool = True,
 ) -> T:
     """
     Consumes the message stream from :meth:`~autogen_agentchat.base.TaskRunner.run_stream`
@@ -121,6 +127,8 @@ async def RichConsole(
             This can be from :meth:`~autogen_agentchat.base.TaskRunner.run_stream` or :meth:`~autogen_agentchat.base.ChatAgent.on_messages_stream`.
         no_inline_images (bool, optional): If terminal is iTerm2 will render images inline. Use this to disable this behavior. Defaults to False.
         output_stats (bool, optional): (Experimental) If True, will output a summary of the messages and inline token usage info. Defaults to False.
+        buffered (bool, optional): If True, consecutive outputs are printed together from a single writer task
+            rather than one thread hop each. The printed output is the same. Defaults to True.
 
     Returns:
         last_processed: A :class:`~autogen_agentchat.base.TaskResult` if the stream is from :meth:`~autogen_agentchat.base.TaskRunner.run_stream`
@@ -133,83 +141,96 @@ async def RichConsole(
 
     last_processed: Optional[T] = None
 
-    async for message in stream:
-        if isinstance(message, TaskResult):
-            duration = time.time() - start_time
-            if output_stats:
-                output = (
-                    f"Number of messages: {len(message.messages)}\n"
-                    f"Finish reason: {message.stop_reason}\n"
-                    f"Total prompt tokens: {total_usage.prompt_tokens}\n"
-                    f"Total completion tokens: {total_usage.completion_tokens}\n"
-                    f"Duration: {duration:.2f} seconds\n"
-                )
-                await _aprint_panel(rich_console, output, "Summary")
-
-            last_processed = message  # type: ignore
-
-        elif isinstance(message, Response):
-            duration = time.time() - start_time
-
-            # Print final response.
-            text_parts, image_parts = _extract_message_content(message.chat_message)
-            if message.chat_message.models_usage:
+    # All output goes through a single writer task, keeping the event loop free while rich renders.
+    writer = _ConsoleWriter(buffered=buffered)
+    try:
+        async for message in stream:
+            if isinstance(message, TaskResult):
+                duration = time.time() - start_time
                 if output_stats:
-                    text_parts.append(
-                        f"[Prompt tokens: {message.chat_message.models_usage.prompt_tokens}, Completion tokens: {message.chat_message.models_usage.completion_tokens}]"
+                    output = (
+                        f"Number of messages: {len(message.messages)}\n"
+                        f"Finish reason: {message.stop_reason}\n"
+                        f"Total prompt tokens: {total_usage.prompt_tokens}\n"
+                        f"Total completion tokens: {total_usage.completion_tokens}\n"
+                        f"Duration: {duration:.2f} seconds\n"
                     )
-                total_usage.completion_tokens += message.chat_message.models_usage.completion_tokens
-                total_usage.prompt_tokens += message.chat_message.models_usage.prompt_tokens
-
-            await _aprint_message_content(
-                rich_console,
-                text_parts,
-                image_parts,
-                message.chat_message.source,
-                render_image_iterm=render_image_iterm,
-            )
-
-            # Print summary.
-            if output_stats:
-                num_inner_messages = len(message.inner_messages) if message.inner_messages is not None else 0
-                output = (
-                    f"Number of inner messages: {num_inner_messages}\n"
-                    f"Total prompt tokens: {total_usage.prompt_tokens}\n"
-                    f"Total completion tokens: {total_usage.completion_tokens}\n"
-                    f"Duration: {duration:.2f} seconds\n"
+                    _print_panel(writer, rich_console, output, "Summary")
+
+                last_processed = message  # type: ignore
+
+            elif isinstance(message, Response):
+                duration = time.time() - start_time
+
+                # Print final response.
+                text_parts, image_parts = _extract_message_content(message.chat_message)
+                if message.chat_message.models_usage:
+                    if output_stats:
+                        text_parts.append(
+                            f"[Prompt tokens: {message.chat_message.models_usage.prompt_tokens}, Completion tokens: {message.chat_message.models_usage.completion_tokens}]"
+                        )
+                    total_usage.completion_tokens += message.chat_message.models_usage.completion_tokens
+                    total_usage.prompt_tokens += message.chat_message.models_usage.prompt_tokens
+
+                _print_message_content(
+                    writer,
+                    rich_console,
+                    text_parts,
+                    image_parts,
+                    message.chat_message.source,
+                    render_image_iterm=render_image_iterm,
                 )
-                await _aprint_panel(rich_console, output, "Summary")
-
-            # mypy ignore
-            last_processed = message  # type: ignore
-        # We don't want to print UserInputRequestedEvent messages, we just use them to signal the user input event.
-        elif isinstance(message, UserInputRequestedEvent):
-            if user_input_manager is not None:
-                user_input_manager.notify_event_received(message.request_id)
-        elif isinstance(message, ModelClientStreamingChunkEvent):
-            # TODO: Handle model client streaming chunk events.
-            pass
-        else:
-            # Cast required for mypy to be happy
-            message = cast(BaseAgentEvent | BaseChatMessage, message)  # type: ignore
 
-            text_parts, image_parts = _extract_message_content(message)
-            # Add usage stats if needed
-            if message.models_usage:
+                # Print summary.
                 if output_stats:
-                    text_parts.append(
-                        f"[Prompt tokens: {message.models_usage.prompt_tokens}, Completion tokens: {message.models_usage.completion_tokens}]"
+                    num_inner_messages = len(message.inner_messages) if message.inner_messages is not None else 0
+                    output = (
+                        f"Number of inner messages: {num_inner_messages}\n"
+                        f"Total prompt tokens: {total_usage.prompt_tokens}\n"
+                        f"Total completion tokens: {total_usage.completion_tokens}\n"
+                        f"Duration: {duration:.2f} seconds\n"
                     )
-                total_usage.completion_tokens += message.models_usage.completion_tokens
-                total_usage.prompt_tokens += message.models_usage.prompt_tokens
-
-            await _aprint_message_content(
-                rich_console,
-                text_parts,
-                image_parts,
-                message.source,
-                render_image_iterm=render_image_iterm,
-            )
+                    _print_panel(writer, rich_console, output, "Summary")
+
+                # mypy ignore
+                last_processed = message  # type: ignore
+            # We don't want to print UserInputRequestedEvent messages, we just use them to signal the user input event.
+            elif isinstance(message, UserInputRequestedEvent):
+                # Make sure everything is printed before the user is prompted for input.
+                await writer.drain()
+                if user_input_manager is not None:
+                    user_input_manager.notify_event_received(message.request_id)
+            elif isinstance(message, ModelClientStreamingChunkEvent):
+                # TODO: Handle model client streaming chunk events.
+                pass
+            else:
+                # Cast required for mypy to be happy
+                message = cast(BaseAgentEvent | BaseChatMessage, message)  # type: ignore
+
+                text_parts, image_parts = _extract_message_content(message)
+                # Add usage stats if needed
+                if message.models_usage:
+                    if output_stats:
+                        text_parts.append(
+                            f"[Prompt tokens: {message.models_usage.prompt_tokens}, Completion tokens: {message.models_usage.completion_tokens}]"
+                        )
+                    total_usage.completion_tokens += message.models_usage.completion_tokens
+                    total_usage.prompt_tokens += message.models_usage.prompt_tokens
+
+                _print_message_content(
+                    writer,
+                    rich_console,
+                    text_parts,
+                    image_parts,
+                    message.source,
+                    render_image_iterm=render_image_iterm,
+                )
+    except BaseException:
+        # Do not let a write error replace the error of the stream.
+        with contextlib.suppress(Exception):
+            await writer.aclose()
+        raise
+    await writer.aclose()
 
     if last_processed is None:
         raise ValueError("No TaskResult or Response was processed.")
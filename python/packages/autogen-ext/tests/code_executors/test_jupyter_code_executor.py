@@ -5,7 +5,7 @@
 import pytest
 from autogen_core import CancellationToken
 from autogen_core.code_executor import CodeBlock
-from autogen_ext.code_executors.jupyter import JupyterCodeExecutor, JupyterCodeResult
+from autogen_ext.code_executors.jupyter import JupyterCodeExecutor, JupyterCodeResult, JupyterKernelPool
 
 
 @pytest.mark.asyncio
@@ -225,3 +225,53 @@ async def test_runtime_error_not_started() -> None:
     code_blocks = [CodeBlock(code="print('hello world!')", language="python")]
     with pytest.raises(RuntimeError, match="Executor must be started before executing cells"):
         await executor.execute_code_blocks(code_blocks, CancellationToken())
+
+
+@pytest.mark.asyncio
+async def test_kernel_pool(tmp_path: Path) -> None:
+    # A single kernel, so that the kernel of the first session is reset and reused by the second one.
+    async with JupyterKernelPool(size=1, max_kernels=1, preload_modules=["json"]) as pool:
+        assert pool.num_idle == 1
+
+        # Executors of the same session share the kernel and its state, preloaded modules are already imported.
+        async with JupyterCodeExecutor(output_dir=tmp_path, kernel_pool=pool, session_id="a") as executor_1:
+            async with JupyterCodeExecutor(output_dir=tmp_path, kernel_pool=pool, session_id="a") as executor_2:
+                assert pool.num_leased == 1
+                kernel_manager = pool._leases["a"].kernel_manager  # pyright: ignore[reportPrivateUsage]
+                code_blocks = [CodeBlock(code="x = json.dumps([1])", language="python")]
+                code_result = await executor_1.execute_code_blocks(code_blocks, CancellationToken())
+                assert code_result.exit_code == 0
+                code_blocks = [CodeBlock(code="print(x)", language="python")]
+                code_result = await executor_2.execute_code_blocks(code_blocks, CancellationToken())
+                assert code_result == JupyterCodeResult(exit_code=0, output="[1]\n", output_files=[])
+            assert pool.num_leased == 1
+        assert pool.num_leased == 0
+        assert pool.num_acquired == 2
+
+        # Once reset, the kernel no longer holds the previous session's state.
+        async with JupyterCodeExecutor(output_dir=tmp_path, kernel_pool=pool, session_id="b") as executor:
+            assert pool._leases["b"].kernel_manager is kernel_manager  # pyright: ignore[reportPrivateUsage]
+            code_blocks = [CodeBlock(code="print(x)", language="python")]
+            code_result = await executor.execute_code_blocks(code_blocks, CancellationToken())
+            assert code_result.exit_code == 1
+            assert "NameError" in code_result.output
+            assert "Cell In[1]" in code_result.output
+        assert pool.max_wait_time >= 0.0
+        assert pool.total_wait_time >= pool.max_wait_time
+
+
+@pytest.mark.asyncio
+async def test_kernel_pool_waits_at_capacity() -> None:
+    async with JupyterKernelPool(size=0, max_kernels=1) as pool:
+        kernel_manager = await pool.acquire("a")
+        waiter = asyncio.create_task(pool.acquire("b"))
+        await asyncio.sleep(0.1)
+        assert not waiter.done()
+        await pool.release("a")
+        assert await asyncio.wait_for(waiter, timeout=30) is kernel_manager
+        await pool.release("b")
+
+
+def test_kernel_pool_invalid_arguments() -> None:
+    with pytest.raises(ValueError, match="max_kernels must be at least 1 and at least size."):
+        _ = JupyterKernelPool(size=2, max_kernels=1)
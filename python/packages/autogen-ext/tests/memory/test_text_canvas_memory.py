@@ -2,8 +2,9 @@
 
 import pytest
 from autogen_core import CancellationToken
-from autogen_core.model_context import UnboundedChatCompletionContext
-from autogen_ext.memory.canvas import TextCanvasMemory
+from autogen_core.model_context import BufferedChatCompletionContext, UnboundedChatCompletionContext
+from autogen_core.models import UserMessage
+from autogen_ext.memory.canvas import TextCanvas, TextCanvasMemory
 from autogen_ext.memory.canvas._canvas_writer import (
     ApplyPatchArgs,
     UpdateFileArgs,
@@ -119,3 +120,66 @@ async def test_update_context_injects_snapshot(
     assert result.memories.results
     assert isinstance(result.memories.results[0].content, str)
     assert story_v2.strip() in result.memories.results[0].content
+
+
+def test_canvas_revisions_use_snapshots_and_deltas() -> None:
+    canvas = TextCanvas(snapshot_interval=4)
+    lines = [f"line {i}\n" for i in range(200)]
+    versions: list[str] = []
+    for i in range(10):
+        lines[i] = f"edited line {i}\n"
+        versions.append("".join(lines))
+        canvas.add_or_update_file("big.txt", versions[-1])
+
+    revisions = canvas._files["big.txt"]  # type: ignore
+    assert [rev.snapshot is not None for rev in revisions] == [True, False, False, False] * 2 + [True, False]
+    assert all(len(rev.delta) == 1 for rev in revisions if rev.delta is not None)
+
+    # Every revision can be rebuilt from the nearest snapshot.
+    for revision, content in enumerate(versions, start=1):
+        assert canvas.get_revision_content("big.txt", revision) == content
+    assert canvas.get_revision_content("big.txt", 11) == ""
+    assert canvas.get_latest_content("big.txt") == versions[-1]
+
+    # Diffs are cached.
+    diffs = canvas.get_revision_diffs("big.txt")
+    assert len(diffs) == 9
+    assert "+edited line 1" in diffs[0]
+    assert canvas.get_revision_diffs("big.txt")[0] is diffs[0]
+    assert "+edited line 9" in canvas.get_diff("big.txt", 1, 10)
+
+
+@pytest.mark.asyncio
+async def test_update_context_sends_only_changed_files(memory: TextCanvasMemory, story_v1: str, story_v2: str) -> None:
+    memory.canvas.add_or_update_file("story.md", story_v1)
+    memory.canvas.add_or_update_file("notes.md", "Some notes.\n")
+
+    chat_ctx = UnboundedChatCompletionContext()
+    await memory.update_context(chat_ctx)
+    assert "notes.md" in chat_ctx._messages[-1].content  # type: ignore
+
+    # Nothing changed, nothing is added.
+    result = await memory.update_context(chat_ctx)
+    assert len(chat_ctx._messages) == 1  # type: ignore
+    assert result.memories.results == []
+
+    # Only the changed file is sent.
+    memory.canvas.add_or_update_file("story.md", story_v2)
+    await memory.update_context(chat_ctx)
+    assert len(chat_ctx._messages) == 2  # type: ignore
+    update = chat_ctx._messages[-1].content  # type: ignore
+    assert "=== CANVAS UPDATES" in update
+    assert "story.md (rev 2)" in update
+    assert "notes.md" not in update
+
+    # Another model context gets the whole canvas.
+    other_ctx = UnboundedChatCompletionContext()
+    await memory.update_context(other_ctx)
+    assert "notes.md" in other_ctx._messages[-1].content  # type: ignore
+
+    # The whole canvas is sent again once the earlier canvas messages left the context.
+    buffered_ctx = BufferedChatCompletionContext(buffer_size=1)
+    await memory.update_context(buffered_ctx)
+    await buffered_ctx.add_message(UserMessage(content="Hello", source="user"))
+    await memory.update_context(buffered_ctx)
+    assert "=== CANVAS FILES ===" in buffered_ctx._messages[-1].content  # type: ignore
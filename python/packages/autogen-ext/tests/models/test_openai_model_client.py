@@ -1,11 +1,14 @@
 import asyncio
+import gc
 import json
 import logging
 import os
+import threading
 from typing import Annotated, Any, AsyncGenerator, Dict, List, Literal, Tuple, TypeVar
 from unittest.mock import MagicMock
 
 import httpx
+import PIL.Image
 import pytest
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.messages import MultiModalMessage
@@ -24,6 +27,7 @@
 from autogen_core.models._model_client import ModelFamily
 from autogen_core.tools import BaseTool, FunctionTool
 from autogen_ext.models.openai import AzureOpenAIChatCompletionClient, OpenAIChatCompletionClient
+from autogen_ext.models.openai._image_preprocessing import ImagePreprocessor, get_max_useful_size
 from autogen_ext.models.openai._model_info import resolve_model
 from autogen_ext.models.openai._openai_client import (
     BaseOpenAIChatCompletionClient,
@@ -465,6 +469,125 @@ def test_openai_count_image_tokens(mock_size: Tuple[int, int], expected_num_toke
     assert calculated_tokens == expected_num_tokens
 
 
+@pytest.mark.parametrize(
+    "size, detail, expected_size",
+    [
+        ((512, 512), "auto", (512, 512)),
+        ((4096, 1024), "auto", (2048, 512)),
+        ((2048, 2048), "high", (768, 768)),
+        ((1920, 1080), "auto", (1365, 768)),
+        ((1920, 1080), "low", (512, 288)),
+        ((300, 200), "low", (300, 200)),
+    ],
+)
+def test_get_max_useful_image_size(size: Tuple[int, int], detail: str, expected_size: Tuple[int, int]) -> None:
+    assert get_max_useful_size(*size, detail=detail) == expected_size
+
+
+def test_image_preprocessor_downscales_and_caches() -> None:
+    # A noisy image, so that the encoded size depends on the number of pixels.
+    large = Image.from_pil(PIL.Image.effect_noise((1920, 1080), 64))
+    small = Image.from_pil(PIL.Image.effect_noise((256, 256), 64))
+    preprocessor = ImagePreprocessor()
+
+    processed = preprocessor.process(large, "auto")
+    assert processed.image.size == (1365, 768)
+    assert preprocessor.bytes_saved == len(large.to_bytes()) - len(processed.to_bytes()) > 0
+    assert preprocessor.process(large, "auto") is processed
+    assert preprocessor.process(large, "low").image.size == (512, 288)
+    assert preprocessor.process(small, "auto") is small
+    assert preprocessor.num_images == 3
+    assert preprocessor.num_downscaled == 2
+
+
+def test_image_preprocessor_does_not_keep_images_alive() -> None:
+    preprocessor = ImagePreprocessor()
+    large = Image.from_pil(PIL.Image.effect_noise((1920, 1080), 64))
+    small = Image.from_pil(PIL.Image.effect_noise((256, 256), 64))
+    assert preprocessor.process(large, "auto") is not large
+    assert preprocessor.process(small, "auto") is small
+    assert preprocessor.process(small, "auto") is small
+    assert len(preprocessor._cache) == 2  # type: ignore[reportPrivateUsage]
+
+    del large, small
+    gc.collect()
+    assert len(preprocessor._cache) == 0  # type: ignore[reportPrivateUsage]
+
+
+@pytest.mark.asyncio
+async def test_image_preprocessor_prepares_images_in_worker_thread(monkeypatch: pytest.MonkeyPatch) -> None:
+    threads: List[int] = []
+    downscale = ImagePreprocessor._downscale  # pyright: ignore[reportPrivateUsage]
+
+    def recording_downscale(self: ImagePreprocessor, image: Image, detail: str) -> Tuple[Image | None, int]:
+        threads.append(threading.get_ident())
+        return downscale(self, image, detail)
+
+    monkeypatch.setattr(ImagePreprocessor, "_downscale", recording_downscale)
+    preprocessor = ImagePreprocessor()
+    large = Image.from_pil(PIL.Image.effect_noise((1920, 1080), 64))
+
+    await preprocessor.prepare([large, large], "low")
+    assert len(threads) == 1
+    assert threads[0] != threading.get_ident()
+
+    # The prepared image is served from the cache.
+    assert preprocessor.process(large, "low").image.size == (512, 288)
+    await preprocessor.prepare([large], "low")
+    assert len(threads) == 1
+    assert (preprocessor.num_images, preprocessor.num_downscaled) == (1, 1)
+
+
+def test_openai_chat_completion_client_downscale_images() -> None:
+    image = Image.from_pil(PIL.Image.effect_noise((1920, 1080), 64))
+    messages: List[LLMMessage] = [UserMessage(content=["Describe the image.", image], source="user")]
+
+    client = OpenAIChatCompletionClient(model="gpt-4o", api_key="api_key", image_detail="low", downscale_images=True)
+    create_params = client._process_create_args(messages, [], None, {})  # pyright: ignore[reportPrivateUsage]
+    image_url: Dict[str, Any] = create_params.messages[0]["content"][1]["image_url"]  # type: ignore
+    assert image_url["detail"] == "low"
+    assert Image.from_uri(image_url["url"]).image.size == (512, 288)
+    assert client.image_bytes_saved > 0
+
+    # Images are sent as is by default.
+    client = OpenAIChatCompletionClient(model="gpt-4o", api_key="api_key")
+    create_params = client._process_create_args(messages, [], None, {})  # pyright: ignore[reportPrivateUsage]
+    image_url = create_params.messages[0]["content"][1]["image_url"]  # type: ignore
+    assert image_url == {"url": image.data_uri, "detail": "auto"}
+    assert client.image_bytes_saved == 0
+
+
+def test_openai_chat_completion_client_reuses_converted_messages() -> None:
+    client = OpenAIChatCompletionClient(model="gpt-4o", api_key="api_key")
+    messages: List[LLMMessage] = [SystemMessage(content="You are a helpful assistant.")]
+    for i in range(250):
+        messages.append(UserMessage(content=f"Question {i}", source="user"))
+        messages.append(AssistantMessage(content=f"Answer {i}", source="assistant"))
+    cache = client._converted_messages  # pyright: ignore[reportPrivateUsage]
+
+    first = client._process_create_args(messages, [], None, {})  # pyright: ignore[reportPrivateUsage]
+    assert (cache.hits, cache.misses) == (0, 501)
+
+    # The next turn only converts the new message.
+    messages.append(UserMessage(content="Question 250", source="user"))
+    second = client._process_create_args(messages, [], None, {})  # pyright: ignore[reportPrivateUsage]
+    assert (cache.hits, cache.misses) == (501, 502)
+    assert second.messages[:-1] == first.messages
+    assert second.messages[-1] == {"role": "user", "content": "Question 250", "name": "user"}
+
+    # A message whose content is replaced is converted again.
+    messages[1].content = "Edited question"
+    third = client._process_create_args(messages, [], None, {})  # pyright: ignore[reportPrivateUsage]
+    assert third.messages[1]["content"] == "Edited question"  # type: ignore
+    assert cache.misses == 503
+
+    # Messages dropped from the history, as by a buffered context, are no longer kept by the client.
+    assert len(cache) == 502
+    client._process_create_args(messages[:1] + messages[-10:], [], None, {})  # pyright: ignore[reportPrivateUsage]
+    assert len(cache) == 11
+    assert cache.misses == 503
+
+
 def test_convert_tools_accepts_both_func_tool_and_schema() -> None:
     def my_function(arg: str, other: Annotated[int, "int arg"], nonrequired: int = 5) -> MyResult:
         return MyResult(result="test")
@@ -1,4 +1,5 @@
 import asyncio
+from pathlib import Path
 
 import pytest
 from autogen_core.models import (
@@ -11,13 +12,18 @@
 )
 from autogen_ext.models.replay import ReplayChatCompletionClient
 
-session_file_path = str("./session_1.json")
+
+@pytest.fixture(scope="module")
+def work_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    # Shared by the tests, so that test_replay replays the session recorded by test_record.
+    return tmp_path_factory.mktemp("recorder")
 
 
 @pytest.mark.asyncio
-async def test_record() -> None:
+async def test_record(work_dir: Path) -> None:
     """Test that in record mode, create() records the interaction and writes to disk on finalize()."""
-    logger = PageLogger(config={"level": "DEBUG", "path": "./logs"})
+    session_file_path = str(work_dir / "session_1.json")
+    logger = PageLogger(config={"level": "DEBUG", "path": str(work_dir / "logs")})
     logger.enter_function()
 
     mock_client = ReplayChatCompletionClient(
@@ -39,12 +45,13 @@ async def test_record() -> None:
 
 
 @pytest.mark.asyncio
-async def test_replay() -> None:
+async def test_replay(work_dir: Path) -> None:
     """
     Test that in replay mode, create() replays the recorded response if the messages match,
     and raises an error if they do not or if records run out.
     """
-    logger = PageLogger(config={"level": "DEBUG", "path": "./logs"})
+    session_file_path = str(work_dir / "session_1.json")
+    logger = PageLogger(config={"level": "DEBUG", "path": str(work_dir / "logs")})
     logger.enter_function()
 
     mock_client = ReplayChatCompletionClient(
@@ -66,5 +73,5 @@ async def test_replay() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(test_record())
-    asyncio.run(test_replay())
+    asyncio.run(test_record(Path(".")))
+    asyncio.run(test_replay(Path(".")))
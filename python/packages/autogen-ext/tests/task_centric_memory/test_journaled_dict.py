@@ -0,0 +1,97 @@
+import os
+import pickle
+from pathlib import Path
+
+import pytest
+from autogen_ext.experimental.task_centric_memory._journaled_dict import JournaledDict
+
+
+def test_journaled_dict_appends_and_reloads(tmp_path: Path) -> None:
+    path = str(tmp_path / "dict.pkl")
+    d: JournaledDict[str, int] = JournaledDict(path)
+    for i in range(10):
+        d[str(i)] = i
+    del d["3"]
+    d.close()
+
+    # Changes go to the journal, the snapshot is not rewritten.
+    assert not os.path.exists(path)
+    assert os.path.exists(d.journal_path)
+
+    reloaded: JournaledDict[str, int] = JournaledDict(path)
+    assert dict(reloaded) == {str(i): i for i in range(10) if i != 3}
+
+
+def test_journaled_dict_loads_legacy_snapshot(tmp_path: Path) -> None:
+    path = str(tmp_path / "dict.pkl")
+    with open(path, "wb") as f:
+        pickle.dump({"a": 1}, f)
+
+    d: JournaledDict[str, int] = JournaledDict(path)
+    assert d["a"] == 1
+    d["b"] = 2
+    d.close()
+    assert dict(JournaledDict[str, int](path)) == {"a": 1, "b": 2}
+
+
+def test_journaled_dict_drops_torn_record(tmp_path: Path) -> None:
+    path = str(tmp_path / "dict.pkl")
+    d: JournaledDict[str, str] = JournaledDict(path)
+    d["a"] = "x"
+    d["b"] = "y"
+    d.close()
+
+    # Simulate a crash in the middle of writing the last record.
+    size = os.path.getsize(d.journal_path)
+    with open(d.journal_path, "r+b") as f:
+        f.truncate(size - 3)
+
+    reloaded: JournaledDict[str, str] = JournaledDict(path)
+    assert dict(reloaded) == {"a": "x"}
+    reloaded["c"] = "z"
+    reloaded.close()
+    assert dict(JournaledDict[str, str](path)) == {"a": "x", "c": "z"}
+
+
+@pytest.mark.parametrize("use_batch", [False, True])
+def test_journaled_dict_compacts(tmp_path: Path, use_batch: bool) -> None:
+    path = str(tmp_path / "dict.pkl")
+    d: JournaledDict[int, int] = JournaledDict(path, min_compaction_records=5)
+    if use_batch:
+        with d.batch():
+            for i in range(7):
+                d[i] = i
+    else:
+        for i in range(7):
+            d[i] = i
+
+    # Compaction swapped in a full snapshot and emptied the journal.
+    assert os.path.exists(path)
+    with open(path, "rb") as f:
+        snapshot = pickle.load(f)
+    assert len(snapshot) >= 5
+    assert dict(JournaledDict[int, int](path)) == {i: i for i in range(7)}
+
+
+def test_journaled_dict_clear(tmp_path: Path) -> None:
+    path = str(tmp_path / "dict.pkl")
+    d: JournaledDict[str, int] = JournaledDict(path)
+    d["a"] = 1
+    d.clear()
+    assert len(d) == 0
+    assert not os.path.exists(d.journal_path)
+    assert dict(JournaledDict[str, int](path)) == {}
+
+
+def test_journaled_dict_stores_any_value(tmp_path: Path) -> None:
+    path = str(tmp_path / "dict.pkl")
+    d: JournaledDict[str, object] = JournaledDict(path)
+    d["a"] = "__journaled_dict_deleted__"
+    d["b"] = None
+    with d.batch():
+        d["c"] = 1
+        del d["c"]
+
+    # The journal is not left open between changes.
+    assert d._journal_file is None  # type: ignore[reportPrivateUsage]
+    assert dict(JournaledDict[str, object](path)) == {"a": "__journaled_dict_deleted__", "b": None}
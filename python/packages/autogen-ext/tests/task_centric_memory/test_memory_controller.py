@@ -0,0 +1,191 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+from autogen_ext.experimental.task_centric_memory import MemoryController
+from autogen_ext.experimental.task_centric_memory._memory_bank import Memo
+from autogen_ext.experimental.task_centric_memory.memory_controller import MemoryControllerConfig
+from autogen_ext.experimental.task_centric_memory.utils import PageLogger
+from autogen_ext.models.replay import ReplayChatCompletionClient
+
+
+def create_memory_controller(tmp_path: Path, config: MemoryControllerConfig) -> MemoryController:
+    config["MemoryBank"] = {"path": str(tmp_path / "memory_bank")}
+    return MemoryController(reset=True, client=ReplayChatCompletionClient([]), config=config, logger=PageLogger())
+
+
+class FakePrompter:
+    """Stands in for the Prompter, recording its calls instead of calling a model."""
+
+    def __init__(self, delays: Dict[str, float] | None = None, passing: List[str] | None = None) -> None:
+        # Insights without a delay never finish validating, unless cancelled.
+        self.delays = delays or {}
+        self.passing = passing or []
+        self.started: List[str] = []
+        self.cancelled: List[str] = []
+        self.calls: List[str] = []
+
+    async def validate_insight(self, insight: str, task_description: str) -> bool:
+        self.started.append(insight)
+        try:
+            if insight not in self.delays:
+                await asyncio.Event().wait()
+            await asyncio.sleep(self.delays[insight])
+        except asyncio.CancelledError:
+            self.cancelled.append(insight)
+            raise
+        if insight == "error":
+            raise ValueError("Validation failed")
+        return insight in self.passing
+
+    async def generalize_task(self, task_description: str, revise: bool | None = True) -> str:
+        self.calls.append(f"generalize {task_description}")
+        return f"general {task_description}"
+
+    async def find_index_topics(self, input_string: str) -> List[str]:
+        self.calls.append(f"topics {input_string}")
+        return [f"{input_string} topic"]
+
+
+@pytest.mark.asyncio
+async def test_run_trials_concurrently(tmp_path: Path) -> None:
+    memory_controller = create_memory_controller(tmp_path, {"max_concurrent_trials": 3})
+    num_running = 0
+    max_running = 0
+
+    async def run_trial(trial: int) -> int:
+        nonlocal num_running, max_running
+        num_running += 1
+        max_running = max(max_running, num_running)
+        await asyncio.sleep(0.01 * (trial % 3))
+        num_running -= 1
+        return trial * 2
+
+    results = await memory_controller._run_trials(7, run_trial)  # type: ignore[reportPrivateUsage]
+    assert results == {trial: trial * 2 for trial in range(7)}
+    assert max_running == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrent_trials", [1, 3])
+async def test_run_trials_stops_at_first_failure(tmp_path: Path, max_concurrent_trials: int) -> None:
+    memory_controller = create_memory_controller(tmp_path, {"max_concurrent_trials": max_concurrent_trials})
+    started: List[int] = []
+    cancelled: List[int] = []
+
+    async def run_trial(trial: int) -> bool:
+        started.append(trial)
+        if trial == 1:
+            return False
+        if max_concurrent_trials == 1:
+            return True
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.append(trial)
+            raise
+        return True
+
+    results = await memory_controller._run_trials(10, run_trial, stop=lambda success: not success)  # type: ignore[reportPrivateUsage]
+
+    # No trials are started after the failure, and those still running are cancelled.
+    if max_concurrent_trials == 1:
+        assert results == {0: True, 1: False}
+        assert started == [0, 1]
+        assert cancelled == []
+    else:
+        assert results == {1: False}
+        assert started == [0, 1, 2]
+        assert sorted(cancelled) == [0, 2]
+
+
+@pytest.mark.asyncio
+async def test_page_logger_not_finalized_while_a_task_has_an_open_page(tmp_path: Path) -> None:
+    logger = PageLogger({"level": "DEBUG", "path": str(tmp_path / "pagelogs")})
+    page_opened = asyncio.Event()
+    can_leave = asyncio.Event()
+
+    async def nested_function() -> None:
+        logger.enter_function()
+        page_opened.set()
+        await can_leave.wait()
+        logger.leave_function()
+
+    task = asyncio.ensure_future(nested_function())
+    await page_opened.wait()
+
+    # The page opened in the other task is not on this task's stack, but still blocks finalizing.
+    assert logger.page_stack.stack == []
+    assert logger.page_stack.size() == 1
+    logger.finalize()
+    assert not os.path.exists(tmp_path / "pagelogs" / "hash.txt")
+
+    can_leave.set()
+    await task
+    logger.finalize()
+    assert os.path.exists(tmp_path / "pagelogs" / "hash.txt")
+
+
+@pytest.mark.asyncio
+async def test_validate_memos_keeps_first_passing_memos_in_order(tmp_path: Path) -> None:
+    memory_controller = create_memory_controller(
+        tmp_path, {"max_concurrent_validations": 4, "max_memos_to_retrieve": 3}
+    )
+    # The first memo finishes last, and memos from m5 on never finish.
+    prompter = FakePrompter(
+        delays={"m0": 0.05, "m1": 0.0, "m2": 0.01, "m3": 0.0, "m4": 0.02}, passing=["m1", "m3", "m4", "m5", "m6"]
+    )
+    memory_controller.prompter = prompter  # type: ignore[assignment]
+    memos = [Memo(task=None, insight=f"m{i}") for i in range(10)]
+
+    validated = await memory_controller._validate_memos(memos, "task")  # type: ignore[reportPrivateUsage]
+
+    # The same memos as with sequential validation, with at most 4 validations in flight.
+    assert [memo.insight for memo in validated] == ["m1", "m3", "m4"]
+    assert prompter.started == [f"m{i}" for i in range(8)]
+    # Once enough memos passed, the outstanding validations are cancelled.
+    await asyncio.sleep(0)
+    assert sorted(prompter.cancelled) == ["m5", "m6", "m7"]
+
+
+@pytest.mark.asyncio
+async def test_validate_memos_cancels_outstanding_validations_on_error(tmp_path: Path) -> None:
+    memory_controller = create_memory_controller(tmp_path, {"max_concurrent_validations": 4})
+    prompter = FakePrompter(delays={"error": 0.0})
+    memory_controller.prompter = prompter  # type: ignore[assignment]
+    memos = [Memo(task=None, insight=insight) for insight in ["error", "m1", "m2", "m3", "m4"]]
+
+    with pytest.raises(ValueError, match="Validation failed"):
+        await memory_controller._validate_memos(memos, "task")  # type: ignore[reportPrivateUsage]
+    await asyncio.sleep(0)
+    assert prompter.started == ["error", "m1", "m2", "m3"]
+    assert sorted(prompter.cancelled) == ["m1", "m2", "m3"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_task_analysis", [True, False])
+async def test_task_analysis_cache(tmp_path: Path, cache_task_analysis: bool) -> None:
+    memory_controller = create_memory_controller(tmp_path, {"cache_task_analysis": cache_task_analysis})
+    memory_controller._max_cache_entries = 2  # type: ignore[reportPrivateUsage]
+    prompter = FakePrompter()
+    memory_controller.prompter = prompter  # type: ignore[assignment]
+
+    for _ in range(2):
+        assert await memory_controller._generalize_task("a") == "general a"  # type: ignore[reportPrivateUsage]
+        topics = await memory_controller._find_index_topics("a")  # type: ignore[reportPrivateUsage]
+        assert topics == ["a topic"]
+        # Callers get their own copy of the cached topics.
+        topics.append("changed")
+
+    if not cache_task_analysis:
+        assert prompter.calls == ["generalize a", "topics a"] * 2
+        return
+    assert prompter.calls == ["generalize a", "topics a"]
+
+    # The oldest entry is evicted once the cache is full.
+    await memory_controller._generalize_task("b")  # type: ignore[reportPrivateUsage]
+    await memory_controller._generalize_task("c")  # type: ignore[reportPrivateUsage]
+    await memory_controller._generalize_task("a")  # type: ignore[reportPrivateUsage]
+    assert prompter.calls[2:] == ["generalize b", "generalize c", "generalize a"]
@@ -0,0 +1,175 @@
+import asyncio
+from typing import Any, Callable, Dict, List
+
+import pytest
+from autogen_ext.agents.web_surfer import BrowserPool
+
+
+class _FakeContext:
+    def __init__(self, browser: "_FakeBrowser") -> None:
+        self.browser = browser
+        self.init_scripts: List[str] = []
+        self.closed = False
+
+    async def add_init_script(self, path: str) -> None:
+        self.init_scripts.append(path)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self) -> None:
+        self.contexts: List[_FakeContext] = []
+        self.closed = False
+        self._handlers: Dict[str, Callable[[Any], None]] = {}
+
+    def on(self, event: str, handler: Callable[[Any], None]) -> None:
+        self._handlers[event] = handler
+
+    def is_connected(self) -> bool:
+        return not self.closed
+
+    async def new_context(self, **kwargs: Any) -> _FakeContext:
+        context = _FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def crash(self) -> None:
+        self.closed = True
+        self._handlers["disconnected"](self)
+
+
+class _FakeChromium:
+    def __init__(self) -> None:
+        self.browsers: List[_FakeBrowser] = []
+        self.launch_delay = 0.0
+
+    async def launch(self, **kwargs: Any) -> _FakeBrowser:
+        await asyncio.sleep(self.launch_delay)
+        browser = _FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+
+class _FakePlaywright:
+    def __init__(self) -> None:
+        self.chromium = _FakeChromium()
+        self.stopped = False
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_shares_browsers() -> None:
+    playwright = _FakePlaywright()
+    pool = BrowserPool(max_browsers=2, max_contexts_per_browser=2, playwright=playwright)  # type: ignore
+    await pool.start()
+
+    contexts = [await pool.acquire() for _ in range(4)]
+    assert len(playwright.chromium.browsers) == 2
+    assert pool.num_contexts == 4
+    # Contexts are spread across browsers, and the page script is injected once per context.
+    assert {context.browser for context in contexts} == set(playwright.chromium.browsers)  # type: ignore
+    assert all(len(context.init_scripts) == 1 for context in contexts)  # type: ignore
+
+    # The pool is full, the next acquire waits for a release.
+    waiter = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+    await pool.release(contexts[0])
+    assert contexts[0].closed  # type: ignore
+    context = await asyncio.wait_for(waiter, timeout=1)
+    assert context.browser is contexts[0].browser  # type: ignore
+    assert len(playwright.chromium.browsers) == 2
+
+    await pool.close()
+    assert all(browser.closed for browser in playwright.chromium.browsers)
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_warm_contexts() -> None:
+    playwright = _FakePlaywright()
+    pool = BrowserPool(max_contexts_per_browser=4, warm_contexts=2, playwright=playwright)  # type: ignore
+    await pool.start()
+    browser = playwright.chromium.browsers[0]
+    assert len(browser.contexts) == 2
+
+    context = await pool.acquire()
+    assert context in browser.contexts  # type: ignore
+    # The warm context is replenished in the background.
+    await asyncio.sleep(0.01)
+    assert len(browser.contexts) == 3
+
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_recycles_browsers() -> None:
+    playwright = _FakePlaywright()
+    pool = BrowserPool(max_contexts_per_browser=4, max_contexts_per_browser_lifetime=2, playwright=playwright)  # type: ignore
+    await pool.start()
+
+    first = await pool.acquire()
+    second = await pool.acquire()
+    # The first browser is retired after serving two contexts.
+    third = await pool.acquire()
+    assert third.browser is not first.browser  # type: ignore
+    await pool.release(first)
+    assert not first.browser.closed  # type: ignore
+    await pool.release(second)
+    assert first.browser.closed  # type: ignore
+
+    # A crashed browser is replaced.
+    third.browser.crash()  # type: ignore
+    fourth = await pool.acquire()
+    assert fourth.browser is not third.browser  # type: ignore
+    assert len(playwright.chromium.browsers) == 3
+
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_starts_playwright_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    started: List[_FakePlaywright] = []
+
+    class _FakeContextManager:
+        async def start(self) -> _FakePlaywright:
+            await asyncio.sleep(0.01)
+            started.append(_FakePlaywright())
+            return started[-1]
+
+    monkeypatch.setattr("autogen_ext.agents.web_surfer._browser_pool.async_playwright", _FakeContextManager)
+    pool = BrowserPool(max_contexts_per_browser=4)
+    await asyncio.gather(*[pool.acquire() for _ in range(3)])
+    assert len(started) == 1
+    assert len(started[0].chromium.browsers) == 1
+
+    await pool.close()
+    assert started[0].stopped
+
+
+@pytest.mark.asyncio
+async def test_browser_pool_launches_outside_the_lock() -> None:
+    playwright = _FakePlaywright()
+    pool = BrowserPool(max_browsers=2, max_contexts_per_browser=1, playwright=playwright)  # type: ignore
+    await pool.start()
+    first = await pool.acquire()
+
+    # While the second browser is launching, contexts of the first one can be released and acquired.
+    playwright.chromium.launch_delay = 0.5
+    launching = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0.01)
+    await asyncio.wait_for(pool.release(first), timeout=0.1)
+    again = await asyncio.wait_for(pool.acquire(), timeout=0.1)
+    assert again.browser is first.browser  # type: ignore
+
+    second = await launching
+    assert second.browser is not first.browser  # type: ignore
+    assert len(playwright.chromium.browsers) == 2
+
+    await pool.close()
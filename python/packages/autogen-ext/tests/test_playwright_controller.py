@@ -76,3 +76,26 @@ async def test_playwright_controller_fill_id() -> None:
         controller = PlaywrightController()
         await controller.fill_id(page, input_box_id, "test input")
         assert await page.evaluate("document.getElementById('input-box').value") == "test input"
+
+
+@pytest.mark.asyncio
+async def test_playwright_controller_get_page_snapshot() -> None:
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context()
+        page = await context.new_page()
+        await page.set_content(FAKE_HTML)
+
+        controller = PlaywrightController()
+        snapshot = await controller.get_page_snapshot(page)
+        assert snapshot["title"] == "Fake Page"
+        assert snapshot["interactive_rects"] == await controller.get_interactive_rects(page)
+        assert snapshot["visual_viewport"] == await controller.get_visual_viewport(page)
+        assert "Welcome to the Fake Page" in snapshot["visible_text"]
+
+        # Unchanged page, same epoch. A DOM mutation moves to a new epoch and refreshes the snapshot.
+        assert (await controller.get_page_snapshot(page))["mutation_epoch"] == snapshot["mutation_epoch"]
+        await page.evaluate("document.getElementById('header').textContent = 'Changed';")
+        changed = await controller.get_page_snapshot(page)
+        assert changed["mutation_epoch"] != snapshot["mutation_epoch"]
+        assert "Changed" in changed["visible_text"]
@@ -1,9 +1,11 @@
 import asyncio
+import io
 import json
 import logging
 from datetime import datetime
-from typing import Any, AsyncGenerator, List
+from typing import Any, AsyncGenerator, Dict, List
 
+import PIL.Image
 import pytest
 from autogen_agentchat import EVENT_LOGGER_NAME
 from autogen_agentchat.messages import (
@@ -11,6 +13,8 @@
     TextMessage,
 )
 from autogen_ext.agents.web_surfer import MultimodalWebSurfer
+from autogen_ext.agents.web_surfer._set_of_mark import add_set_of_mark
+from autogen_ext.agents.web_surfer._types import InteractiveRegion, interactiveregion_from_dict
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from openai.resources.chat.completions import AsyncCompletions
 from openai.types.chat.chat_completion import ChatCompletion, Choice
@@ -180,3 +184,97 @@ async def test_run_websurfer_declarative(monkeypatch: pytest.MonkeyPatch) -> Non
     loaded_agent = MultimodalWebSurfer.load_component(agent_config)
     assert isinstance(loaded_agent, MultimodalWebSurfer)
     assert loaded_agent.name == "WebSurfer"
+
+
+def test_set_of_mark_rendered_at_target_size() -> None:
+    screenshot = PIL.Image.new("RGB", (1440, 900), color=(255, 255, 255))
+    rects: Dict[str, InteractiveRegion] = {
+        "10": interactiveregion_from_dict(
+            {
+                "tag_name": "a",
+                "role": "link",
+                "aria-name": "visible",
+                "v-scrollable": False,
+                "rects": [
+                    {
+                        "x": 100,
+                        "y": 100,
+                        "width": 50,
+                        "height": 20,
+                        "top": 100,
+                        "right": 150,
+                        "bottom": 120,
+                        "left": 100,
+                    }
+                ],
+            }
+        ),
+        "11": interactiveregion_from_dict(
+            {
+                "tag_name": "a",
+                "role": "link",
+                "aria-name": "below",
+                "v-scrollable": False,
+                "rects": [
+                    {
+                        "x": 100,
+                        "y": 950,
+                        "width": 50,
+                        "height": 20,
+                        "top": 950,
+                        "right": 150,
+                        "bottom": 970,
+                        "left": 100,
+                    }
+                ],
+            }
+        ),
+    }
+
+    som, visible, above, below = add_set_of_mark(screenshot, rects, size=(1224, 765))
+
+    assert som.size == (1224, 765)
+    assert visible == ["10"]
+    assert above == []
+    assert below == ["11"]
+    # The mark is drawn at the scaled location of the region.
+    assert som.getpixel((int(125 * 0.85), int(110 * 0.85))) != (255, 255, 255, 255)
+
+
+class _FakePage:
+    """Stands in for a Playwright page, counting the screenshots taken."""
+
+    url = "https://example.com/"
+
+    def __init__(self) -> None:
+        self.num_screenshots = 0
+
+    async def screenshot(self) -> bytes:
+        self.num_screenshots += 1
+        buffer = io.BytesIO()
+        PIL.Image.new("RGB", (1440, 900), color=(255, 255, 255)).save(buffer, format="PNG")
+        return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("screenshot_max_age", [10.0, 0.0])
+async def test_screenshot_reuse_max_age(screenshot_max_age: float) -> None:
+    agent = MultimodalWebSurfer(
+        "WebSurfer",
+        model_client=OpenAIChatCompletionClient(model="gpt-4o-2024-05-13", api_key=""),
+        screenshot_max_age=screenshot_max_age,
+    )
+    page = _FakePage()
+    agent._page = page  # type: ignore
+    viewport = {"pageLeft": 0, "pageTop": 0, "width": 1440, "height": 900}
+    snapshot: Any = {"mutation_epoch": "1", "interactive_rects": {}, "visual_viewport": viewport}
+
+    await agent._get_som_screenshot(snapshot)  # pyright: ignore[reportPrivateUsage]
+    await agent._get_som_screenshot(snapshot)  # pyright: ignore[reportPrivateUsage]
+    # The unchanged page is only captured again when reuse is disabled.
+    assert page.num_screenshots == (1 if screenshot_max_age > 0 else 2)
+
+    # A capture older than screenshot_max_age is not reused, even if the page shows no change.
+    agent._screenshot_time -= 11  # pyright: ignore[reportPrivateUsage]
+    await agent._get_som_screenshot(snapshot)  # pyright: ignore[reportPrivateUsage]
+    assert page.num_screenshots == (2 if screenshot_max_age > 0 else 3)
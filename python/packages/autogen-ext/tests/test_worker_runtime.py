@@ -1,16 +1,19 @@
 import asyncio
 import logging
 import os
+import time
 from typing import Any, List
 
 import pytest
 from autogen_core import (
+    JSON_DATA_CONTENT_TYPE,
     PROTOBUF_DATA_CONTENT_TYPE,
     AgentId,
     AgentType,
     DefaultSubscription,
     DefaultTopicId,
     MessageContext,
+    MessageHandlerContext,
     RoutedAgent,
     Subscription,
     TopicId,
@@ -21,6 +24,7 @@
     type_subscription,
 )
 from autogen_ext.runtimes.grpc import GrpcWorkerAgentRuntime, GrpcWorkerAgentRuntimeHost
+from autogen_ext.runtimes.grpc.protos import cloudevent_pb2
 from autogen_test_utils import (
     CascadingAgent,
     CascadingMessageType,
@@ -670,14 +674,15 @@ async def test_instance_factory_messaging() -> None:
     await cascading_agent.register_instance(worker, agent_id=cascading_agent_id)
     await CascadingAgent.register(worker, "factory_agent", lambda: CascadingAgent(max_rounds=5))
 
-    # instance_agent will publish a message that factory_agent will pick up
+    # instance_agent will publish a message that factory_agent will pick up.
+    # The default topic source is the key of the publishing agent, instance_agent.
     for i in range(5):
         await worker.publish_message(
             CascadingMessageType(round=i + 1), TopicId(type="instance_agent", source="instance_agent")
         )
     await asyncio.sleep(2)
 
-    agent = await worker.try_get_underlying_agent_instance(AgentId("factory_agent", "default"), CascadingAgent)
+    agent = await worker.try_get_underlying_agent_instance(AgentId("factory_agent", "instance_agent"), CascadingAgent)
     assert agent.num_calls == 4
     assert cascading_agent.num_calls == 5
 
@@ -685,6 +690,87 @@ async def test_instance_factory_messaging() -> None:
     await host.stop()
 
 
+@default_subscription
+class _AgentIdRecordingAgent(RoutedAgent):
+    def __init__(self) -> None:
+        super().__init__("Records the agent id of the message handler context.")
+        self.handler_agent_ids: List[AgentId] = []
+
+    @event
+    async def on_new_message(self, message: MessageType, ctx: MessageContext) -> None:
+        self.handler_agent_ids.append(MessageHandlerContext.agent_id())
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+async def test_event_handler_message_context() -> None:
+    host_address = "localhost:50063"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+    worker = GrpcWorkerAgentRuntime(host_address=host_address)
+    worker.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await worker.start()
+
+    await _AgentIdRecordingAgent.register(worker, "recorder", lambda: _AgentIdRecordingAgent())
+    await worker.publish_message(MessageType(), topic_id=DefaultTopicId())
+    await asyncio.sleep(2)
+
+    agent = await worker.try_get_underlying_agent_instance(AgentId("recorder", "default"), _AgentIdRecordingAgent)
+    assert agent.handler_agent_ids == [AgentId("recorder", "default")]
+
+    await worker.stop()
+    await host.stop()
+
+
+@pytest.mark.grpc
+@pytest.mark.asyncio
+@pytest.mark.parametrize("num_subscribers", [1, 10, 1000])
+async def test_event_fan_out_throughput(num_subscribers: int) -> None:
+    host_address = "localhost:50062"
+    host = GrpcWorkerAgentRuntimeHost(address=host_address)
+    host.start()
+    worker = GrpcWorkerAgentRuntime(host_address=host_address, max_concurrent_event_handlers=64)
+    worker.add_message_serializer(try_get_known_serializers_for_type(MessageType))
+    await worker.start()
+
+    agents: List[LoopbackAgent] = []
+    for i in range(num_subscribers):
+        agent = LoopbackAgent()
+        await agent.register_instance(worker, agent_id=AgentId(f"subscriber_{i}", "default"))
+        await worker.add_subscription(TypeSubscription("fan_out", f"subscriber_{i}"))
+        agents.append(agent)
+
+    # Drive the worker's event path directly so the measurement excludes the network hop.
+    message_type = worker._serialization_registry.type_name(MessageType())  # type: ignore[reportPrivateUsage]
+    data = worker._serialization_registry.serialize(  # type: ignore[reportPrivateUsage]
+        MessageType(), type_name=message_type, data_content_type=JSON_DATA_CONTENT_TYPE
+    )
+    event = cloudevent_pb2.CloudEvent(
+        id="benchmark",
+        spec_version="1.0",
+        type="fan_out",
+        source="default",
+        attributes={
+            "datacontenttype": cloudevent_pb2.CloudEvent.CloudEventAttributeValue(ce_string=JSON_DATA_CONTENT_TYPE),
+            "dataschema": cloudevent_pb2.CloudEvent.CloudEventAttributeValue(ce_string=message_type),
+        },
+        binary_data=data,
+    )
+    num_events = 50
+    start = time.perf_counter()
+    for _ in range(num_events):
+        await worker._process_event(event)  # type: ignore[reportPrivateUsage]
+    elapsed = time.perf_counter() - start
+    logging.getLogger(__name__).info(
+        "Fan-out to %d subscribers: %.1f events/sec", num_subscribers, num_events / elapsed
+    )
+
+    assert all(agent.num_calls == num_events for agent in agents)
+
+    await worker.stop()
+    await host.stop()
+
+
 # GrpcWorkerAgentRuntimeHost eats exceptions in the main loop
 # @pytest.mark.grpc
 # @pytest.mark.asyncio
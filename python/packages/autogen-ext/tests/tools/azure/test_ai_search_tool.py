@@ -1,7 +1,10 @@
 """Tests for Azure AI Search tool."""
 
 import asyncio
+import json
+import threading
 from collections.abc import Generator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Any, Dict, List
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -969,3 +972,143 @@ async def test_api_version_handling() -> None:
         warning_msg = mock_logger.warning.call_args[0][0]
         assert "vector search" in warning_msg.lower()
         assert "2023-11-01" in warning_msg
+
+
+@pytest.fixture
+def embedding_server() -> Generator[tuple[str, List[Any]], None, None]:
+    """A local stand-in for an OpenAI-compatible embeddings endpoint that records the inputs of each request."""
+    requests: List[Any] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:  # noqa: N802
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            requests.append(body["input"])
+            texts = body["input"] if isinstance(body["input"], list) else [body["input"]]
+            payload = {
+                "object": "list",
+                "model": body["model"],
+                "data": [
+                    {"object": "embedding", "index": i, "embedding": [float(len(text)), float(i)]}
+                    for i, text in enumerate(texts)
+                ],
+                "usage": {"prompt_tokens": 1, "total_tokens": 1},
+            }
+            data = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1", requests
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_embedding_client_reuse_cache_and_batching(
+    embedding_server: tuple[str, List[Any]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    base_url, requests = embedding_server
+    monkeypatch.setenv("OPENAI_BASE_URL", base_url)
+    tool = AzureAISearchTool.create_vector_search(
+        name="test-search",
+        endpoint=MOCK_ENDPOINT,
+        index_name=MOCK_INDEX,
+        credential=MOCK_CREDENTIAL,
+        vector_fields=["embedding"],
+        embedding_provider="openai",
+        embedding_model="text-embedding-3-small",
+        openai_api_key="test-key",
+        embedding_cache_size=2,
+        embedding_max_concurrency=1,
+    )
+
+    assert await tool._get_embedding("apple") == [5.0, 0.0]  # pyright: ignore[reportPrivateUsage]
+    client = tool._embedding_client  # pyright: ignore[reportPrivateUsage]
+    # Cached, no new request.
+    embedding = await tool._get_embedding("apple")  # pyright: ignore[reportPrivateUsage]
+    assert embedding == [5.0, 0.0]
+    assert requests == ["apple"]
+    # Callers get their own copy of a cached vector.
+    embedding.append(1.0)
+    assert await tool._get_embedding("apple") == [5.0, 0.0]  # pyright: ignore[reportPrivateUsage]
+
+    # Misses are embedded in a single batched request, duplicates are sent once.
+    embeddings = await tool._get_embeddings(["apple", "kiwi", "banana", "kiwi"])  # pyright: ignore[reportPrivateUsage]
+    assert embeddings == [[5.0, 0.0], [4.0, 0.0], [6.0, 1.0], [4.0, 0.0]]
+    assert requests == ["apple", ["kiwi", "banana"]]
+    assert tool._embedding_client is client  # pyright: ignore[reportPrivateUsage]
+
+    # The cache is bounded, "apple" was evicted.
+    await tool._get_embedding("apple")  # pyright: ignore[reportPrivateUsage]
+    assert requests[-1] == "apple"
+
+    # Concurrent queries are embedded together in one batched request.
+    results = await asyncio.gather(*[tool._get_embedding(f"q{i}") for i in range(5)])  # pyright: ignore[reportPrivateUsage]
+    assert results == [[2.0, float(i)] for i in range(5)]
+    assert requests[-1] == [f"q{i}" for i in range(5)]
+
+    # Concurrent requests are limited, but all get their embedding.
+    many_queries = [f"query {i}" for i in range(600)]
+    embeddings = await tool._get_embeddings(many_queries)  # pyright: ignore[reportPrivateUsage]
+    assert [e[0] for e in embeddings] == [float(len(q)) for q in many_queries]
+    assert [len(r) for r in requests[-3:]] == [256, 256, 88]
+
+    # The client of a previous event loop is closed and replaced.
+    closed: List[bool] = []
+
+    class _OldClient:
+        async def close(self) -> None:
+            closed.append(True)
+
+    old_loop = asyncio.new_event_loop()
+    tool._embedding_client = _OldClient()  # pyright: ignore[reportPrivateUsage]
+    tool._embedding_loop = old_loop  # pyright: ignore[reportPrivateUsage]
+    try:
+        await tool._get_embedding("cherry")  # pyright: ignore[reportPrivateUsage]
+    finally:
+        old_loop.close()
+    assert closed == [True]
+    assert tool._embedding_loop is asyncio.get_running_loop()  # pyright: ignore[reportPrivateUsage]
+
+    await tool.close()
+    assert tool._embedding_client is None  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_vector_searches_share_one_embedding_request(
+    embedding_server: tuple[str, List[Any]],
+    monkeypatch: pytest.MonkeyPatch,
+    mock_search_client: AsyncMock,
+    mock_search_results: List[Dict[str, Any]],
+) -> None:
+    base_url, requests = embedding_server
+    monkeypatch.setenv("OPENAI_BASE_URL", base_url)
+    mock_search_client.search.return_value.__aiter__.return_value = mock_search_results
+    tool = AzureAISearchTool.create_vector_search(
+        name="test-search",
+        endpoint=MOCK_ENDPOINT,
+        index_name=MOCK_INDEX,
+        credential=MOCK_CREDENTIAL,
+        vector_fields=["embedding", "title_embedding"],
+        embedding_provider="openai",
+        embedding_model="text-embedding-3-small",
+        openai_api_key="test-key",
+    )
+
+    with patch.object(tool, "_get_client", return_value=mock_search_client):
+        results = await asyncio.gather(tool.run("apple"), tool.run("kiwi"), tool.run("apple"))
+    assert [len(r.results) for r in results] == [1, 1, 1]
+    assert requests == [["apple", "kiwi"]]
+
+    # Each vector field is searched with the embedding of its own query.
+    vectors = [[q.vector for q in call.kwargs["vector_queries"]] for call in mock_search_client.search.call_args_list]
+    assert sorted(vectors) == [[[4.0, 1.0], [4.0, 1.0]], [[5.0, 0.0], [5.0, 0.0]], [[5.0, 0.0], [5.0, 0.0]]]
+    await tool.close()
@@ -2,10 +2,11 @@
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, List, Optional, Sequence, Union
 
 from loguru import logger
-from sqlalchemy import exc, inspect, text
+from sqlalchemy import delete as sa_delete
+from sqlalchemy import exc, func, inspect, text
 from sqlmodel import Session, SQLModel, and_, create_engine, select
 
 from ..datamodel import BaseDBModel, Response, Team
@@ -40,7 +41,8 @@ def __init__(self, engine_uri: str, base_dir: Optional[Union[str, Path]] = None)
             engine_uri: Database connection URI (e.g. sqlite:///db.sqlite3)
             base_dir: Base directory for migration files. If None, uses current directory
         """
-        connection_args = {"check_same_thread": True} if "sqlite" in engine_uri else {}
+        # Connections may be used from a worker thread (see WebSocketManager persistence), sessions are never shared.
+        connection_args = {"check_same_thread": False} if "sqlite" in engine_uri else {}
 
         if base_dir is not None and isinstance(base_dir, str):
             base_dir = Path(base_dir)
@@ -202,9 +204,47 @@ def upsert(self, model: BaseDBModel, return_json: bool = True) -> Response:
             data=model.model_dump() if return_json else model,
         )
 
+    def bulk_insert(self, models: Sequence[BaseDBModel]) -> Response:
+        """Insert several new entities in a single transaction
+
+        Unlike :meth:`upsert`, no lookup is done for existing rows, which makes this suitable
+        for append-only records such as messages.
+
+        Args:
+            models (Sequence[SQLModel]): The model instances to insert
+
+        Returns:
+            Response: Contains status and message, data is the number of inserted rows
+        """
+        if not models:
+            return Response(message="Nothing to insert", status=True, data=0)
+
+        # Keep attributes loaded after commit, the instances are used after the session is closed.
+        with Session(self.engine, expire_on_commit=False) as session:
+            try:
+                session.add_all(models)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                logger.error(f"Error while inserting {len(models)} rows: {e}")
+                return Response(message=f"Error while inserting: {e}", status=False, data=0)
+
+        return Response(message=f"{len(models)} rows inserted successfully", status=True, data=len(models))
+
     def _model_to_dict(self, model_obj):
         return {col.name: getattr(model_obj, col.name) for col in model_obj.__table__.columns}
 
+    def _build_conditions(self, model_class: type[BaseDBModel], filters: dict | None) -> List[Any]:
+        """Turn filters into where clauses, list, tuple and set values match any of their items"""
+        conditions = []
+        for col, value in (filters or {}).items():
+            column = getattr(model_class, col)
+            if isinstance(value, (list, tuple, set)):
+                conditions.append(column.in_(list(value)))
+            else:
+                conditions.append(column == value)
+        return conditions
+
     def get(
         self,
         model_class: type[BaseDBModel],
@@ -221,8 +261,7 @@ def get(
             try:
                 statement = select(model_class)  # type: ignore
                 if filters:
-                    conditions = [getattr(model_class, col) == value for col, value in filters.items()]
-                    statement = statement.where(and_(*conditions))
+                    statement = statement.where(and_(*self._build_conditions(model_class, filters)))
 
                 if hasattr(model_class, "created_at") and order:
                     order_by_clause = getattr(model_class.created_at, order)()  # Dynamically apply asc/desc
@@ -239,26 +278,129 @@ def get(
 
             return Response(message=status_message, status=status, data=result)
 
+    def get_page(
+        self,
+        model_class: type[BaseDBModel],
+        filters: dict | None = None,
+        limit: int = 50,
+        cursor: Optional[int] = None,
+        order: str = "desc",
+        columns: Optional[Sequence[str]] = None,
+        return_json: bool = False,
+    ) -> Response:
+        """List one page of entities using keyset pagination
+
+        Rows are ordered by id, which follows creation order, and each page starts right after
+        the ``cursor`` returned with the previous one. Unlike offsets, this stays fast however
+        deep the page is.
+
+        Args:
+            model_class: The model to query
+            filters: Column values to match, list values match any of their items
+            limit: Maximum number of rows in the page
+            cursor: The ``next_cursor`` of the previous page, None for the first page
+            order: "desc" for newest first, "asc" for oldest first
+            columns: Only load these columns, rows are returned as dictionaries. Loads every column if None
+            return_json: If True, returns full rows as dictionaries instead of SQLModel instances
+
+        Returns:
+            Response: data is a dict with the page ``items`` and the ``next_cursor`` (None on the last page)
+        """
+        if limit < 1:
+            return Response(message="limit must be at least 1", status=False, data=None)
+        if order not in ("asc", "desc"):
+            return Response(message="order must be 'asc' or 'desc'", status=False, data=None)
+
+        with Session(self.engine) as session:
+            try:
+                id_column = model_class.id
+                if columns:
+                    selected = [getattr(model_class, col) for col in columns]
+                    if "id" not in columns:
+                        # The id is needed for the cursor.
+                        selected.append(id_column)
+                    statement = select(*selected)
+                else:
+                    statement = select(model_class)  # type: ignore
+
+                conditions = self._build_conditions(model_class, filters)
+                if cursor is not None:
+                    conditions.append(id_column < cursor if order == "desc" else id_column > cursor)  # type: ignore
+                if conditions:
+                    statement = statement.where(and_(*conditions))
+                # Fetch one extra row to know whether there is a next page.
+                statement = statement.order_by(getattr(id_column, order)()).limit(limit + 1)
+
+                rows = session.exec(statement).all()
+                has_more = len(rows) > limit
+                rows = rows[:limit]
+                if columns:
+                    items = [dict(row._mapping) for row in rows]
+                    last_id = items[-1]["id"] if items else None
+                else:
+                    items = [self._model_to_dict(row) if return_json else row for row in rows]
+                    last_id = rows[-1].id if rows else None
+            except Exception as e:
+                session.rollback()
+                logger.error("Error while getting page: " + str(model_class.__name__) + " " + str(e))
+                return Response(message=f"Error while fetching {model_class.__name__}", status=False, data=None)
+
+        return Response(
+            message=f"{model_class.__name__} Retrieved Successfully",
+            status=True,
+            data={"items": items, "next_cursor": last_id if has_more else None},
+        )
+
+    def count(self, model_class: type[BaseDBModel], filters: dict | None = None) -> Response:
+        """Count entities in the database without loading them
+
+        Args:
+            model_class: The model to count
+            filters: Column values to match, list values match any of their items
+
+        Returns:
+            Response: data is the number of matching rows
+        """
+        with Session(self.engine) as session:
+            try:
+                statement = select(func.count()).select_from(model_class)
+                if filters:
+                    statement = statement.where(and_(*self._build_conditions(model_class, filters)))
+                total = session.exec(statement).one()
+            except Exception as e:
+                logger.error("Error while counting items: " + str(model_class.__name__) + " " + str(e))
+                return Response(message=f"Error while counting {model_class.__name__}", status=False, data=None)
+
+        return Response(message=f"{model_class.__name__} Counted Successfully", status=True, data=total)
+
     def delete(self, model_class: type[BaseDBModel], filters: dict | None = None) -> Response:
-        """Delete an entity"""
+        """Delete all entities matching the filters with a single statement
+
+        Rows are not loaded, related rows are removed by the database foreign key cascades.
+
+        Args:
+            model_class: The model to delete from
+            filters: Column values to match, list values match any of their items
+
+        Returns:
+            Response: data is the number of deleted rows
+        """
         status_message = ""
         status = True
+        deleted = 0
 
         with Session(self.engine) as session:
             try:
                 if "sqlite" in str(self.engine.url):
                     session.exec(text("PRAGMA foreign_keys=ON"))  # type: ignore
-                statement = select(model_class)  # type: ignore
+                statement = sa_delete(model_class)
                 if filters:
-                    conditions = [getattr(model_class, col) == value for col, value in filters.items()]
-                    statement = statement.where(and_(*conditions))
+                    statement = statement.where(and_(*self._build_conditions(model_class, filters)))
 
-                rows = session.exec(statement).all()
+                deleted = session.exec(statement).rowcount  # type: ignore
+                session.commit()
 
-                if rows:
-                    for row in rows:
-                        session.delete(row)
-                    session.commit()
+                if deleted:
                     status_message = f"{model_class.__name__} Deleted Successfully"
                 else:
                     status_message = "Row not found"
@@ -267,16 +409,18 @@ def delete(self, model_class: type[BaseDBModel], filters: dict | None = None) ->
             except exc.IntegrityError as e:
                 session.rollback()
                 status = False
+                deleted = 0
                 status_message = f"Integrity error: The {model_class.__name__} is linked to another entity and cannot be deleted. {e}"
                 # Log the specific integrity error
                 logger.error(status_message)
             except Exception as e:
                 session.rollback()
                 status = False
+                deleted = 0
                 status_message = f"Error while deleting: {e}"
                 logger.error(status_message)
 
-        return Response(message=status_message, status=status, data=None)
+        return Response(message=status_message, status=status, data=deleted)
 
     async def import_team(
         self, team_config: Union[str, Path, dict], user_id: str, check_exists: bool = False
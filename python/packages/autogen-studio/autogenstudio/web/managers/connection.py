@@ -34,6 +34,7 @@
     TeamResult,
 )
 from ...teammanager import TeamManager
+from .persistence import PersistenceQueue
 from .run_context import RunContext
 
 logger = logging.getLogger(__name__)
@@ -42,8 +43,12 @@
 class WebSocketManager:
     """Manages WebSocket connections and message streaming for team task execution"""
 
-    def __init__(self, db_manager: DatabaseManager):
+    def __init__(self, db_manager: DatabaseManager, flush_interval: float = 0.25, max_batch_size: int = 100):
         self.db_manager = db_manager
+        # Database calls run on a worker thread, streamed messages are written in batches.
+        self._persistence = PersistenceQueue(db_manager, flush_interval=flush_interval, max_batch_size=max_batch_size)
+        # Session of each active run, so saving a message does not need to look up the run.
+        self._run_sessions: Dict[int, Optional[int]] = {}
         self._connections: Dict[int, WebSocket] = {}
         self._cancellation_tokens: Dict[int, CancellationToken] = {}
         # Track explicitly closed connections
@@ -98,6 +103,8 @@ async def start_stream(
             try:
                 # Update run with task and status
                 run = await self._get_run(run_id)
+                if run is not None:
+                    self._run_sessions[run_id] = run.session_id
 
                 if run is not None and run.user_id:
                     # get user Settings
@@ -105,7 +112,7 @@ async def start_stream(
                     env_vars = SettingsConfig(**user_settings.config).environment if user_settings else None  # type: ignore
                     run.task = self._convert_images_in_dict(MessageConfig(content=task, source="user").model_dump())
                     run.status = RunStatus.ACTIVE
-                    self.db_manager.upsert(run)
+                    await self._persistence.run(self.db_manager.upsert, run)
 
                 input_func = self.create_input_func(run_id)
 
@@ -165,27 +172,35 @@ async def start_stream(
                 traceback.print_exc()
                 await self._handle_stream_error(run_id, e)
             finally:
+                # Make sure every streamed message is written once the run is over.
+                await self._persistence.flush()
+                self._run_sessions.pop(run_id, None)
                 self._cancellation_tokens.pop(run_id, None)
 
     async def _save_message(
         self, run_id: int, message: Union[BaseAgentEvent | BaseChatMessage, BaseChatMessage]
     ) -> None:
-        """Save a message to the database"""
-
-        run = await self._get_run(run_id)
-        if run:
-            db_message = Message(
-                session_id=run.session_id,
-                run_id=run_id,
-                config=self._convert_images_in_dict(message.model_dump()),
-                user_id=None,  # You might want to pass this from somewhere
-            )
-            self.db_manager.upsert(db_message)
+        """Queue a message to be saved to the database"""
+
+        if run_id not in self._run_sessions:
+            run = await self._get_run(run_id)
+            if not run:
+                return
+            self._run_sessions[run_id] = run.session_id
+        db_message = Message(
+            session_id=self._run_sessions[run_id],
+            run_id=run_id,
+            config=self._convert_images_in_dict(message.model_dump()),
+            user_id=None,  # You might want to pass this from somewhere
+        )
+        self._persistence.put(db_message)
 
     async def _update_run(
         self, run_id: int, status: RunStatus, team_result: Optional[dict] = None, error: Optional[str] = None
     ) -> None:
         """Update run status and result"""
+        # Write pending messages first, a finished run always has its full history.
+        await self._persistence.flush()
         run = await self._get_run(run_id)
         if run:
             run.status = status
@@ -193,7 +208,7 @@ async def _update_run(
                 run.team_result = self._convert_images_in_dict(team_result)
             if error:
                 run.error_message = error
-            self.db_manager.upsert(run)
+            await self._persistence.run(self.db_manager.upsert, run)
 
     def create_input_func(self, run_id: int) -> Callable:
         """Creates an input function for a specific run"""
@@ -283,7 +298,7 @@ def _convert_images_in_dict(self, obj: Any) -> Any:
         elif isinstance(obj, list):
             return [self._convert_images_in_dict(item) for item in obj]
         elif isinstance(obj, AGImage):
-            return {"type": "image", "url": f"data:image/png;base64,{obj.to_base64()}", "alt": "Image"}
+            return {"type": "image", "url": obj.data_uri, "alt": "Image"}
         elif isinstance(obj, (datetime, date, time)):
             return obj.isoformat()
         else:
@@ -405,7 +420,7 @@ async def _get_run(self, run_id: int) -> Optional[Run]:
         Returns:
             Optional[Run]: Run object if found, None otherwise
         """
-        response = self.db_manager.get(Run, filters={"id": run_id}, return_json=False)
+        response = await self._persistence.run(self.db_manager.get, Run, filters={"id": run_id}, return_json=False)
         return response.data[0] if response.status and response.data else None
 
     async def _get_settings(self, user_id: str) -> Optional[Settings]:
@@ -415,7 +430,9 @@ async def _get_settings(self, user_id: str) -> Optional[Settings]:
         Returns:
             Optional[dict]: User settings if found, None otherwise
         """
-        response = self.db_manager.get(filters={"user_id": user_id}, model_class=Settings, return_json=False)
+        response = await self._persistence.run(
+            self.db_manager.get, filters={"user_id": user_id}, model_class=Settings, return_json=False
+        )
         return response.data[0] if response.status and response.data else None
 
     async def _update_run_status(self, run_id: int, status: RunStatus, error: Optional[str] = None) -> None:
@@ -426,11 +443,12 @@ async def _update_run_status(self, run_id: int, status: RunStatus, error: Option
             status: New status to set
             error: Optional error message
         """
+        await self._persistence.flush()
         run = await self._get_run(run_id)
         if run:
             run.status = status
             run.error_message = error
-            self.db_manager.upsert(run)
+            await self._persistence.run(self.db_manager.upsert, run)
 
     async def cleanup(self) -> None:
         """Clean up all active connections and resources when server is shutting down"""
@@ -454,7 +472,7 @@ async def cleanup(self) -> None:
 
                     run.status = RunStatus.STOPPED
                     run.team_result = interrupted_result
-                    self.db_manager.upsert(run)
+                    await self._persistence.run(self.db_manager.upsert, run)
 
             # Then disconnect all websockets with timeout
             # 10 second timeout for entire cleanup
@@ -474,8 +492,13 @@ async def cleanup(self) -> None:
         except Exception as e:
             logger.error(f"Error during WebSocketManager cleanup: {e}")
         finally:
-            # Always clear internal state, even if cleanup had errors
+            # Always write pending messages and clear internal state, even if cleanup had errors
+            try:
+                await self._persistence.close()
+            except Exception as e:
+                logger.error(f"Error flushing pending messages: {e}")
             self._connections.clear()
+            self._run_sessions.clear()
             self._cancellation_tokens.clear()
             self._closed_connections.clear()
             self._input_responses.clear()
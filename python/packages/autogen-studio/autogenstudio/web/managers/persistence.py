@@ -0,0 +1,90 @@
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Set, TypeVar
+
+from ...database import DatabaseManager
+from ...datamodel import BaseDBModel
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PersistenceQueue:
+    """Write-behind persistence for streamed records
+
+    Records passed to :meth:`put` are buffered and inserted in a single transaction
+    per flush, either after ``flush_interval`` seconds or as soon as ``max_batch_size``
+    records are pending. All database work, including calls made through :meth:`run`,
+    happens on one worker thread so the event loop never blocks on I/O and writes are
+    applied in the order they were submitted.
+
+    Args:
+        db_manager: Database manager used for the writes
+        flush_interval: Seconds to wait before writing buffered records
+        max_batch_size: Number of buffered records that triggers an immediate flush
+    """
+
+    def __init__(self, db_manager: DatabaseManager, flush_interval: float = 0.25, max_batch_size: int = 100) -> None:
+        if flush_interval < 0:
+            raise ValueError("flush_interval must be non-negative")
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self._db_manager = db_manager
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autogenstudio-db")
+        self._pending: List[BaseDBModel] = []
+        self._flush_lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task[None]] = None
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking database call on the database thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def put(self, model: BaseDBModel) -> None:
+        """Buffer a new record for insertion"""
+        self._pending.append(model)
+        if len(self._pending) >= self._max_batch_size:
+            self._spawn(self.flush())
+        elif self._timer is None or self._timer.done():
+            self._timer = self._spawn(self._flush_later())
+
+    @property
+    def pending(self) -> int:
+        """Number of records waiting to be written"""
+        return len(self._pending)
+
+    async def flush(self) -> None:
+        """Write all buffered records in one transaction"""
+        async with self._flush_lock:
+            batch, self._pending = self._pending, []
+            if not batch:
+                return
+            response = await self.run(self._db_manager.bulk_insert, batch)
+            if not response.status:
+                logger.error(f"Failed to persist {len(batch)} records: {response.message}")
+
+    async def close(self) -> None:
+        """Flush buffered records and stop the database thread"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        await self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._executor.shutdown(wait=True)
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._flush_interval)
+        await self.flush()
+
+    def _spawn(self, coro: Any) -> "asyncio.Task[None]":
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
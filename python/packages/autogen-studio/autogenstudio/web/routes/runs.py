@@ -1,5 +1,5 @@
 # /api/runs routes
-from typing import Dict
+from typing import Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
@@ -58,8 +58,15 @@ async def get_run(run_id: int, db=Depends(get_db)) -> Dict:
 
 
 @router.get("/{run_id}/messages")
-async def get_run_messages(run_id: int, db=Depends(get_db)) -> Dict:
-    """Get all messages for a run"""
-    messages = db.get(Message, filters={"run_id": run_id}, order="created_at asc", return_json=False)
-
-    return {"status": True, "data": messages.data}
+async def get_run_messages(
+    run_id: int, limit: Optional[int] = None, cursor: Optional[int] = None, db=Depends(get_db)
+) -> Dict:
+    """Get messages for a run, oldest first. All of them unless a page size is given"""
+    if limit is None:
+        messages = db.get(Message, filters={"run_id": run_id}, order="asc", return_json=False)
+        return {"status": True, "data": messages.data}
+
+    page = db.get_page(Message, filters={"run_id": run_id}, limit=limit, cursor=cursor, order="asc")
+    if not page.status:
+        raise HTTPException(status_code=400, detail=page.message)
+    return {"status": True, "data": page.data["items"], "next_cursor": page.data["next_cursor"]}
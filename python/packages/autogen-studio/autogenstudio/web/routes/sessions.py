@@ -1,6 +1,7 @@
 # api/routes/sessions.py
 import re
-from typing import Dict
+from collections import defaultdict
+from typing import Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 from loguru import logger
@@ -12,10 +13,24 @@
 
 
 @router.get("/")
-async def list_sessions(user_id: str, db=Depends(get_db)) -> Dict:
-    """List all sessions for a user"""
-    response = db.get(Session, filters={"user_id": user_id})
-    return {"status": True, "data": response.data}
+async def list_sessions(
+    user_id: str, limit: Optional[int] = None, cursor: Optional[int] = None, db=Depends(get_db)
+) -> Dict:
+    """List sessions for a user, newest first. All of them unless a page size is given"""
+    if limit is None:
+        response = db.get(Session, filters={"user_id": user_id})
+        return {"status": True, "data": response.data}
+
+    page = db.get_page(Session, filters={"user_id": user_id}, limit=limit, cursor=cursor, return_json=True)
+    if not page.status:
+        raise HTTPException(status_code=400, detail=page.message)
+    total = db.count(Session, filters={"user_id": user_id})
+    return {
+        "status": True,
+        "data": page.data["items"],
+        "next_cursor": page.data["next_cursor"],
+        "total": total.data,
+    }
 
 
 @router.get("/{session_id}")
@@ -80,18 +95,22 @@ async def list_session_runs(session_id: int, user_id: str, db=Depends(get_db)) -
         if not runs.status:
             raise HTTPException(status_code=500, detail="Database error while fetching runs")
 
-        # 3. Build response with messages per run
+        # 3. Get the messages of all runs in one query and group them per run
+        messages_by_run: Dict[int, List[Message]] = defaultdict(list)
+        if runs.data:
+            messages = db.get(
+                Message, filters={"run_id": [run.id for run in runs.data]}, order="asc", return_json=False
+            )
+            if not messages.status:
+                logger.error(f"Failed to fetch messages for session {session_id}")
+            for message in messages.data or []:
+                messages_by_run[message.run_id].append(message)
+
+        # 4. Build response with messages per run
         run_data = []
         if runs.data:  # It's ok to have no runs
             for run in runs.data:
                 try:
-                    # Get messages for this specific run
-                    messages = db.get(Message, filters={"run_id": run.id}, order="asc", return_json=False)
-                    if not messages.status:
-                        logger.error(f"Failed to fetch messages for run {run.id}")
-                        # Continue processing other runs even if one fails
-                        messages.data = []
-
                     run_data.append(
                         {
                             "id": str(run.id),
@@ -99,7 +118,7 @@ async def list_session_runs(session_id: int, user_id: str, db=Depends(get_db)) -
                             "status": run.status,
                             "task": run.task,
                             "team_result": run.team_result,
-                            "messages": messages.data or [],
+                            "messages": messages_by_run.get(run.id, []),
                         }
                     )
                 except Exception as e:
@@ -8,6 +8,7 @@
 from autogen_agentchat.teams import RoundRobinGroupChat
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from autogen_agentchat.conditions import TextMentionTermination
+from autogenstudio.web.managers.persistence import PersistenceQueue
 from autogenstudio.datamodel.db import Team, Session as SessionModel, Run, Message, RunStatus, MessageConfig
 
 
@@ -167,6 +168,110 @@ def test_cascade_delete(self, test_db: DatabaseManager, test_user: str):
         # Clean up
         test_db.delete(Team, {"id": team1.id})
 
+    def test_bulk_insert(self, test_db: DatabaseManager, test_user: str):
+        """Test inserting several rows in one transaction"""
+        team = Team(user_id=test_user, component={"name": "Team", "type": "team"})
+        test_db.upsert(team)
+        session = SessionModel(user_id=test_user, team_id=team.id, name="Session")
+        test_db.upsert(session)
+        run = Run(
+            user_id=test_user,
+            session_id=session.id,
+            status=RunStatus.ACTIVE,
+            task=MessageConfig(content="Task", source="user").model_dump(),
+        )
+        test_db.upsert(run)
+
+        messages = [
+            Message(
+                user_id=test_user,
+                session_id=session.id,
+                run_id=run.id,
+                config=MessageConfig(content=f"Message{i}", source="assistant").model_dump(),
+            )
+            for i in range(5)
+        ]
+        response = test_db.bulk_insert(messages)
+        assert response.status is True
+        assert response.data == 5
+        assert all(message.id is not None for message in messages)
+        assert len(test_db.get(Message, {"run_id": run.id}).data) == 5
+
+        assert test_db.bulk_insert([]).data == 0
+
+    def test_persistence_queue(self, test_db: DatabaseManager, test_user: str):
+        """Test that queued messages are written in batches off the event loop"""
+        team = Team(user_id=test_user, component={"name": "Team", "type": "team"})
+        test_db.upsert(team)
+        session = SessionModel(user_id=test_user, team_id=team.id, name="Session")
+        test_db.upsert(session)
+        run = Run(
+            user_id=test_user,
+            session_id=session.id,
+            status=RunStatus.ACTIVE,
+            task=MessageConfig(content="Task", source="user").model_dump(),
+        )
+        test_db.upsert(run)
+
+        def make_message(i: int) -> Message:
+            return Message(
+                user_id=test_user,
+                session_id=session.id,
+                run_id=run.id,
+                config=MessageConfig(content=f"Message{i}", source="assistant").model_dump(),
+            )
+
+        async def main() -> None:
+            queue = PersistenceQueue(test_db, flush_interval=10, max_batch_size=3)
+            for i in range(3):
+                queue.put(make_message(i))
+            # A full batch is flushed right away, the next message waits for the interval.
+            await asyncio.sleep(0.1)
+            queue.put(make_message(3))
+            assert queue.pending == 1
+            result = await queue.run(test_db.get, Message, {"run_id": run.id})
+            assert len(result.data) == 3
+
+            await queue.close()
+            assert queue.pending == 0
+
+        asyncio.run(main())
+        assert len(test_db.get(Message, {"run_id": run.id}).data) == 4
+
+    def test_pagination_count_and_bulk_delete(self, test_db: DatabaseManager, test_user: str):
+        """Test keyset pagination, projection, counts and bulk deletes"""
+        team = Team(user_id=test_user, component={"name": "Team", "type": "team"})
+        test_db.upsert(team)
+        sessions = [SessionModel(user_id=test_user, team_id=team.id, name=f"Session{i}") for i in range(5)]
+        test_db.bulk_insert(sessions)
+
+        assert test_db.count(SessionModel, {"user_id": test_user}).data == 5
+        assert test_db.count(SessionModel, {"user_id": "someone_else"}).data == 0
+
+        # Newest first, in pages of two.
+        names, cursor = [], None
+        while True:
+            page = test_db.get_page(SessionModel, {"user_id": test_user}, limit=2, cursor=cursor)
+            assert page.status is True
+            assert len(page.data["items"]) <= 2
+            names.extend(item.name for item in page.data["items"])
+            cursor = page.data["next_cursor"]
+            if cursor is None:
+                break
+        assert names == [f"Session{i}" for i in reversed(range(5))]
+
+        # Only the requested columns are loaded, the id is always included for the cursor.
+        page = test_db.get_page(SessionModel, {"user_id": test_user}, limit=10, order="asc", columns=["name"])
+        assert page.data["items"][0] == {"name": "Session0", "id": sessions[0].id}
+        assert page.data["next_cursor"] is None
+
+        # List values match any item, and are deleted in a single statement.
+        response = test_db.delete(SessionModel, {"id": [sessions[0].id, sessions[1].id]})
+        assert response.status is True
+        assert response.data == 2
+        assert test_db.count(SessionModel).data == 3
+        assert test_db.delete(SessionModel, {"id": -1}).message == "Row not found"
+
     def test_initialize_database_scenarios(self, tmp_path, monkeypatch):
         """Test different initialize_database parameters"""
         db_path = tmp_path / "test_init.db"